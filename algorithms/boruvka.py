@@ -0,0 +1,186 @@
+import os
+
+import numpy as np
+
+# abaixo disso o custo de subir o pool supera o ganho do paralelismo
+PARALLEL_MIN_EDGES = 200_000
+
+_NO_EDGE = np.iinfo(np.int64).max
+
+# visões dos arrays compartilhados, preenchidas em cada processo do pool
+_shared = {}
+
+
+def boruvka(graph, workers=None, min_parallel_edges=PARALLEL_MIN_EDGES):
+    """
+    Árvore (floresta) geradora mínima pelo algoritmo de Borůvka
+
+    Em cada rodada cada componente escolhe sua aresta de saída mais barata;
+    as escolhas são unidas e as componentes contraídas antes da rodada
+    seguinte. A busca pela aresta mais barata é dividida em blocos de
+    arestas processados em paralelo por um pool de processos, que leem as
+    arestas de memória compartilhada em vez de receber o grafo serializado.
+
+    Empates são desfeitos pela posição da aresta na ordenação estável por
+    peso (a mesma de `kruskal`), então o resultado é determinístico e
+    coincide aresta a aresta com o de `kruskal`.
+
+    Como em kruskal_vectorized, um Graph é convertido para CompactGraph a
+    cada chamada (laço Python O(E)); chamadas repetidas devem receber o
+    CompactGraph.
+
+    Args:
+        graph: Graph ou CompactGraph
+        workers: número de processos (padrão: os.cpu_count())
+        min_parallel_edges: grafos com menos arestas rodam no processo atual
+
+    Returns:
+        tuple: (mst, total_cost), no mesmo formato de `kruskal`
+    """
+    from graph.compact_graph import CompactGraph
+
+    if not hasattr(graph, "columns"):
+        graph = CompactGraph.from_graph(graph)
+
+    names = graph.names
+    u, v, w = graph.columns()
+    n, m = len(names), len(u)
+
+    order = np.argsort(w, kind="stable")
+    rank = np.empty(m, dtype=np.int64) #posicao de cada aresta na ordem (peso, indice)
+    rank[order] = np.arange(m, dtype=np.int64)
+
+    # arestas ativas, com os extremos já rotulados pela componente
+    cu = u.astype(np.int64)
+    cv = v.astype(np.int64)
+    loops = cu == cv
+    if loops.any():
+        cu, cv, rank = cu[~loops], cv[~loops], rank[~loops]
+
+    workers = workers or os.cpu_count() or 1
+    chosen = []
+
+    if workers <= 1 or len(cu) < min_parallel_edges:
+        cheapest = lambda k, components: _cheapest_block(cu[:k], cv[:k], rank[:k], components)
+        _contract_rounds(cu, cv, rank, n, chosen, cheapest)
+    else:
+        _contract_rounds_parallel(cu, cv, rank, n, chosen, workers)
+
+    accepted = order[np.sort(np.asarray(chosen, dtype=np.int64))]
+
+    mst = []
+    total_cost = 0
+
+    for a, b, weight in zip(u[accepted].tolist(), v[accepted].tolist(), w[accepted].tolist()):
+        mst.append((names[a], names[b], weight))
+        total_cost += weight
+
+    return mst, total_cost
+
+
+def _contract_rounds(cu, cv, rank, n, chosen, cheapest):
+    """
+    Rodadas de Borůvka até não sobrarem arestas entre componentes
+
+    `cheapest(k, components)` devolve, para cada componente, o menor rank
+    entre as k primeiras arestas ativas. `cu`, `cv` e `rank` são
+    reescritos no próprio buffer a cada contração.
+    """
+    k = len(cu)
+    components = n
+    position = np.empty(int(rank.max()) + 1 if k else 0, dtype=np.int64) #rank -> indice ativo
+
+    while k:
+
+        best = cheapest(k, components)
+        has_edge = np.flatnonzero(best != _NO_EDGE)
+        chosen.extend(np.unique(best[has_edge]).tolist())
+
+        # cada componente aponta para a do outro lado da sua aresta escolhida;
+        # com a ordem total sobre as arestas, os únicos ciclos são pares mútuos
+        position[rank[:k]] = np.arange(k)
+        picked = position[best[has_edge]]
+        a, b = cu[picked], cv[picked]
+
+        succ = np.arange(components, dtype=np.int64)
+        succ[has_edge] = np.where(a == has_edge, b, a)
+
+        ids = np.arange(components)
+        roots = (succ[succ] == ids) & (ids < succ)
+        succ[roots] = ids[roots]
+
+        while True: #pointer jumping ate cada componente apontar para sua raiz
+            jumped = succ[succ]
+            if np.array_equal(jumped, succ):
+                break
+            succ = jumped
+
+        labels, succ = np.unique(succ, return_inverse=True)
+        components = len(labels)
+
+        # contração: extremos viram componentes e arestas internas saem
+        a = succ[cu[:k]]
+        b = succ[cv[:k]]
+        keep = a != b
+        k = int(keep.sum())
+        cu[:k] = a[keep]
+        cv[:k] = b[keep]
+        rank[:k] = rank[:len(keep)][keep]
+
+
+def _cheapest_block(cu, cv, rank, components):
+    best = np.full(components, _NO_EDGE, dtype=np.int64)
+    np.minimum.at(best, cu, rank)
+    np.minimum.at(best, cv, rank)
+    return best
+
+
+def _contract_rounds_parallel(cu, cv, rank, n, chosen, workers):
+
+    from multiprocessing import Pool
+    from multiprocessing.shared_memory import SharedMemory
+
+    blocks = {}
+    try:
+        for key, column in (("cu", cu), ("cv", cv), ("rank", rank)):
+            shm = SharedMemory(create=True, size=max(column.nbytes, 1))
+            view = np.ndarray(column.shape, dtype=np.int64, buffer=shm.buf)
+            view[:] = column
+            blocks[key] = (shm, view)
+
+        spec = {key: (shm.name, len(view)) for key, (shm, view) in blocks.items()}
+
+        with Pool(workers, initializer=_attach_shared, initargs=(spec,)) as pool:
+
+            def cheapest(k, components):
+                step = -(-k // (workers * 4))
+                tasks = [(start, min(start + step, k), components) for start in range(0, k, step)]
+                return np.minimum.reduce(pool.map(_cheapest_shared, tasks))
+
+            _contract_rounds(blocks["cu"][1], blocks["cv"][1], blocks["rank"][1], n, chosen, cheapest)
+
+    finally:
+        shared = [shm for shm, _ in blocks.values()]
+        blocks.clear() #solta as visões antes de fechar os buffers
+        for shm in shared:
+            shm.close()
+            shm.unlink()
+
+
+def _attach_shared(spec):
+
+    from multiprocessing.shared_memory import SharedMemory
+
+    for key, (name, length) in spec.items():
+        shm = SharedMemory(name=name)
+        _shared[key] = (shm, np.ndarray(length, dtype=np.int64, buffer=shm.buf))
+
+
+def _cheapest_shared(task):
+    start, end, components = task
+    return _cheapest_block(
+        _shared["cu"][1][start:end],
+        _shared["cv"][1][start:end],
+        _shared["rank"][1][start:end],
+        components,
+    )
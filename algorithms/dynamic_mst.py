@@ -0,0 +1,507 @@
+import heapq
+
+from algorithms.kruskal import kruskal
+from algorithms.link_cut_tree import LinkCutTree
+
+# peso mínimo de um bloco do Euler tour (grafos pequenos ficam num bloco só)
+MIN_BLOCK = 16
+
+
+class DynamicMST:
+    """
+    MST (floresta) mantida sob inserções, remoções e mudanças de peso
+
+    A árvore fica numa link-cut tree com as arestas como nós, o que dá o
+    máximo do caminho entre dois vértices em O(log V) amortizado:
+
+    - insert_edge / redução de peso: troca pela aresta mais cara do ciclo
+    - delete_edge / aumento de peso de aresta da árvore: corta a aresta e
+      procura a substituta mais barata através do corte
+
+    A substituta vem de um índice por blocos (à la Frederickson): o Euler
+    tour de cada árvore é cortado em blocos contíguos de peso ~z, com
+    z = (V + E)^(2/3) (cada vértice pesa 1 + grau, cada arco do tour 1), e
+    cada aresta fora da árvore fica num balde (bloco de u, bloco de v) com
+    um heap pelo peso. Cortar uma aresta da árvore parte o tour em dois
+    conjuntos de blocos inteiros, e a substituta é o menor topo entre os
+    baldes que ligam um conjunto ao outro. Com K = O((V + E)^(1/3)) blocos
+    por árvore, a busca olha O(K²) baldes e dividir/juntar blocos move
+    O(z) itens, então toda atualização custa O((V + E)^(2/3) log E)
+    amortizado, sublinear no tamanho do grafo. Quando V + E dobra ou cai
+    pela metade, os blocos são refeitos em O(V + E).
+
+    Arestas são identificadas pelo par de vértices; arestas paralelas do
+    grafo inicial ficam reduzidas à mais barata.
+
+    Args:
+        graph: grafo inicial
+        block_size: peso alvo dos blocos (padrão: (V + E)^(2/3), refeito
+            conforme o grafo cresce ou encolhe)
+    """
+
+    def __init__(self, graph, block_size=None):
+
+        self.names = [] # id -> nome (None nos ids de arestas da link-cut tree)
+        self.index = {} # nome -> id
+        self.neighbors = [] # id -> {vizinho_id: peso}, todas as arestas
+        self.tree_adj = [] # id -> conjunto de vizinhos na árvore
+        self.tree_nodes = {} # (a, b) com a < b -> nó da aresta na link-cut tree
+        self.node_edges = {} # nó da aresta -> (a, b)
+        self.lct = LinkCutTree()
+        self.total_cost = 0
+        self.num_edges = 0
+        self.block_size = block_size
+        self.work = 0 # itens movidos e baldes consultados nas atualizações (medida de custo)
+
+        self.where = {} # elemento do tour (vértice ou arco (x, y)) -> bloco
+        self.bucket_of = {} # aresta fora da árvore -> balde
+        self.stamp = {} # aresta fora da árvore -> carimbo da sua entrada válida no heap
+        self.stamps = 0
+
+        for v in graph.vertices():
+            self._vertex(v)
+
+        for u, v, w in graph.edges:
+            a, b = self._vertex(u), self._vertex(v)
+            if a != b and (b not in self.neighbors[a] or w < self.neighbors[a][b]):
+                if b not in self.neighbors[a]:
+                    self.num_edges += 1
+                self.neighbors[a][b] = w
+                self.neighbors[b][a] = w
+
+        # a MST inicial sai do Kruskal; a partir daí só há atualizações locais
+        mst, _ = kruskal(graph)
+        for u, v, _ in mst:
+            a, b = self.index[u], self.index[v]
+            self._join(a, b, self.neighbors[a][b])
+
+        self._rebuild()
+
+    def insert_edge(self, u, v, weight):
+        """Adiciona a aresta u-v (ou atualiza seu peso, se já existir)"""
+        a, b = self._vertex(u), self._vertex(v)
+
+        if b in self.neighbors[a]:
+            self.update_weight(u, v, weight)
+            return
+
+        if a == b: #laços nunca entram na árvore
+            return
+
+        self._add_adjacent(a, b, weight)
+        self._offer(a, b, weight)
+        self._check_size()
+
+    def delete_edge(self, u, v):
+        """Remove a aresta u-v; se era da árvore, procura a substituta"""
+        a, b = self.index[u], self.index[v]
+        self._remove_adjacent(a, b)
+        key = self._key(a, b)
+
+        if key in self.tree_nodes:
+            self._cut(a, b)
+            self._reconnect(a, b)
+        else:
+            self._unbucket(key)
+
+        self._check_size()
+
+    def update_weight(self, u, v, weight):
+        """Muda o peso da aresta u-v mantendo a MST"""
+        a, b = self.index[u], self.index[v]
+        old = self.neighbors[a][b]
+        self.neighbors[a][b] = weight
+        self.neighbors[b][a] = weight
+
+        key = self._key(a, b)
+
+        if key in self.tree_nodes:
+
+            if weight <= old: #aresta da árvore ficou mais barata: continua na árvore
+                self.lct.set_value(self.tree_nodes[key], weight)
+                self.total_cost += weight - old
+                return
+
+            # ficou mais cara: a própria aresta concorre com as outras do corte
+            self.total_cost -= old
+            self._cut(a, b, charge=False)
+            self._reconnect(a, b)
+            return
+
+        self._unbucket(key)
+        if weight < old:
+            self._offer(a, b, weight)
+        else:
+            self._bucket(key, weight)
+
+    def mst(self):
+        """Arestas atuais da árvore como (u, v, peso)"""
+        names, neighbors = self.names, self.neighbors
+        return [(names[a], names[b], neighbors[a][b]) for a, b in self.tree_nodes]
+
+    def _vertex(self, name):
+        i = self.index.get(name)
+        if i is None:
+            i = self.lct.add_node()
+            while len(self.names) <= i: #ids vêm da link-cut tree, que também numera as arestas
+                self.names.append(None)
+                self.neighbors.append(None)
+                self.tree_adj.append(None)
+            self.index[name] = i
+            self.names[i] = name
+            self.neighbors[i] = {}
+            self.tree_adj[i] = set()
+            block = _Block([i], 1, [])
+            block.tour.append(block)
+            self.where[i] = block
+        return i
+
+    def _key(self, a, b):
+        return (a, b) if a < b else (b, a)
+
+    def _add_adjacent(self, a, b, weight):
+        self.neighbors[a][b] = weight
+        self.neighbors[b][a] = weight
+        self.num_edges += 1
+        for x in (a, b): #o vértice pesa 1 + grau no seu bloco
+            block = self.where[x]
+            block.weight += 1
+            self._shrink(block)
+
+    def _remove_adjacent(self, a, b):
+        del self.neighbors[a][b]
+        del self.neighbors[b][a]
+        self.num_edges -= 1
+        self.where[a].weight -= 1
+        self.where[b].weight -= 1
+
+    def _offer(self, a, b, weight):
+        """Tenta colocar a aresta a-b na árvore pela propriedade do ciclo"""
+        lct = self.lct
+
+        if not lct.connected(a, b):
+            self._link(a, b, weight)
+            return
+
+        heaviest = lct.path_max(a, b)
+        if lct.value[heaviest] > weight:
+            x, y = self.node_edges[heaviest]
+            self._cut(x, y)
+            self._link(a, b, weight)
+        else:
+            self._bucket(self._key(a, b), weight)
+
+    def _join(self, a, b, weight):
+        """Liga a aresta na link-cut tree (sem mexer no Euler tour)"""
+        lct = self.lct
+        node = lct.add_node(weight)
+        lct.link(a, node)
+        lct.link(node, b)
+        key = self._key(a, b)
+        self.tree_nodes[key] = node
+        self.node_edges[node] = key
+        self.tree_adj[a].add(b)
+        self.tree_adj[b].add(a)
+        self.total_cost += weight
+
+    def _link(self, a, b, weight):
+        self._unbucket(self._key(a, b))
+        self._join(a, b, weight)
+        self._tour_link(a, b)
+
+    def _cut(self, a, b, charge=True):
+        """Corta a aresta da árvore; se ela continua no grafo, vai para os baldes"""
+        lct = self.lct
+        key = self._key(a, b)
+        node = self.tree_nodes.pop(key)
+        del self.node_edges[node]
+        if charge:
+            self.total_cost -= lct.value[node]
+        lct.cut(a, node)
+        lct.cut(node, b)
+        lct.remove_node(node)
+
+        self._tour_cut(a, b) #antes de tirar de tree_adj: os blocos movidos não a tratam como aresta de fora
+        self.tree_adj[a].discard(b)
+        self.tree_adj[b].discard(a)
+
+        if b in self.neighbors[a]:
+            self._bucket(key, self.neighbors[a][b])
+
+    def _reconnect(self, a, b):
+        """
+        Liga de novo os lados de a e b com a aresta mais barata do corte
+
+        Os dois lados são conjuntos de blocos inteiros; só os baldes entre
+        um bloco de cada lado têm arestas que cruzam o corte.
+        """
+        side_a, side_b = self.where[a].tour, self.where[b].tour
+        small, large = (side_a, side_b) if len(side_a) <= len(side_b) else (side_b, side_a)
+        other = set(large)
+
+        best = None
+        for block in small:
+            self.work += len(block.cross)
+            for target, bucket in block.cross.items():
+                if target in other:
+                    top = self._top(bucket)
+                    if best is None or top[0] < best[0]:
+                        best = top
+
+        if best is not None:
+            weight, _, (x, y) = best
+            self._link(x, y, weight)
+
+    # baldes das arestas fora da árvore
+
+    def _bucket(self, key, weight):
+        self._unbucket(key) #uma entrada válida por aresta
+        a, b = key
+        x, y = self.where[a], self.where[b]
+        bucket = x.cross.get(y)
+        if bucket is None:
+            bucket = _Bucket(x, y)
+            x.cross[y] = bucket
+            y.cross[x] = bucket
+
+        self.stamps += 1
+        heapq.heappush(bucket.heap, (weight, self.stamps, key))
+        bucket.count += 1
+        self.bucket_of[key] = bucket
+        self.stamp[key] = self.stamps
+
+    def _unbucket(self, key):
+        bucket = self.bucket_of.pop(key, None)
+        if bucket is None:
+            return
+        del self.stamp[key]
+        bucket.count -= 1
+
+        if not bucket.count:
+            x, y = bucket.ends
+            del x.cross[y]
+            if x is not y:
+                del y.cross[x]
+        elif len(bucket.heap) > 2 * bucket.count + MIN_BLOCK: #entradas vencidas demais: refaz o heap
+            stamp = self.stamp
+            bucket.heap = [entry for entry in bucket.heap if stamp.get(entry[2]) == entry[1]]
+            heapq.heapify(bucket.heap)
+
+    def _top(self, bucket):
+        """Entrada válida mais barata do balde (descarta as vencidas do topo)"""
+        heap, stamp = bucket.heap, self.stamp
+        while stamp.get(heap[0][2]) != heap[0][1]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    # Euler tour em blocos
+
+    def _rebuild(self):
+        """Refaz os blocos e os baldes do zero, em O(V + E)"""
+        size = len(self.index) + self.num_edges
+        self.built = size
+        self.z = self.block_size or max(MIN_BLOCK, int(size ** (2 / 3)))
+        self.where, self.bucket_of, self.stamp = {}, {}, {}
+
+        neighbors, tree_adj = self.neighbors, self.tree_adj
+        seen = [False] * len(self.names)
+
+        for root in self.index.values():
+            if seen[root]:
+                continue
+            seen[root] = True
+
+            tour = []
+            block = _Block([], 0, tour)
+            tour.append(block)
+
+            def place(element, weight):
+                nonlocal block
+                if block.items and block.weight + weight > self.z:
+                    block = _Block([], 0, tour)
+                    tour.append(block)
+                block.items.append(element)
+                block.weight += weight
+                self.where[element] = block
+
+            # DFS iterativa: vértice, (arco para o filho, subárvore, arco de volta)*
+            place(root, 1 + len(neighbors[root]))
+            stack = [(root, iter(tree_adj[root]))]
+            while stack:
+                x, children = stack[-1]
+                for y in children:
+                    if not seen[y]:
+                        seen[y] = True
+                        place((x, y), 1)
+                        place(y, 1 + len(neighbors[y]))
+                        stack.append((y, iter(tree_adj[y])))
+                        break
+                else:
+                    stack.pop()
+                    if stack:
+                        place((x, stack[-1][0]), 1)
+
+        for a in self.index.values():
+            for b, w in neighbors[a].items():
+                if a < b and b not in tree_adj[a]:
+                    self._bucket((a, b), w)
+
+    def _check_size(self):
+        """Refaz os blocos quando V + E dobra ou cai pela metade"""
+        if self.block_size:
+            return
+        size = len(self.index) + self.num_edges
+        if size > 2 * self.built or 2 * size < self.built:
+            self._rebuild()
+
+    def _tour_link(self, a, b):
+        """Euler tour da árvore nova: tour(a) + arco a-b + tour(b) + arco b-a"""
+        tour = self._reroot(a)
+        other = self._reroot(b)
+
+        forward = _Block([(a, b)], 1, tour)
+        back = _Block([(b, a)], 1, tour)
+        self.where[(a, b)] = forward
+        self.where[(b, a)] = back
+
+        for block in other:
+            block.tour = tour
+        tour.append(forward)
+        tour.extend(other)
+        tour.append(back)
+        self._tidy(tour)
+
+    def _tour_cut(self, a, b):
+        """Tira os arcos a-b e b-a: o trecho entre eles é o tour de um dos lados"""
+        forward, back = (a, b), (b, a)
+        for arc in (forward, back): #cada arco fica sozinho num bloco
+            self._split_before(arc)
+            self._split_after(arc)
+
+        first, second = self.where.pop(forward), self.where.pop(back)
+        tour = first.tour
+        i, j = sorted((tour.index(first), tour.index(second)))
+
+        inner = tour[i + 1:j]
+        tour[:] = tour[j + 1:] + tour[:i]
+        for block in inner:
+            block.tour = inner
+
+        self._tidy(tour)
+        self._tidy(inner)
+
+    def _reroot(self, x):
+        """Gira o tour da árvore de x para começar em x; devolve o tour"""
+        block = self._split_before(x)
+        tour = block.tour
+        k = tour.index(block)
+        tour[:] = tour[k:] + tour[:k]
+        return tour
+
+    def _split_before(self, element):
+        """Divide o bloco para o elemento ser o primeiro do seu bloco"""
+        block = self.where[element]
+        i = block.items.index(element)
+        if i:
+            self._split(block, i)
+        return self.where[element]
+
+    def _split_after(self, element):
+        block = self.where[element]
+        i = block.items.index(element) + 1
+        if i < len(block.items):
+            self._split(block, i)
+
+    def _split(self, block, i):
+        """Divide o bloco em items[:i] e items[i:]; a parte mais leve vai para um bloco novo"""
+        left, right = block.items[:i], block.items[i:]
+        left_weight = sum(map(self._weight, left))
+        right_weight = block.weight - left_weight
+
+        tour = block.tour
+        k = tour.index(block)
+        if left_weight <= right_weight:
+            new = _Block(left, left_weight, tour)
+            block.items, block.weight = right, right_weight
+            tour.insert(k, new)
+        else:
+            new = _Block(right, right_weight, tour)
+            block.items, block.weight = left, left_weight
+            tour.insert(k + 1, new)
+
+        self._move(new.items, new)
+        return new
+
+    def _shrink(self, block):
+        """Divide blocos que passaram de 2z (um vértice de grau alto pode ficar sozinho)"""
+        stack = [block]
+        while stack:
+            block = stack.pop()
+            if block.weight <= 2 * self.z or len(block.items) < 2:
+                continue
+            half, i = 0, 0
+            while half < block.weight / 2:
+                half += self._weight(block.items[i])
+                i += 1
+            i = min(max(i, 1), len(block.items) - 1)
+            stack.extend((block, self._split(block, i)))
+
+    def _tidy(self, tour):
+        """Junta blocos vizinhos que somados não passam de z"""
+        i = 0
+        while i < len(tour) - 1:
+            left, right = tour[i], tour[i + 1]
+            if left.weight + right.weight > self.z:
+                i += 1
+            elif left.weight >= right.weight:
+                left.items.extend(right.items)
+                left.weight += right.weight
+                self._move(right.items, left)
+                del tour[i + 1]
+            else:
+                right.items[:0] = left.items
+                right.weight += left.weight
+                self._move(left.items, right)
+                del tour[i]
+
+    def _move(self, elements, block):
+        """Passa elementos para o bloco e troca de balde as arestas de fora dos vértices movidos"""
+        where, neighbors, tree_adj = self.where, self.neighbors, self.tree_adj
+
+        for element in elements:
+            where[element] = block
+        self.work += len(elements)
+
+        for x in elements:
+            if isinstance(x, tuple): #arcos não têm arestas
+                continue
+            for y, w in neighbors[x].items():
+                if y not in tree_adj[x]:
+                    self._bucket(self._key(x, y), w)
+                    self.work += 1
+
+    def _weight(self, element):
+        return 1 if isinstance(element, tuple) else 1 + len(self.neighbors[element])
+
+
+class _Block:
+    """Trecho contíguo de um Euler tour"""
+
+    __slots__ = ("items", "weight", "tour", "cross")
+
+    def __init__(self, items, weight, tour):
+        self.items = items # vértices (id) e arcos (x, y), na ordem do tour
+        self.weight = weight
+        self.tour = tour # lista de blocos da árvore
+        self.cross = {} # outro bloco -> balde das arestas de fora entre os dois
+
+
+class _Bucket:
+    """Arestas fora da árvore entre dois blocos, num heap pelo peso"""
+
+    __slots__ = ("ends", "heap", "count")
+
+    def __init__(self, x, y):
+        self.ends = (x, y)
+        self.heap = [] # (peso, carimbo, aresta); entradas com carimbo vencido são descartadas
+        self.count = 0 # entradas válidas
@@ -0,0 +1,123 @@
+import numpy as np
+
+from graph.compact_graph import CompactGraph
+
+# sem scipy, até esse número de pontos ainda dá para usar o grafo completo
+COMPLETE_GRAPH_MAX_POINTS = 2000
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def candidate_graph(points, geographic=False):
+    """
+    Grafo esparso de candidatas que contém a MST euclidiana
+
+    Usa a triangulação de Delaunay (scipy.spatial), que tem O(n) arestas e
+    sempre contém a MST euclidiana, em vez das n² arestas do grafo completo.
+
+    Args:
+        points: dict {nome: (x, y)} ou lista de (nome, x, y)
+        geographic: se True, as coordenadas são (lat, lon) em graus e são
+            projetadas (equiretangular) para km antes de medir distâncias
+
+    Returns:
+        CompactGraph: arestas com peso igual à distância entre os pontos;
+        o atributo `positions` guarda {nome: (x, y)} no plano usado
+    """
+    names, xy = _as_array(points)
+
+    if geographic:
+        xy = _project(xy)
+
+    u, v = _candidate_pairs(xy)
+    weight = np.hypot(*(xy[u] - xy[v]).T)
+
+    graph = CompactGraph.from_columns(names, u.astype(np.int32), v.astype(np.int32), weight)
+    graph.positions = {name: (x, y) for name, (x, y) in zip(names, xy.tolist())}
+
+    return graph
+
+
+def euclidean_mst(points, geographic=False):
+    """
+    MST euclidiana de um conjunto de pontos em O(n log n)
+
+    Monta o grafo de candidatas de Delaunay e roda Kruskal sobre ele.
+
+    Returns:
+        tuple: (mst, total_cost), com os pesos em unidades do plano
+        (km quando geographic=True)
+    """
+    from algorithms.kruskal import kruskal_vectorized
+
+    return kruskal_vectorized(candidate_graph(points, geographic))
+
+
+def _as_array(points):
+
+    if isinstance(points, dict):
+        names = list(points)
+        coords = list(points.values())
+    else:
+        names = [row[0] for row in points]
+        coords = [row[1:3] for row in points]
+
+    xy = np.asarray(coords, dtype=np.float64).reshape(len(names), 2)
+
+    if len(set(names)) != len(names):
+        raise ValueError("nomes de pontos repetidos")
+
+    return names, xy
+
+
+def _project(latlon):
+    """Projeção equiretangular em torno da latitude média (boa em escala urbana)"""
+    lat = np.radians(latlon[:, 0])
+    lon = np.radians(latlon[:, 1])
+    x = EARTH_RADIUS_KM * lon * np.cos(lat.mean())
+    y = EARTH_RADIUS_KM * lat
+    return np.column_stack((x, y))
+
+
+def _candidate_pairs(xy):
+    """Pares (u, v) de índices, com u < v, que contêm a MST euclidiana"""
+    n = len(xy)
+
+    if n < 2:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    try:
+        from scipy.spatial import Delaunay
+    except ImportError:
+        if n > COMPLETE_GRAPH_MAX_POINTS:
+            raise ImportError(
+                "scipy é necessário para a MST euclidiana com mais de "
+                f"{COMPLETE_GRAPH_MAX_POINTS} pontos (pip install scipy)"
+            )
+        return np.triu_indices(n, k=1)
+
+    try:
+        from scipy.spatial import QhullError
+    except ImportError: #scipy < 1.8 só exporta pelo módulo qhull
+        from scipy.spatial.qhull import QhullError
+
+    if n == 2:
+        return np.array([0]), np.array([1])
+
+    try:
+        tri = Delaunay(xy)
+    except QhullError: #pontos colineares (ou todos iguais)
+        order = np.lexsort((xy[:, 1], xy[:, 0]))
+        return order[:-1], order[1:]
+
+    simplices = tri.simplices
+    pairs = np.concatenate((simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [0, 2]]))
+
+    # pontos duplicados ficam fora da triangulação: ligados ao vértice igual com custo 0
+    if len(tri.coplanar):
+        pairs = np.concatenate((pairs, tri.coplanar[:, [0, 2]]))
+
+    pairs.sort(axis=1)
+    pairs = np.unique(pairs, axis=0)
+
+    return pairs[:, 0], pairs[:, 1]
@@ -0,0 +1,80 @@
+from collections import Counter, namedtuple
+
+# Tipos de evento emitidos por prim(..., sink=) e kruskal(..., sink=)
+HEAP_PUSH = "heap_push" # (vertice, pai, peso) entrou no heap
+HEAP_POP = "heap_pop" # (vertice, pai, peso) saiu do heap
+STALE_SKIP = "stale_skip" # entrada retirada do heap com o vértice já visitado
+VERTEX_VISITED = "vertex_visited" # (vertice, pai, peso) entrou na árvore
+EDGE_CONSIDERED = "edge_considered" # (u, v, peso) avaliada
+EDGE_ACCEPTED = "edge_accepted" # (u, v, peso) entrou na MST
+EDGE_REJECTED = "edge_rejected" # (u, v, peso) formaria ciclo
+FIND = "find" # find de u no Union-Find; `value` = elos percorridos até a raiz
+
+
+class StepEvent(namedtuple("StepEvent", "kind u v weight value")):
+    """
+    Passo de um algoritmo de MST
+
+    Em eventos de heap e de vértice, `u` é o vértice e `v` o pai pelo qual
+    ele foi alcançado (None na raiz). Em eventos de aresta, (u, v, weight)
+    é a aresta. `value` só é usado por FIND.
+    """
+    __slots__ = ()
+
+    def __new__(cls, kind, u, v=None, weight=None, value=None):
+        return super().__new__(cls, kind, u, v, weight, value)
+
+
+class EventRecorder(list):
+    """Sink que guarda todos os eventos, em ordem"""
+
+    def __call__(self, event):
+        self.append(event)
+
+
+class StepCounters:
+    """
+    Sink que só acumula contadores
+
+    - counts: número de eventos por tipo
+    - stale_pop_ratio: fração das retiradas do heap que eram obsoletas
+    - find_hops / max_find_hops: elos percorridos nos finds do Union-Find
+    - edges_scanned: arestas avaliadas até a última aceita (árvore completa)
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.find_hops = 0
+        self.max_find_hops = 0
+        self.edges_scanned = 0
+
+    def __call__(self, event):
+
+        kind = event.kind
+        self.counts[kind] += 1
+
+        if kind == FIND:
+            self.find_hops += event.value
+            self.max_find_hops = max(self.max_find_hops, event.value)
+        elif kind == EDGE_ACCEPTED:
+            self.edges_scanned = self.counts[EDGE_CONSIDERED]
+
+    @property
+    def stale_pop_ratio(self):
+        pops = self.counts[HEAP_POP]
+        return self.counts[STALE_SKIP] / pops if pops else 0.0
+
+    @property
+    def mean_find_hops(self):
+        finds = self.counts[FIND]
+        return self.find_hops / finds if finds else 0.0
+
+    def summary(self):
+        """Contadores em um dicionário simples (para relatórios e JSON)"""
+        return {
+            "counts": dict(self.counts),
+            "stale_pop_ratio": self.stale_pop_ratio,
+            "mean_find_hops": self.mean_find_hops,
+            "max_find_hops": self.max_find_hops,
+            "edges_scanned": self.edges_scanned,
+        }
@@ -0,0 +1,92 @@
+class IndexedMinHeap:
+    """
+    Fila de prioridade indexada (heap binário) com decrease-key
+
+    Cada item aparece no máximo uma vez; um dicionário guarda sua posição
+    no heap para que a prioridade possa ser reduzida em O(log n) sem
+    inserir entradas repetidas. Empates são resolvidos pela ordem de
+    inserção.
+    """
+
+    def __init__(self):
+
+        self.heap = [] # [(prioridade, ordem, item)]
+        self.position = {} # item -> indice no heap
+        self._counter = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return item in self.position
+
+    def priority(self, item):
+        return self.heap[self.position[item]][0]
+
+    def push(self, item, priority):
+
+        if item in self.position:
+            raise KeyError(f"{item!r} já está no heap")
+
+        self.heap.append((priority, self._counter, item))
+        self._counter += 1
+        self.position[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, priority):
+
+        i = self.position[item]
+        _, order, _ = self.heap[i]
+        self.heap[i] = (priority, order, item)
+        self._sift_up(i)
+
+    def pop(self):
+        """Remove e devolve (item, prioridade) de menor prioridade"""
+        heap = self.heap
+        priority, _, item = heap[0]
+        last = heap.pop()
+        del self.position[item]
+
+        if heap:
+            heap[0] = last
+            self.position[last[2]] = 0
+            self._sift_down(0)
+
+        return item, priority
+
+    def _sift_up(self, i):
+
+        heap, position = self.heap, self.position
+        entry = heap[i]
+
+        while i > 0:
+            parent = (i - 1) >> 1
+            if heap[parent][:2] <= entry[:2]:
+                break
+            heap[i] = heap[parent]
+            position[heap[i][2]] = i
+            i = parent
+
+        heap[i] = entry
+        position[entry[2]] = i
+
+    def _sift_down(self, i):
+
+        heap, position = self.heap, self.position
+        n = len(heap)
+        entry = heap[i]
+
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1][:2] < heap[child][:2]:
+                child += 1
+            if entry[:2] <= heap[child][:2]:
+                break
+            heap[i] = heap[child]
+            position[heap[i][2]] = i
+            i = child
+
+        heap[i] = entry
+        position[entry[2]] = i
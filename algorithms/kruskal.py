@@ -1,12 +1,29 @@
 from algorithms.union_find import UnionFind #verificar se vertices já estao conectados
 
-def kruskal(graph):
+def kruskal(graph, sink=None, hierarchy=False):
+    """
+    Árvore (floresta) geradora mínima pelo algoritmo de Kruskal
 
+    Args:
+        graph: Graph ou CompactGraph
+        sink: função chamada com cada StepEvent (algorithms.events):
+            aresta avaliada, finds no Union-Find, aresta aceita ou rejeitada.
+            Sem sink nenhum evento é criado.
+        hierarchy: devolve também a hierarquia das uniões
+            (algorithms.kruskal_tree.KruskalTree)
+
+    Returns:
+        tuple: (mst, total_cost), ou (mst, total_cost, arvore_de_reconstrucao)
+    """
     mst = []
     total_cost = 0
 
     uf = UnionFind(graph.vertices()) #retornar todos os vértices do grafo
     edges = sorted(graph.edges, key = lambda x : x[2]) #ordenacao das arestas por peso
+    target = len(uf.items) - 1 #uma arvore geradora tem V-1 arestas
+
+    if sink is not None:
+        from algorithms.events import StepEvent, EDGE_CONSIDERED, EDGE_ACCEPTED, EDGE_REJECTED, FIND
 
     for u, v , w in edges:
 
@@ -14,8 +31,129 @@ def kruskal(graph):
         #se estiverem no mesmo conjunto, criaria ciclos
         #se nao estiveres podemos adicionar na lista e considerar sua aresta
 
+        if sink is not None:
+            sink(StepEvent(EDGE_CONSIDERED, u, v, w))
+            sink(StepEvent(FIND, u, value=uf.path_length(u)))
+            sink(StepEvent(FIND, v, value=uf.path_length(v)))
+
         if uf.union(u, v): 
             mst.append((u,v,w))
             total_cost += w
-    
-    return mst, total_cost
\ No newline at end of file
+
+            if sink is not None:
+                sink(StepEvent(EDGE_ACCEPTED, u, v, w))
+
+            if len(mst) == target: #arvore completa, o resto formaria ciclos
+                break
+
+        elif sink is not None:
+            sink(StepEvent(EDGE_REJECTED, u, v, w))
+
+    if hierarchy: #as arestas aceitas, na ordem, são as uniões do dendrograma
+        from algorithms.kruskal_tree import KruskalTree
+        return mst, total_cost, KruskalTree(mst, uf.items)
+
+    return mst, total_cost
+
+
+def kruskal_vectorized(graph, batch_size=None):
+    """
+    Kruskal sobre colunas NumPy (u, v, peso)
+
+    As arestas são ordenadas com um único argsort estável (mesmo desempate
+    de `kruskal`) e processadas em lotes: um find vetorizado descarta de uma
+    vez as arestas cujos extremos já estão na mesma componente, e só as
+    restantes passam pelo laço em Python. Quando a floresta atinge V-1
+    arestas os lotes seguintes nem são lidos.
+
+    Um Graph é convertido para CompactGraph a cada chamada, num laço
+    Python por aresta que custa mais que o próprio algoritmo; para
+    chamadas repetidas passe um CompactGraph (analysis.compare e o
+    benchmark já convertem uma única vez).
+
+    Args:
+        graph: Graph ou CompactGraph
+        batch_size: arestas por lote (padrão: max(V // 4, 4096))
+
+    Returns:
+        tuple: (mst, total_cost), no mesmo formato de `kruskal`
+    """
+    import numpy as np
+    from graph.compact_graph import CompactGraph
+
+    if not hasattr(graph, "columns"):
+        graph = CompactGraph.from_graph(graph)
+
+    names = graph.names
+    u, v, w = graph.columns()
+    n = len(names)
+
+    order = np.argsort(w, kind="stable") #ordenacao das arestas por peso
+    parent = np.arange(n, dtype=np.int64)
+    batch_size = batch_size or max(n // 4, 4096)
+
+    accepted = []
+    target = n - 1
+
+    for start in range(0, len(order), batch_size):
+
+        if len(accepted) >= target: #arvore completa, o resto seria rejeitado
+            break
+
+        idx = order[start:start + batch_size]
+        ru = _find_roots(parent, u[idx])
+        rv = _find_roots(parent, v[idx])
+
+        #arestas com extremos na mesma componente criariam ciclos
+        keep = ru != rv
+        links = {}
+
+        for e, a, b in zip(idx[keep].tolist(), ru[keep].tolist(), rv[keep].tolist()):
+
+            if a in links: #raiz já ligada neste lote
+                a = _find_link(links, a)
+            if b in links:
+                b = _find_link(links, b)
+
+            if a != b:
+                links[b] = a
+                accepted.append(e)
+                if len(accepted) >= target:
+                    break
+
+        if links:
+            roots = list(links)
+            parent[roots] = [_find_link(links, r) for r in roots]
+
+    mst = []
+    total_cost = 0
+
+    accepted = np.asarray(accepted, dtype=np.int64)
+    for a, b, weight in zip(u[accepted].tolist(), v[accepted].tolist(), w[accepted].tolist()):
+        mst.append((names[a], names[b], weight))
+        total_cost += weight
+
+    return mst, total_cost
+
+
+def _find_roots(parent, items):
+    """Find vetorizado com compressão dos itens consultados"""
+    roots = parent[items]
+    while True:
+        up = parent[roots]
+        if (up == roots).all():
+            break
+        roots = up
+    parent[items] = roots
+    return roots
+
+
+def _find_link(links, x): #representante dentro do lote atual
+
+    while x in links:
+        nxt = links[x]
+        if nxt in links:
+            links[x] = links[nxt] #path halving
+        x = nxt
+
+    return x
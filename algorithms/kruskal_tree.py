@@ -0,0 +1,258 @@
+import numpy as np
+
+
+class KruskalTree:
+    """
+    Árvore de reconstrução de Kruskal (dendrograma de ligação simples)
+
+    Cada vértice é uma folha (ids 0..n-1, na ordem de `vertices`) e cada
+    aresta aceita pelo Kruskal vira um nó interno (id n + i para a i-ésima
+    união) cujos filhos são os dois grupos que ela juntou e cuja altura é o
+    peso da aresta. As alturas só crescem subindo na árvore, então:
+
+    - threshold(u, v): menor orçamento X em que u e v ficam conectados
+      usando só ligações de custo <= X (altura do LCA), em O(log V)
+    - connected(u, v, X) / cluster(u, X): grupo de u com orçamento X, subindo
+      enquanto a altura for <= X, em O(log V)
+    - clusters(X) e cut(k): todos os grupos de uma vez, em O(V)
+
+    A numeração dos nós é a mesma das matrizes de ligação do scipy
+    (linkage()), então o dendrograma pode ser desenhado com
+    scipy.cluster.hierarchy.dendrogram.
+
+    Args:
+        merges: arestas (u, v, peso) da MST (floresta), em ordem não
+            decrescente de peso, como o Kruskal as aceita
+        vertices: todos os vértices (padrão: os que aparecem nas arestas);
+            vértices isolados viram folhas sem pai
+    """
+
+    def __init__(self, merges, vertices=None):
+        from algorithms.union_find import UnionFind
+
+        merges = list(merges)
+        if vertices is None:
+            vertices = dict.fromkeys(x for u, v, _ in merges for x in (u, v))
+
+        self.names = list(vertices)
+        self.index = {v: i for i, v in enumerate(self.names)}
+        n = len(self.names)
+        total = n + len(merges)
+
+        parent = list(range(total))
+        left = [-1] * total
+        right = [-1] * total
+        size = [1] * n + [0] * len(merges)
+        height = [float("-inf")] * n + [w for _, _, w in merges]
+
+        uf = UnionFind(n)
+        node = list(range(n)) #nó da árvore que representa cada conjunto do union-find
+        index = self.index
+
+        for k, (u, v, _) in enumerate(merges, n):
+            a, b = uf.find(index[u]), uf.find(index[v])
+            if not uf.union(a, b):
+                raise ValueError(f"as arestas formam um ciclo em {u} - {v}")
+            x, y = node[a], node[b]
+            parent[x] = parent[y] = k
+            left[k], right[k] = x, y
+            size[k] = size[x] + size[y]
+            node[uf.find(a)] = k
+
+        self.n = n
+        self.parent = np.array(parent, dtype=np.int64)
+        self.left = np.array(left, dtype=np.int64)
+        self.right = np.array(right, dtype=np.int64)
+        self.size = np.array(size, dtype=np.int64)
+        self.height = np.array(height, dtype=np.float64)
+        self.integer = all(isinstance(w, int) for _, _, w in merges)
+
+        if len(merges) and (np.diff(self.height[n:]) < 0).any():
+            raise ValueError("as arestas precisam estar em ordem não decrescente de peso")
+
+        # profundidade de cada nó: os pais têm id maior, então de cima para baixo é id decrescente
+        depth = [0] * total
+        for x in reversed(range(total)):
+            if parent[x] != x:
+                depth[x] = depth[parent[x]] + 1
+        self.depth = np.array(depth, dtype=np.int64)
+
+        # up[k][x] = ancestral 2^k acima de x (as raízes apontam para si mesmas)
+        levels = max(1, int(self.depth.max()).bit_length()) if total else 1
+        up = [self.parent]
+        for _ in range(1, levels):
+            up.append(up[-1][up[-1]])
+        self.up = np.array(up)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Roda o Kruskal e devolve a hierarquia das uniões"""
+        from algorithms.kruskal import kruskal
+
+        return kruskal(graph, hierarchy=True)[2]
+
+    @property
+    def num_components(self):
+        return int(np.count_nonzero(self.parent == np.arange(len(self.parent))))
+
+    def threshold(self, u, v):
+        """Custo a partir do qual u e v ficam conectados (None sem caminho ou com u == v)"""
+        value = self.threshold_many_ids(self.ids([u, v]))[0]
+        if not np.isfinite(value):
+            return None
+        return int(value) if self.integer else float(value)
+
+    def connected(self, u, v, budget):
+        """u e v ficam conectados usando só ligações de custo <= budget"""
+        roots = self._climb(self.ids([u, v]), budget)
+        return bool(roots[0] == roots[1])
+
+    def cluster(self, u, budget):
+        """Vértices do grupo de u usando só ligações de custo <= budget"""
+        root = int(self._climb(self.ids([u]), budget)[0])
+        return [self.names[x] for x in self._leaves(root)]
+
+    def threshold_many(self, pairs):
+        """
+        Limiar de conexão de cada par de vértices (lista de pares de nomes)
+
+        +inf quando os vértices nunca se conectam e -inf com u == v, então
+        `threshold_many(pares) <= X` diz quais pares estão conectados com
+        orçamento X.
+        """
+        return self.threshold_many_ids(self.pair_ids(pairs))
+
+    def connected_many(self, pairs, budget):
+        """Quais pares de vértices ficam conectados com orçamento budget"""
+        return self.connected_many_ids(self.pair_ids(pairs), budget)
+
+    def pair_ids(self, pairs):
+        """Converte pares de nomes de vértices (k x 2) em ids das folhas"""
+        return self.ids([v for pair in pairs for v in pair]).reshape(-1, 2)
+
+    # versões *_ids: os pares já são ids das folhas (array k x 2), sem conversão
+
+    def threshold_many_ids(self, pairs):
+        a, b = _columns(pairs)
+        lca, connected = self._lca(a, b)
+        return np.where(connected, self.height[lca], np.inf)
+
+    def connected_many_ids(self, pairs, budget):
+        a, b = _columns(pairs)
+        return self._climb(a, budget) == self._climb(b, budget)
+
+    def labels(self, budget):
+        """
+        Grupo de cada vértice (0..g-1, na ordem dos vértices) usando só
+        ligações de custo <= budget, em O(V); depois disso cada consulta de
+        conexão com esse orçamento é uma comparação de rótulos
+        """
+        kept = int(np.searchsorted(self.height[self.n:], budget, side="right"))
+        return self._labels(self.n + kept)
+
+    def clusters(self, budget):
+        """Grupos de vértices com orçamento budget"""
+        return self._groups(self.labels(budget))
+
+    def cut_labels(self, k):
+        """
+        Grupo de cada vértice ao cortar a hierarquia em k grupos
+
+        Desfaz as k - c uniões mais caras (c = componentes do grafo), em O(V).
+        """
+        c = self.num_components
+        if not c <= k <= self.n:
+            raise ValueError(f"k deve estar entre {c} (componentes) e {self.n} (vértices), não {k}")
+        return self._labels(len(self.parent) - (k - c))
+
+    def cut(self, k):
+        """k grupos de vértices (single linkage)"""
+        return self._groups(self.cut_labels(k))
+
+    def linkage(self):
+        """
+        Matriz de ligação no formato do scipy (n-1 x 4: filho, filho,
+        altura, tamanho); só existe para grafos conexos
+        """
+        if self.num_components != 1:
+            raise ValueError("o dendrograma completo só existe para grafos conexos")
+        internal = slice(self.n, None)
+        return np.column_stack((self.left[internal], self.right[internal],
+                                self.height[internal], self.size[internal])).astype(np.float64)
+
+    def ids(self, vertices):
+        """Converte nomes de vértices em ids das folhas"""
+        index = self.index
+        return np.fromiter((index[v] for v in vertices), dtype=np.int64, count=len(vertices))
+
+    def _climb(self, x, budget):
+        """Ancestral mais alto de cada nó com altura <= budget"""
+        height = self.height
+        for k in reversed(range(len(self.up))):
+            above = self.up[k][x]
+            x = np.where(height[above] <= budget, above, x)
+        return x
+
+    def _lca(self, a, b):
+        """
+        LCA vetorizado por binary lifting
+
+        Returns:
+            tuple: (lca, conectado)
+        """
+        up, depth = self.up, self.depth
+
+        swap = depth[a] < depth[b] #a passa a ser o mais profundo
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+
+        diff = depth[a] - depth[b]
+        for k in range(len(up)):
+            jump = ((diff >> k) & 1).astype(bool)
+            a = np.where(jump, up[k][a], a)
+
+        for k in reversed(range(len(up))):
+            move = up[k][a] != up[k][b]
+            a = np.where(move, up[k][a], a)
+            b = np.where(move, up[k][b], b)
+
+        connected = (a == b) | (up[0][a] == up[0][b]) #raízes diferentes apontam para si mesmas
+        return np.where(a == b, a, up[0][a]), connected
+
+    def _labels(self, keep):
+        """Rótulos das folhas mantendo só os nós internos com id < keep"""
+        parent = self.parent.tolist()
+        rep = list(range(len(parent)))
+
+        for x in reversed(range(len(parent))): #de cima para baixo
+            p = parent[x]
+            if p != x and p < keep:
+                rep[x] = rep[p]
+
+        labels = np.array(rep[:self.n], dtype=np.int64)
+        _, first, labels = np.unique(labels, return_index=True, return_inverse=True)
+        order = np.argsort(np.argsort(first, kind="stable"), kind="stable") #numeração na ordem dos vértices
+        return order[labels.ravel()]
+
+    def _groups(self, labels):
+        groups = [[] for _ in range(int(labels.max()) + 1 if len(labels) else 0)]
+        for name, label in zip(self.names, labels.tolist()):
+            groups[label].append(name)
+        return groups
+
+    def _leaves(self, root):
+        """Folhas da subárvore de um nó"""
+        stack, leaves = [root], []
+        left, right = self.left, self.right
+        while stack:
+            x = stack.pop()
+            if x < self.n:
+                leaves.append(x)
+            else:
+                stack.extend((int(right[x]), int(left[x])))
+        return sorted(leaves)
+
+
+def _columns(pairs):
+    """Colunas (a, b) de um array k x 2 de ids"""
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
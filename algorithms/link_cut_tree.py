@@ -0,0 +1,171 @@
+NEG_INF = float("-inf")
+
+
+class LinkCutTree:
+    """
+    Link-cut tree (Sleator-Tarjan) com máximo de caminho
+
+    Mantém uma floresta dinâmica com link, cut, conectividade e consulta do
+    nó de maior valor num caminho, tudo em O(log n) amortizado. Para guardar
+    pesos de arestas, cada aresta vira um nó intermediário com o peso como
+    valor (os vértices recebem -inf).
+    """
+
+    def __init__(self):
+
+        self.left = []
+        self.right = []
+        self.parent = []
+        self.flip = []
+        self.value = []
+        self.best = [] # nó de maior valor na subárvore da splay
+        self._free = [] # ids liberados por remove_node
+
+    def add_node(self, value=NEG_INF):
+
+        if self._free:
+            x = self._free.pop()
+            self.left[x] = self.right[x] = self.parent[x] = -1
+            self.flip[x] = False
+            self.value[x] = value
+            self.best[x] = x
+            return x
+
+        self.left.append(-1)
+        self.right.append(-1)
+        self.parent.append(-1)
+        self.flip.append(False)
+        self.value.append(value)
+        self.best.append(len(self.value) - 1)
+        return len(self.value) - 1
+
+    def remove_node(self, x):
+        """Libera um nó já isolado (sem links) para reutilização"""
+        self._free.append(x)
+
+    def set_value(self, x, value):
+        self._access(x)
+        self.value[x] = value
+        self._update(x)
+
+    def link(self, a, b):
+        """Liga as árvores de a e b pela aresta a-b (devem estar desconectados)"""
+        self._make_root(a)
+        self.parent[a] = b
+
+    def cut(self, a, b):
+        """Remove a aresta a-b (devem ser adjacentes)"""
+        self._make_root(a)
+        self._access(b)
+        # agora a é o filho esquerdo de b e não tem filho direito
+        self.left[b] = -1
+        self.parent[a] = -1
+        self._update(b)
+
+    def connected(self, a, b):
+        return a == b or self.find_root(a) == self.find_root(b)
+
+    def find_root(self, x):
+
+        self._access(x)
+        left = self.left
+        while True:
+            self._push(x)
+            if left[x] == -1:
+                break
+            x = left[x]
+        self._splay(x)
+        return x
+
+    def path_max(self, a, b):
+        """Nó de maior valor no caminho a..b (devem estar conectados)"""
+        self._make_root(a)
+        self._access(b)
+        return self.best[b]
+
+    def _is_root(self, x): # raiz da sua splay (não necessariamente da árvore)
+        p = self.parent[x]
+        return p == -1 or (self.left[p] != x and self.right[p] != x)
+
+    def _push(self, x):
+        if self.flip[x]:
+            left, right, flip = self.left, self.right, self.flip
+            left[x], right[x] = right[x], left[x]
+            if left[x] != -1:
+                flip[left[x]] = not flip[left[x]]
+            if right[x] != -1:
+                flip[right[x]] = not flip[right[x]]
+            flip[x] = False
+
+    def _update(self, x):
+        value, best = self.value, self.best
+        top = x
+        for child in (self.left[x], self.right[x]):
+            if child != -1 and value[best[child]] > value[top]:
+                top = best[child]
+        best[x] = top
+
+    def _rotate(self, x):
+
+        left, right, parent = self.left, self.right, self.parent
+        p = parent[x]
+        g = parent[p]
+
+        if not self._is_root(p):
+            if left[g] == p:
+                left[g] = x
+            else:
+                right[g] = x
+        parent[x] = g
+
+        if left[p] == x:
+            left[p] = right[x]
+            if right[x] != -1:
+                parent[right[x]] = p
+            right[x] = p
+        else:
+            right[p] = left[x]
+            if left[x] != -1:
+                parent[left[x]] = p
+            left[x] = p
+
+        parent[p] = x
+        self._update(p)
+        self._update(x)
+
+    def _splay(self, x):
+
+        # aplica as inversões pendentes do topo da splay até x
+        stack = [x]
+        y = x
+        while not self._is_root(y):
+            y = self.parent[y]
+            stack.append(y)
+        for y in reversed(stack):
+            self._push(y)
+
+        parent, left = self.parent, self.left
+        while not self._is_root(x):
+            p = parent[x]
+            if not self._is_root(p):
+                g = parent[p]
+                zigzig = (left[g] == p) == (left[p] == x)
+                self._rotate(p if zigzig else x)
+            self._rotate(x)
+
+    def _access(self, x):
+
+        last = -1
+        y = x
+        while y != -1:
+            self._splay(y)
+            self.right[y] = last
+            self._update(y)
+            last = y
+            y = self.parent[y]
+        self._splay(x)
+
+    def _make_root(self, x):
+        self._access(x)
+        self.flip[x] = not self.flip[x]
+        self._push(x)
@@ -1,29 +1,202 @@
 import heapq # fila de prioridade
 
-def prim(graph, start):
+def prim(graph, start, mode="lazy", sink=None, forest=False):
+    """
+    Árvore geradora mínima pelo algoritmo de Prim
+
+    Modos:
+        - "lazy": heap com entradas repetidas, descartadas ao sair (O(E log E))
+        - "eager": heap indexado com decrease-key, no máximo V entradas (O(E log V))
+        - "dense": varreduras O(V²) sobre a matriz de distâncias, sem heap;
+          indicado para grafos completos ou quase completos
+
+    Args:
+        sink: função chamada com cada StepEvent (algorithms.events): push,
+            pop e descarte no heap, aresta avaliada/aceita/rejeitada e
+            vértice visitado. Só no modo "lazy"; sem sink nenhum evento é
+            criado.
+        forest: ao esgotar a componente de `start`, recomeça do próximo
+            vértice não visitado (na ordem de graph.vertices()), cobrindo
+            todas as componentes como `kruskal`
+
+    Returns:
+        tuple: (mst, total_cost) da componente que contém `start`, ou da
+        floresta geradora inteira com forest=True
+    """
+    if sink is not None and mode != "lazy":
+        raise ValueError(f"sink só é suportado no modo 'lazy', não em {mode!r}")
+    if mode == "eager":
+        return _prim_eager(graph, start, forest)
+    if mode == "dense":
+        return _prim_dense(graph, start, forest)
+    if mode != "lazy":
+        raise ValueError(f"modo desconhecido: {mode!r} (use 'lazy', 'eager' ou 'dense')")
 
     visited = set()
     mst = []
     total_cost = 0
 
-    pq = [(0, start, None)] #configurando ponto de partida
-
-    while pq:
+    if sink is not None:
+        from algorithms.events import (StepEvent, HEAP_PUSH, HEAP_POP, STALE_SKIP, VERTEX_VISITED,
+                                       EDGE_CONSIDERED, EDGE_ACCEPTED, EDGE_REJECTED)
 
-        cost, u, parent = heapq.heappop(pq) #elimina aresta de menor peso
+    for root in _roots(graph, start, forest):
 
-        # evitando ciclos
-        if u in visited:
+        if root in visited:
             continue
 
-        visited.add(u)
-        total_cost = total_cost + cost
+        pq = [(0, root, None)] #configurando ponto de partida
+
+        if sink is not None:
+            sink(StepEvent(HEAP_PUSH, root, None, 0))
+
+        while pq:
+
+            cost, u, parent = heapq.heappop(pq) #elimina aresta de menor peso
 
-        if parent:
-            mst.append((parent,u,cost))
+            if sink is not None:
+                sink(StepEvent(HEAP_POP, u, parent, cost))
+                if parent is not None:
+                    sink(StepEvent(EDGE_CONSIDERED, parent, u, cost))
 
-        for v, weight in graph.adj[u]:
-            if v not in visited :
-                heapq.heappush(pq, (weight, v, u))
+            # evitando ciclos
+            if u in visited:
+                if sink is not None:
+                    sink(StepEvent(STALE_SKIP, u, parent, cost))
+                    sink(StepEvent(EDGE_REJECTED, parent, u, cost))
+                continue
+
+            visited.add(u)
+            total_cost = total_cost + cost
+
+            if sink is not None:
+                sink(StepEvent(VERTEX_VISITED, u, parent, cost))
+
+            if parent is not None: #vértices como 0 ou "" também são válidos
+                mst.append((parent,u,cost))
+                if sink is not None:
+                    sink(StepEvent(EDGE_ACCEPTED, parent, u, cost))
+
+            for v, weight in graph.adj[u]:
+                if v not in visited :
+                    heapq.heappush(pq, (weight, v, u))
+                    if sink is not None:
+                        sink(StepEvent(HEAP_PUSH, v, u, weight))
     
-    return mst, total_cost
\ No newline at end of file
+    return mst, total_cost
+
+
+def _roots(graph, start, forest):
+    """Vértices de onde a busca (re)começa: só start, ou todos com forest=True"""
+    if not forest:
+        return (start,)
+    from itertools import chain
+    return chain((start,), graph.vertices())
+
+
+def _prim_eager(graph, start, forest=False):
+
+    from algorithms.indexed_heap import IndexedMinHeap
+
+    visited = set()
+    parent = {}
+    mst = []
+    total_cost = 0
+
+    pq = IndexedMinHeap()
+
+    for root in _roots(graph, start, forest):
+
+        if root in visited:
+            continue
+
+        parent[root] = None
+        pq.push(root, 0)
+
+        while pq:
+
+            u, cost = pq.pop()
+            visited.add(u)
+            total_cost = total_cost + cost
+
+            if parent[u] is not None:
+                mst.append((parent[u], u, cost))
+
+            for v, weight in graph.adj[u]:
+
+                if v in visited:
+                    continue
+
+                if v not in pq: #primeira vez que v é alcançado
+                    pq.push(v, weight)
+                    parent[v] = u
+                elif weight < pq.priority(v): #achamos uma aresta mais barata até v
+                    pq.decrease_key(v, weight)
+                    parent[v] = u
+
+    return mst, total_cost
+
+
+def _prim_dense(graph, start, forest=False):
+
+    import numpy as np
+
+    names, dist, integer = _distance_matrix(graph)
+    n = len(names)
+    s = names.index(start)
+
+    in_tree = np.zeros(n, dtype=bool)
+    parent = np.full(n, s)
+    key = dist[s].copy() #menor custo conhecido para ligar cada vértice à árvore
+
+    in_tree[s] = True
+    key[s] = np.inf
+
+    mst = []
+    total_cost = 0
+
+    for _ in range(n - 1):
+
+        j = int(np.argmin(key))
+        cost = key[j]
+
+        if cost == np.inf: #restante do grafo não é alcançável a partir de start
+            if not forest:
+                break
+            j = int(np.flatnonzero(~in_tree)[0]) #raiz da próxima componente
+        else:
+            cost = int(cost) if integer else float(cost)
+            mst.append((names[parent[j]], names[j], cost))
+            total_cost = total_cost + cost
+
+        in_tree[j] = True
+        key[j] = np.inf
+
+        closer = (dist[j] < key) & ~in_tree
+        key[closer] = dist[j][closer]
+        parent[closer] = j
+
+    return mst, total_cost
+
+
+def _distance_matrix(graph):
+    """Matriz V x V com o menor peso entre cada par (inf se não há aresta)"""
+    import numpy as np
+
+    if hasattr(graph, "columns"):
+        names = list(graph.names)
+        u, v, w = graph.columns()
+    else:
+        names = list(graph.vertices())
+        index = {name: i for i, name in enumerate(names)}
+        u = np.fromiter((index[a] for a, _, _ in graph.edges), dtype=np.int64, count=len(graph.edges))
+        v = np.fromiter((index[b] for _, b, _ in graph.edges), dtype=np.int64, count=len(graph.edges))
+        w = np.array([weight for _, _, weight in graph.edges])
+
+    integer = w.dtype.kind in "iu" or len(w) == 0
+
+    dist = np.full((len(names), len(names)), np.inf)
+    np.minimum.at(dist, (u, v), w) #arestas paralelas: fica a mais barata
+    np.minimum.at(dist, (v, u), w)
+
+    return names, dist, integer
@@ -1,29 +1,154 @@
+from array import array
 
 # Controle de componentes conexos
 # Deteccao de Ciclos
 class UnionFind:
+    """
+    Union-Find (Disjoint Set) apoiado em arrays de inteiros
 
-    def __init__(self, vertices):
+    - union por tamanho (padrão) ou por rank, mantendo as árvores rasas
+    - find iterativo com path halving (sem limite de recursão)
+    - log opcional de rollback para desfazer uniões (análises "e se")
 
-        self.parent = {v: v for v in vertices}
+    Os vértices podem ser quaisquer objetos hasheáveis; internamente cada um
+    recebe um id denso. Passando um inteiro n, os próprios ids 0..n-1 são
+    usados e nenhum dicionário é criado.
+    """
 
-    def find(self, v): #logica de encontrar representante
+    def __init__(self, vertices, union_by="size", rollback=False):
+
+        if union_by not in ("size", "rank"):
+            raise ValueError(f"union_by deve ser 'size' ou 'rank', não {union_by!r}")
 
-        if self.parent[v] != v:
+        if isinstance(vertices, int):
+            self.items = None
+            self.index = None
+            n = vertices
+        else:
+            self.items = list(vertices)
+            self.index = {v: i for i, v in enumerate(self.items)}
+            n = len(self.items)
 
-            self.parent[v] = self.find(self.parent[v])
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.rank = array("B", bytes(n)) if union_by == "rank" else None
 
-        return self.parent[v]
+        self.count = n # numero de componentes
+        self.history = [] if rollback else None # (raiz_filha, raiz_pai, rank_incrementado)
+
+    def find(self, v): #logica de encontrar representante
+
+        root = self._root(self._id(v))
+        return root if self.items is None else self.items[root]
 
     def union(self, u, v): #logica de conexao de dois conjuntos
 
-        ru = self.find(u)
-        rv = self.find(v)
+        ru = self._root(self._id(u))
+        rv = self._root(self._id(v))
+
+        if ru == rv:
+            return False
+
+        size = self.size
+        bumped = False
+
+        if self.rank is None:
+            if size[ru] < size[rv]: #a menor arvore fica embaixo
+                ru, rv = rv, ru
+        else:
+            rank = self.rank
+            if rank[ru] < rank[rv]:
+                ru, rv = rv, ru
+            elif rank[ru] == rank[rv]:
+                rank[ru] += 1
+                bumped = True
+
+        self.parent[rv] = ru
+        size[ru] += size[rv]
+        self.count -= 1
+
+        if self.history is not None:
+            self.history.append((rv, ru, bumped))
+
+        return True
+
+    def connected(self, u, v):
+        return self._root(self._id(u)) == self._root(self._id(v))
+
+    def find_many(self, vertices):
+        """Representantes de vários vértices de uma vez"""
+        find = self.find
+        return [find(v) for v in vertices]
+
+    def union_many(self, pairs):
+        """Une vários pares (u, v); devolve, para cada um, se houve união"""
+        union = self.union
+        return [union(u, v) for u, v in pairs]
+
+    def path_length(self, v):
+        """Elos entre v e a raiz do seu conjunto (sem comprimir o caminho)"""
+        parent = self.parent
+        i = self._id(v)
+        hops = 0
+        while parent[i] != i:
+            i = parent[i]
+            hops += 1
+        return hops
+
+    def component_size(self, v):
+        """Número de vértices na componente de v"""
+        return self.size[self._root(self._id(v))]
+
+    def component_count(self):
+        return self.count
+
+    def checkpoint(self):
+        """Marca o estado atual para um rollback posterior (requer rollback=True)"""
+        self._require_history()
+        return len(self.history)
+
+    def rollback(self, checkpoint=None):
+        """
+        Desfaz uniões até o checkpoint indicado
+
+        Args:
+            checkpoint: valor devolvido por checkpoint(); sem ele desfaz
+                apenas a última união
+        """
+        self._require_history()
+        history = self.history
+
+        if checkpoint is None:
+            checkpoint = max(len(history) - 1, 0)
+
+        while len(history) > checkpoint:
+            child, root, bumped = history.pop()
+            self.parent[child] = child
+            self.size[root] -= self.size[child]
+            if bumped:
+                self.rank[root] -= 1
+            self.count += 1
+
+    def _id(self, v):
+        return v if self.index is None else self.index[v]
+
+    def _root(self, i):
+
+        parent = self.parent
+
+        if self.history is not None:
+            # sem compressao: o rollback precisa das ligacoes originais
+            while parent[i] != i:
+                i = parent[i]
+            return i
 
-        if ru != rv:
+        while parent[i] != i:
+            grandparent = parent[parent[i]] #path halving
+            parent[i] = grandparent
+            i = grandparent
 
-            self.parent[rv] = ru
-            return True
-        
-        return False
+        return i
 
+    def _require_history(self):
+        if self.history is None:
+            raise RuntimeError("UnionFind criado sem rollback=True")
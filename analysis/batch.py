@@ -0,0 +1,124 @@
+"""
+Execução em lote: MST e análise completa de vários arquivos de grafo
+
+Cada arquivo vai para um processo do pool, que carrega o grafo, calcula a
+MST e roda MSTAnalyzer.get_full_analysis. Os resultados voltam assim que
+cada arquivo termina (não na ordem de entrada) e podem ser gravados como
+JSON Lines, um registro por arquivo. Falhas viram registros com "ok":
+false, sem interromper o lote. Cada processo segura um grafo por vez e o
+processo principal não acumula resultados, então a memória fica limitada.
+"""
+import glob
+import json
+import os
+import time
+
+# extensões lidas por utils.loader
+GRAPH_EXTENSIONS = (".json", ".ndjson", ".jsonl", ".csv")
+
+
+def expand_inputs(patterns):
+    """
+    Arquivos de grafo a partir de diretórios, globs ou caminhos
+
+    Returns:
+        list: caminhos sem repetição, ordenados
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for name in os.listdir(pattern):
+                path = os.path.join(pattern, name)
+                if name.endswith(GRAPH_EXTENSIONS) and os.path.isfile(path):
+                    paths.add(path)
+        elif glob.has_magic(pattern):
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        else:
+            paths.add(pattern) #arquivo inexistente vira falha no registro
+
+    return sorted(paths)
+
+
+def process_file(path, algorithm="Kruskal"):
+    """
+    Carrega, calcula a MST e analisa um arquivo
+
+    Returns:
+        dict: registro com "file" e "ok"; com ok=True traz também
+        algorithm, vertices, edges, cost, mst_edges, seconds e analysis;
+        com ok=False traz "error"
+    """
+    from utils.loader import load_graph
+    from analysis.compare import mst_runner
+    from analysis.mst_metrics import MSTAnalyzer
+
+    t1 = time.perf_counter()
+    try:
+        graph = load_graph(path)
+        mst, cost = mst_runner(graph, algorithm)()
+        analysis = MSTAnalyzer(mst, graph.vertices()).get_full_analysis()
+    except Exception as e:
+        return {"file": path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        "file": path,
+        "ok": True,
+        "algorithm": algorithm,
+        "vertices": len(graph.vertices()),
+        "edges": len(graph.edges),
+        "cost": cost,
+        "mst_edges": len(mst),
+        "seconds": time.perf_counter() - t1,
+        "analysis": analysis,
+    }
+
+
+def run_batch(paths, algorithm="Kruskal", workers=None):
+    """
+    Processa vários arquivos em um pool de processos
+
+    Args:
+        paths: arquivos (ver expand_inputs)
+        algorithm: variante de analysis.compare.VARIANTS
+        workers: número de processos (padrão: os.cpu_count())
+
+    Yields:
+        dict: registro de process_file, na ordem em que cada arquivo termina
+    """
+    from functools import partial
+
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    task = partial(process_file, algorithm=algorithm)
+
+    if workers <= 1:
+        for path in paths:
+            yield task(path)
+        return
+
+    from multiprocessing import Pool
+
+    with Pool(workers) as pool:
+        yield from pool.imap_unordered(task, paths, chunksize=1)
+
+
+def write_jsonl(records, f):
+    """
+    Grava cada registro como uma linha JSON assim que ele chega
+
+    Returns:
+        tuple: (arquivos_ok, falhas)
+    """
+    ok = failed = 0
+
+    for record in records:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        f.flush()
+        if record["ok"]:
+            ok += 1
+        else:
+            failed += 1
+
+    return ok, failed
@@ -0,0 +1,315 @@
+"""
+Benchmark das variantes de MST
+
+Cada variante registrada em analysis.compare roda sobre o mesmo grafo com
+aquecimento, várias repetições cronometradas com perf_counter_ns (mediana
+e percentis) e uma execução extra sob tracemalloc para o pico de memória.
+As séries varrem tamanhos e densidades de grafos sintéticos com semente
+fixa (utils.generators), então duas execuções medem exatamente as mesmas
+entradas.
+
+O relatório sai em JSON e pode ser comparado com um baseline salvo:
+
+    python -m analysis.benchmark --sizes 1000 10000 --densities 2 8 \\
+        --output benchmark.json --baseline baseline.json
+
+O código de saída é 1 quando alguma variante ficou mais lenta (ou usou
+mais memória) que o baseline além da tolerância.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from graph.graph import Graph
+from analysis.compare import DEFAULT_ALGORITHMS, mst_runners
+from utils.generators import GENERATORS, build_graph, random_edges
+
+PERCENTILES = (10, 90)
+
+# aumento relativo tolerado antes de acusar regressão
+REGRESSION_THRESHOLD = 0.10
+
+# métricas comparadas com o baseline
+TRACKED_METRICS = ("median_ns", "peak_bytes")
+
+
+def make_graph(generator, vertices, edges, seed=0):
+    """
+    Grafo de entrada de um ponto da série (ver utils.generators)
+
+    O gerador "random" respeita o número de vértices pedido; os demais
+    recebem só o número de arestas alvo e definem os vértices pela própria
+    estrutura (malha, bairros, ...).
+    """
+    if generator != "random":
+        return build_graph(generator, edges, seed)
+
+    graph = Graph()
+    for u, v, w in random_edges(vertices, edges, seed):
+        graph.add_edge(u, v, w)
+    return graph
+
+
+def measure(fn, repeats=5, warmup=1, memory=True):
+    """
+    Cronometra fn várias vezes e mede o pico de memória de uma execução
+
+    Como no timeit, o coletor de lixo fica desligado durante cada amostra.
+
+    Returns:
+        tuple: (amostras em ns, pico em bytes ou None, último resultado)
+    """
+    if repeats < 1:
+        raise ValueError(f"repeats deve ser pelo menos 1, não {repeats}")
+
+    result = None
+    for _ in range(warmup):
+        result = fn()
+
+    samples = []
+    for _ in range(repeats):
+        gc.collect()
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            t1 = time.perf_counter_ns()
+            result = fn()
+            samples.append(time.perf_counter_ns() - t1)
+        finally:
+            if enabled:
+                gc.enable()
+
+    peak = None
+    if memory:
+        # execução separada: o rastreamento deixa o código bem mais lento
+        gc.collect()
+        tracemalloc.start()
+        try:
+            result = fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return samples, peak, result
+
+
+def summarize(samples, percentiles=PERCENTILES):
+    """Mediana, média, extremos e percentis de uma lista de tempos (ns)"""
+    if not samples:
+        raise ValueError("nenhuma amostra para resumir")
+    ordered = sorted(samples)
+    stats = {
+        "median_ns": _percentile(ordered, 50),
+        "mean_ns": sum(ordered) / len(ordered),
+        "min_ns": ordered[0],
+        "max_ns": ordered[-1],
+    }
+    for q in percentiles:
+        stats[f"p{q}_ns"] = _percentile(ordered, q)
+    stats["samples_ns"] = samples
+    return stats
+
+
+def benchmark(graph, algorithms=None, repeats=5, warmup=1, memory=True, percentiles=PERCENTILES):
+    """
+    Mede cada variante sobre o mesmo grafo
+
+    Returns:
+        dict: {nome: {"cost", "median_ns", "mean_ns", ..., "peak_bytes"}}
+    """
+    algorithms = algorithms or DEFAULT_ALGORITHMS
+    runners = mst_runners(graph, algorithms)
+    results = {}
+
+    for name in algorithms:
+        samples, peak, (_, cost) = measure(runners[name], repeats, warmup, memory)
+        results[name] = {"cost": cost, **summarize(samples, percentiles), "peak_bytes": peak}
+
+    return results
+
+
+def sweep(sizes, densities, algorithms=None, seed=0, generator="random", **options):
+    """
+    Série de benchmarks sobre grafos de vários tamanhos e densidades
+
+    Args:
+        sizes: números de vértices (nos geradores estruturados só definem
+            o número de arestas alvo, E = densidade * V)
+        densities: arestas por vértice (E = densidade * V)
+        generator: tipo de grafo de utils.generators.GENERATORS
+        options: repassadas para benchmark (repeats, warmup, memory, percentiles)
+
+    Returns:
+        list: um registro por (tamanho, densidade, variante)
+    """
+    records = []
+
+    for vertices in sizes:
+        for density in densities:
+            graph = make_graph(generator, vertices, int(density * vertices), seed)
+
+            for name, stats in benchmark(graph, algorithms, **options).items():
+                records.append({
+                    "algorithm": name,
+                    "generator": generator,
+                    "vertices": len(graph.vertices()),
+                    "edges": len(graph.edges),
+                    "density": density,
+                    "seed": seed,
+                    **stats,
+                })
+
+    return records
+
+
+def make_report(records, config=None):
+    """Relatório serializável: ambiente, configuração e registros"""
+    import numpy
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": numpy.__version__,
+            "platform": platform.platform(),
+            "config": config or {},
+        },
+        "results": records,
+    }
+
+
+def save_report(report, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def load_report(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_to_baseline(report, baseline, threshold=REGRESSION_THRESHOLD, metrics=TRACKED_METRICS):
+    """
+    Regressões do relatório em relação ao baseline
+
+    Registros são pareados por (variante, gerador, vértices, arestas,
+    densidade, semente); uma métrica regrediu quando atual > baseline * (1 + threshold).
+
+    Returns:
+        list: {"algorithm", "vertices", "edges", "metric", "baseline", "current", "ratio"}
+    """
+    previous = {_record_key(record): record for record in baseline["results"]}
+    regressions = []
+
+    for record in report["results"]:
+        old = previous.get(_record_key(record))
+        if old is None:
+            continue
+
+        for metric in metrics:
+            current, reference = record.get(metric), old.get(metric)
+            if not current or not reference:
+                continue
+            if current > reference * (1 + threshold):
+                regressions.append({
+                    "algorithm": record["algorithm"],
+                    "vertices": record["vertices"],
+                    "edges": record["edges"],
+                    "metric": metric,
+                    "baseline": reference,
+                    "current": current,
+                    "ratio": current / reference,
+                })
+
+    return regressions
+
+
+def format_records(records):
+    """Tabela de texto com os principais números de cada registro"""
+    lines = [f"{'variante':<18}{'V':>10}{'E':>11}{'mediana':>12}{'p90':>12}{'pico':>12}"]
+    for r in records:
+        peak = "-" if r.get("peak_bytes") is None else f"{r['peak_bytes'] / 2**20:.1f} MiB"
+        p90 = r.get("p90_ns", r["max_ns"])
+        lines.append(
+            f"{r['algorithm']:<18}{r['vertices']:>10}{r['edges']:>11}"
+            f"{r['median_ns'] / 1e6:>9.2f} ms{p90 / 1e6:>9.2f} ms{peak:>12}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Benchmark das variantes de MST")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--densities", type=float, nargs="+", default=[2, 8])
+    parser.add_argument("--algorithms", nargs="+", default=None,
+                        help=f"variantes (padrão: {', '.join(DEFAULT_ALGORITHMS)})")
+    parser.add_argument("--repeats", type=_positive_int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--generator", choices=list(GENERATORS), default="random",
+                        help="tipo de grafo gerado para a série")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--output", help="arquivo JSON do relatório")
+    parser.add_argument("--baseline", help="relatório anterior para detectar regressões")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    config = {
+        "sizes": args.sizes, "densities": args.densities, "algorithms": args.algorithms,
+        "repeats": args.repeats, "warmup": args.warmup, "seed": args.seed,
+        "generator": args.generator,
+    }
+    records = sweep(
+        args.sizes, args.densities, args.algorithms, seed=args.seed, generator=args.generator,
+        repeats=args.repeats, warmup=args.warmup, memory=not args.no_memory,
+    )
+    report = make_report(records, config)
+
+    print(format_records(records))
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\nrelatório salvo em {args.output}")
+
+    if args.baseline:
+        regressions = compare_to_baseline(report, load_report(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  {r['algorithm']} (V={r['vertices']}, E={r['edges']}) "
+                      f"{r['metric']}: {r['baseline']:.0f} -> {r['current']:.0f} (x{r['ratio']:.2f})")
+            return 1
+        print("\nsem regressões em relação ao baseline")
+
+    return 0
+
+
+def _positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"deve ser pelo menos 1, não {value}")
+    return value
+
+
+def _percentile(ordered, q):
+    """Percentil com interpolação linear sobre uma lista ordenada"""
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def _record_key(record):
+    return (
+        record["algorithm"], record.get("generator"), record["vertices"],
+        record["edges"], record.get("density"), record.get("seed"),
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,132 @@
 import time
 
-def compare(graph):
-    
-    from algorithms.prim import prim
-    from algorithms.kruskal import kruskal
+# o modo denso aloca uma matriz V x V, então só roda quando pedido
+DEFAULT_ALGORITHMS = ("Prim", "Prim (eager)", "Kruskal", "Kruskal (NumPy)", "Borůvka")
 
+
+# módulo, função, se recebe o vértice inicial e argumentos extras de cada variante
+# (Prim com forest=True: em grafos desconexos todas devolvem a mesma floresta)
+VARIANTS = {
+    "Prim": ("algorithms.prim", "prim", True, {"forest": True}),
+    "Prim (eager)": ("algorithms.prim", "prim", True, {"mode": "eager", "forest": True}),
+    "Prim (dense)": ("algorithms.prim", "prim", True, {"mode": "dense", "forest": True}),
+    "Kruskal": ("algorithms.kruskal", "kruskal", False, {}),
+    "Kruskal (NumPy)": ("algorithms.kruskal", "kruskal_vectorized", False, {}),
+    "Borůvka": ("algorithms.boruvka", "boruvka", False, {}),
+}
+
+
+# variantes que trabalham sobre as colunas do CompactGraph: um Graph é convertido
+# uma única vez ao montar os runners, fora da função medida
+COLUMNAR = ("Kruskal (NumPy)", "Borůvka")
+
+
+# nomes curtos (linha de comando, serviço) -> variante em VARIANTS
+ALGORITHM_NAMES = {
+    "prim": "Prim",
+    "prim-eager": "Prim (eager)",
+    "prim-dense": "Prim (dense)",
+    "kruskal": "Kruskal",
+    "kruskal-numpy": "Kruskal (NumPy)",
+    "boruvka": "Borůvka",
+}
+
+
+def mst_runner(graph, name, start=None, compact=None, **options):
+    """
+    Uma variante de MST ligada ao grafo
+
+    Importa só o módulo da variante (ex.: Kruskal não carrega o NumPy),
+    fora da função devolvida, então a importação não entra nas medições.
+    Pelo mesmo motivo as variantes de COLUMNAR recebem o grafo já
+    convertido para CompactGraph (`compact`, ou convertido aqui).
+    `options` completa os argumentos registrados em VARIANTS.
+
+    Returns:
+        função sem argumentos que devolve (mst, custo)
+    """
+    from importlib import import_module
+
+    if name not in VARIANTS:
+        raise ValueError(f"variante desconhecida: {name!r} (use {', '.join(VARIANTS)})")
+
+    module, function, with_start, kwargs = VARIANTS[name]
+    kwargs = {**kwargs, **options}
+    run = getattr(import_module(module), function)
+
+    if name in COLUMNAR and not hasattr(graph, "columns"):
+        if compact is None:
+            from graph.compact_graph import CompactGraph
+            compact = CompactGraph.from_graph(graph)
+        graph = compact
+
+    if with_start:
+        if start is None:
+            start = next(iter(graph.vertices()))
+        return lambda: run(graph, start, **kwargs)
+    return lambda: run(graph, **kwargs)
+
+
+def mst_runners(graph, names=None):
+    """
+    Variantes de MST ligadas ao grafo
+
+    Só os módulos das variantes pedidas são importados (Kruskal sozinho não
+    carrega o NumPy nem o multiprocessing do Borůvka), e um Graph é
+    convertido para CompactGraph no máximo uma vez, compartilhado pelas
+    variantes de COLUMNAR.
+
+    Args:
+        names: variantes desejadas (padrão: todas de VARIANTS)
+
+    Returns:
+        dict: {nome: função sem argumentos que devolve (mst, custo)}
+    """
     start = next(iter(graph.vertices()))
+    names = names or VARIANTS
+
+    compact = None
+    if not hasattr(graph, "columns") and any(name in COLUMNAR for name in names):
+        from graph.compact_graph import CompactGraph
+        compact = CompactGraph.from_graph(graph)
+
+    # Cada variante recebe exatamente o mesmo grafo
+    return {name: mst_runner(graph, name, start, compact) for name in names}
+
+
+def compare(graph, algorithms=None, verify=False):
+    """
+    Roda as variantes de MST sobre o mesmo grafo
+
+    Execução única de cada uma; para medições confiáveis (repetições,
+    percentis, memória, séries de tamanhos) use analysis.benchmark. Os
+    tempos das variantes de COLUMNAR não incluem a conversão de um Graph
+    para CompactGraph, feita uma vez antes.
+
+    Args:
+        graph: grafo de entrada
+        algorithms: nomes das variantes (padrão: DEFAULT_ALGORITHMS)
+        verify: confere cada árvore com verify_mst em vez de só comparar custos
+
+    Returns:
+        dict: {nome: {"cost", "time"}}, mais "valid" quando verify=True
+    """
+    algorithms = algorithms or DEFAULT_ALGORITHMS
+    runners = mst_runners(graph, algorithms)
+    results = {}
+
+    if verify:
+        from analysis.verify import verify_mst
+
+    for name in algorithms:
+
+        t1 = time.perf_counter_ns()
+        mst, cost = runners[name]()
+        t2 = time.perf_counter_ns()
 
-    t1 = time.time()
-    _, cost_prim = prim(graph, start)
-    t2 = time.time()
+        results[name] = {"cost": cost, "time": (t2 - t1) / 1e9}
 
-    _, cost_kruskal = kruskal(graph)
-    t3 = time.time()
+        if verify:
+            results[name]["valid"] = verify_mst(graph, mst)["valid"]
 
-    return {
-        "Prim": {"cost": cost_prim, "time": t2 - t1},
-        "Kruskal": {"cost": cost_kruskal, "time": t3 - t2}
-    }
+    return results
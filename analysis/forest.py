@@ -0,0 +1,306 @@
+"""
+Floresta geradora mínima de grafos desconexos
+
+Um grafo com vários distritos isolados não tem árvore geradora, e sim uma
+floresta: uma árvore por componente conexa. Aqui as componentes são
+separadas numa única passada (BFS sobre a adjacência, ou
+scipy.sparse.csgraph no CompactGraph), cada uma vira um subgrafo próprio e
+as MSTs das componentes grandes são calculadas em paralelo num pool de
+processos. O resultado, SpanningForest, diz a que componente pertence cada
+vértice e traz o custo de cada árvore e os totais.
+"""
+import os
+
+# componentes com menos arestas que isso são resolvidas no processo atual
+PARALLEL_MIN_COMPONENT_EDGES = 50_000
+
+
+class SpanningForest:
+    """
+    Floresta geradora mínima, separada por componente
+
+    - components: vértices de cada componente (ordem de graph.vertices())
+    - trees: arestas (u, v, peso) da árvore de cada componente
+    - costs: custo da árvore de cada componente
+    - membership: {vertice: índice da componente}
+    """
+
+    def __init__(self, algorithm, components, trees, costs, membership=None):
+        self.algorithm = algorithm
+        self.components = components
+        self.trees = trees
+        self.costs = costs
+        if membership is None:
+            membership = {v: i for i, vertices in enumerate(components) for v in vertices}
+        self.membership = membership
+
+    @property
+    def edges(self):
+        """Todas as arestas da floresta, componente por componente"""
+        return [edge for tree in self.trees for edge in tree]
+
+    @property
+    def total_cost(self):
+        return sum(self.costs)
+
+    @property
+    def num_components(self):
+        return len(self.components)
+
+    def is_tree(self):
+        """O grafo é conexo (a floresta tem uma única árvore)"""
+        return len(self.components) <= 1
+
+    def component_of(self, v):
+        return self.membership[v]
+
+    def connected(self, u, v):
+        return self.membership[u] == self.membership[v]
+
+    def analyzer(self):
+        """MSTAnalyzer da floresta inteira, incluindo vértices isolados"""
+        from analysis.mst_metrics import MSTAnalyzer
+
+        return MSTAnalyzer(self.edges, vertices=self.membership)
+
+    def summary(self):
+        """
+        Resumo serializável
+
+        Returns:
+            dict: algorithm, components, vertices, edges, total_cost e
+            per_component (lista de {vertices, edges, cost}, na ordem de
+            self.components)
+        """
+        return {
+            "algorithm": self.algorithm,
+            "components": len(self.components),
+            "vertices": len(self.membership),
+            "edges": sum(len(tree) for tree in self.trees),
+            "total_cost": self.total_cost,
+            "per_component": [
+                {"vertices": len(vertices), "edges": len(tree), "cost": cost}
+                for vertices, tree, cost in zip(self.components, self.trees, self.costs)
+            ],
+        }
+
+
+def connected_components(graph):
+    """
+    Componentes conexas em O(V + E)
+
+    Args:
+        graph: Graph ou CompactGraph
+
+    Returns:
+        list: uma lista de vértices por componente; componentes e vértices
+        na ordem de graph.vertices()
+    """
+    if hasattr(graph, "columns"):
+        import numpy as np
+
+        _, order, bounds = _component_labels(graph)
+        names = graph.names
+        return [[names[i] for i in ids.tolist()] for ids in np.split(order, bounds)]
+
+    adj = graph.adj
+    label = {}
+    components = []
+
+    for root in graph.vertices():
+        if root in label:
+            continue
+
+        c = len(components)
+        label[root] = c
+        queue = [root]
+        for u in queue: #BFS: a própria lista serve de fila
+            for v, _ in adj[u]:
+                if v not in label:
+                    label[v] = c
+                    queue.append(v)
+
+        components.append([])
+
+    for v in graph.vertices():
+        components[label[v]].append(v)
+
+    return components
+
+
+def spanning_forest(graph, algorithm="Kruskal", workers=None,
+                    min_parallel_edges=PARALLEL_MIN_COMPONENT_EDGES):
+    """
+    Floresta geradora mínima, uma MST por componente conexa
+
+    Componentes com pelo menos `min_parallel_edges` arestas viram subgrafos
+    próprios e vão para um pool de processos (quando há mais de uma); as
+    demais são reunidas num único subgrafo resolvido no processo atual. Sem
+    paralelismo o grafo não é copiado: a variante roda uma vez sobre ele e
+    as arestas da floresta são repartidas pelas componentes.
+
+    Args:
+        graph: Graph ou CompactGraph
+        algorithm: variante de analysis.compare.VARIANTS
+        workers: número de processos (padrão: os.cpu_count())
+        min_parallel_edges: tamanho mínimo de uma componente para o pool
+
+    Returns:
+        SpanningForest
+    """
+    from analysis.compare import VARIANTS
+
+    if algorithm not in VARIANTS:
+        raise ValueError(f"variante desconhecida: {algorithm!r} (use {', '.join(VARIANTS)})")
+
+    compact = hasattr(graph, "columns")
+
+    membership = None
+
+    if compact:
+        import numpy as np
+
+        labels, order, bounds = _component_labels(graph)
+        names = graph.names
+        components = [[names[i] for i in ids.tolist()] for ids in np.split(order, bounds)]
+        u, _, _ = graph.columns()
+        sizes = np.bincount(labels[u], minlength=len(components)).tolist()
+    else:
+        components = connected_components(graph)
+        membership = {v: i for i, vertices in enumerate(components) for v in vertices}
+        sizes = [0] * len(components)
+        for u, _, _ in graph.edges:
+            sizes[membership[u]] += 1
+
+    large = [i for i, size in enumerate(sizes) if size >= min_parallel_edges]
+    workers = min(workers or os.cpu_count() or 1, len(large))
+
+    if workers <= 1:
+        tasks = [(None, graph, algorithm)] if len(graph.edges) else []
+    else:
+        # subgrafo k é a k-ésima componente grande; o último reúne as pequenas
+        group = [len(large)] * len(components)
+        for k, i in enumerate(large):
+            group[i] = k
+
+        if compact:
+            subgraphs = _compact_subgraphs(graph, np.asarray(group)[labels], len(large) + 1)
+        else:
+            subgraphs = _subgraphs(graph, [group[membership[v]] for v in graph.vertices()], len(large) + 1)
+        tasks = [(k, sub, algorithm) for k, sub in enumerate(subgraphs) if len(sub.edges)]
+
+    trees = [[] for _ in components]
+    costs = [0] * len(components)
+
+    forest = SpanningForest(algorithm, components, trees, costs, membership)
+    membership = forest.membership
+
+    def collect(mst):
+        for edge in mst:
+            c = membership[edge[0]]
+            trees[c].append(edge)
+            costs[c] += edge[2]
+
+    parallel = [task for task in tasks if task[0] is not None and task[0] < len(large)]
+    inline = [task for task in tasks if task[0] is None or task[0] == len(large)]
+
+    if parallel:
+        from multiprocessing import Pool
+
+        with Pool(workers) as pool:
+            for _, mst, _ in pool.imap_unordered(_component_mst, parallel, chunksize=1):
+                collect(mst)
+
+    for task in inline:
+        collect(_component_mst(task)[1])
+
+    return forest
+
+
+def _component_mst(task):
+    """MST (floresta) de um subgrafo (roda nos processos do pool)"""
+    from analysis.compare import mst_runner
+
+    k, graph, algorithm = task
+
+    # processos do pool não podem abrir outro pool (Borůvka paralelo)
+    options = {"workers": 1} if algorithm == "Borůvka" and k is not None else {}
+
+    mst, cost = mst_runner(graph, algorithm, **options)()
+    return k, mst, cost
+
+
+def _subgraphs(graph, group, count):
+    """
+    Um Graph por grupo de vértices, com as arestas na ordem original
+
+    Args:
+        group: grupo de cada vértice, na ordem de graph.vertices()
+        count: número de grupos
+    """
+    from graph.graph import Graph
+
+    group = dict(zip(graph.vertices(), group))
+    subgraphs = [Graph() for _ in range(count)]
+
+    for u, v, weight in graph.edges:
+        subgraphs[group[u]].add_edge(u, v, weight)
+
+    return subgraphs
+
+
+def _component_labels(graph):
+    """
+    Componentes de um CompactGraph pelos ids
+
+    Returns:
+        tuple: (labels, order, bounds): labels[i] é a componente do vértice
+        i; np.split(order, bounds) dá os ids de cada componente
+    """
+    import numpy as np
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components as csgraph_components
+
+    n = graph.num_vertices()
+    u, v, _ = graph.columns()
+    adjacency = coo_matrix((np.ones(len(u), dtype=np.int8), (u, v)), shape=(n, n))
+
+    # os rótulos seguem a ordem do primeiro vértice de cada componente
+    count, labels = csgraph_components(adjacency, directed=False)
+
+    order = np.argsort(labels, kind="stable")
+    bounds = np.cumsum(np.bincount(labels, minlength=count))[:-1]
+    return labels, order, bounds
+
+
+def _compact_subgraphs(graph, group, count):
+    """
+    Um CompactGraph por grupo de vértices, montado direto das colunas
+
+    Args:
+        group: array com o grupo de cada id de vértice
+        count: número de grupos
+    """
+    import numpy as np
+    from graph.compact_graph import CompactGraph
+
+    n = len(group)
+    u, v, w = graph.columns()
+
+    order = np.argsort(group, kind="stable")
+    bounds = np.cumsum(np.bincount(group, minlength=count))[:-1]
+
+    # id de cada vértice dentro do seu grupo
+    starts = np.concatenate(([0], bounds))
+    local = np.empty(n, dtype=np.int64)
+    local[order] = np.arange(n) - starts[group[order]]
+
+    edge_group = group[u]
+    edges = np.argsort(edge_group, kind="stable") #arestas agrupadas, ordem original preservada
+    edge_bounds = np.cumsum(np.bincount(edge_group, minlength=count))[:-1]
+
+    names = graph.names
+    return [
+        CompactGraph.from_columns([names[i] for i in members.tolist()], local[u[e]], local[v[e]], w[e])
+        for members, e in zip(np.split(order, bounds), np.split(edges, edge_bounds))
+    ]
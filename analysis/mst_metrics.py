@@ -3,20 +3,27 @@ from collections import deque, defaultdict
 class MSTAnalyzer:
     """Classe para análise de métricas da Árvore Geradora Mínima"""
     
-    def __init__(self, mst_edges):
+    def __init__(self, mst_edges, vertices=None):
         """
         Inicializa o analisador com as arestas da MST
         
         Args:
             mst_edges: Lista de tuplas (u, v, weight) representando a MST
+                (ou uma floresta, uma árvore por componente)
+            vertices: todos os vértices do grafo, para incluir os isolados
+                (sem arestas na floresta); opcional
         """
         self.mst_edges = mst_edges
-        self.adj = self._build_adjacency_list()
+        self.adj = self._build_adjacency_list(vertices)
         self.vertices = list(self.adj.keys())
+        self._eccentricity_cache = None
+        self._components_cache = None
     
-    def _build_adjacency_list(self):
+    def _build_adjacency_list(self, vertices=None):
         """Constrói lista de adjacências a partir das arestas da MST"""
         adj = defaultdict(list)
+        for v in vertices or ():
+            adj[v] #vértices isolados também entram
         for u, v, weight in self.mst_edges:
             adj[u].append((v, weight))
             adj[v].append((u, weight))
@@ -44,9 +51,127 @@ class MSTAnalyzer:
         
         return distances
     
+    def _eccentricities(self):
+        """
+        Excentricidade de todos os vértices em O(V) (rerooting em árvore)
+
+        Para cada componente, uma passada de baixo para cima calcula as duas
+        maiores alturas de cada subárvore e outra de cima para baixo calcula
+        a maior distância "para fora" da subárvore. A excentricidade é o
+        maior dos dois valores. O resultado fica em cache, pois diâmetro,
+        centro e braço mais longo dependem dele.
+
+        Returns:
+            dict: {vertice: excentricidade}, na ordem de self.vertices
+        """
+        if self._eccentricity_cache is not None:
+            return self._eccentricity_cache
+
+        down1, down2, best_child, up = {}, {}, {}, {}
+        visited = set()
+
+        for root in self.vertices:
+            if root in visited:
+                continue
+
+            # BFS registrando a ordem e o pai de cada vértice
+            order = [root]
+            parent = {root: (None, 0)}
+            visited.add(root)
+            for u in order:
+                for v, weight in self.adj[u]:
+                    if v not in visited:
+                        visited.add(v)
+                        parent[v] = (u, weight)
+                        order.append(v)
+
+            # de baixo para cima: duas maiores alturas por vértice
+            for v in order:
+                down1[v], down2[v], best_child[v] = 0, 0, None
+            for v in reversed(order):
+                p, weight = parent[v]
+                if p is None:
+                    continue
+                height = down1[v] + weight
+                if height > down1[p]:
+                    down2[p] = down1[p]
+                    down1[p], best_child[p] = height, v
+                elif height > down2[p]:
+                    down2[p] = height
+
+            # de cima para baixo: maior distância saindo da subárvore
+            up[root] = 0
+            for v in order[1:]:
+                p, weight = parent[v]
+                sibling = down2[p] if best_child[p] == v else down1[p]
+                up[v] = weight + max(up[p], sibling)
+
+        self._eccentricity_cache = {v: max(down1[v], up[v]) for v in self.vertices}
+        return self._eccentricity_cache
+
+    def components(self):
+        """
+        Vértices de cada árvore da floresta, da maior para a menor
+
+        Returns:
+            list: listas de vértices (empates na ordem de self.vertices)
+        """
+        if self._components_cache is not None:
+            return self._components_cache
+
+        seen = set()
+        components = []
+        for root in self.vertices:
+            if root in seen:
+                continue
+            seen.add(root)
+            component = [root]
+            for u in component:
+                for v, _ in self.adj[u]:
+                    if v not in seen:
+                        seen.add(v)
+                        component.append(v)
+            components.append(component)
+
+        components.sort(key=len, reverse=True)
+        self._components_cache = components
+        return components
+
+    def analyze_components(self):
+        """
+        Métricas de cada árvore da floresta (ordem de components())
+
+        Returns:
+            list: [{'vertices', 'edges', 'weight', 'diameter', 'center', 'radius'}]
+        """
+        eccentricities = self._eccentricities()
+        weight = defaultdict(int)
+        edges = defaultdict(int)
+
+        index = {v: i for i, component in enumerate(self.components()) for v in component}
+        for u, _, w in self.mst_edges:
+            weight[index[u]] += w
+            edges[index[u]] += 1
+
+        result = []
+        for i, component in enumerate(self.components()):
+            center = min(component, key=eccentricities.get)
+            result.append({
+                'vertices': len(component),
+                'edges': edges[i],
+                'weight': weight[i],
+                'diameter': max(eccentricities[v] for v in component),
+                'center': center,
+                'radius': eccentricities[center],
+            })
+        return result
+
     def calculate_diameter(self):
         """
         Calcula o diâmetro da MST (maior distância entre quaisquer dois vértices)
+
+        Usa as excentricidades (O(V)): a primeira extremidade é o primeiro
+        vértice com excentricidade máxima e a outra sai de uma única BFS.
         
         Returns:
             dict: {
@@ -57,12 +182,14 @@ class MSTAnalyzer:
         """
         max_distance = 0
         diameter_vertices = None
-        
-        # Para cada vértice, calcular distâncias para todos os outros
-        for vertex in self.vertices:
+
+        eccentricities = self._eccentricities()
+
+        if eccentricities:
+            vertex = max(eccentricities, key=eccentricities.get)
             distances = self._bfs_distances(vertex)
-            
-            # Encontrar a maior distância a partir deste vértice
+
+            # Primeiro vértice (na ordem da BFS) à distância máxima
             for target, dist in distances.items():
                 if dist > max_distance:
                     max_distance = dist
@@ -80,6 +207,9 @@ class MSTAnalyzer:
         
         Centro: vértice que minimiza a distância máxima para qualquer outro vértice
         Raio: a menor das distâncias máximas (excentricidade do centro)
+
+        Numa floresta, centro e raio são os da maior árvore (ver
+        analyze_components para as demais); as excentricidades são de todos.
         
         Returns:
             dict: {
@@ -89,17 +219,11 @@ class MSTAnalyzer:
                 'all_eccentricities': {vertice: excentricidade}
             }
         """
-        eccentricities = {}
-        
-        # Calcular excentricidade de cada vértice
-        # (maior distância daquele vértice para qualquer outro)
-        for vertex in self.vertices:
-            distances = self._bfs_distances(vertex)
-            eccentricity = max(distances.values()) if distances else 0
-            eccentricities[vertex] = eccentricity
+        eccentricities = dict(self._eccentricities())
         
         # Centro é o vértice com menor excentricidade
-        center = min(eccentricities, key=eccentricities.get)
+        candidates = self.components()[0] if len(self.components()) > 1 else eccentricities
+        center = min(candidates, key=eccentricities.get)
         radius = eccentricities[center]
         
         return {
@@ -165,14 +289,22 @@ class MSTAnalyzer:
         }
     
     def _find_longest_branch(self):
-        """Encontra o braço (caminho simples) mais longo na MST"""
+        """
+        Encontra o braço (caminho simples) mais longo na MST
+
+        O braço mais longo de uma árvore é um diâmetro: ele começa no
+        primeiro vértice de excentricidade máxima (já calculada em O(V)) e
+        termina no ponto mais distante alcançado por uma única DFS iterativa.
+        """
         max_length = 0
         longest_path = None
         start_vertex = None
         end_vertex = None
-        
-        # Para cada vértice, fazer DFS e encontrar o caminho mais longo
-        for vertex in self.vertices:
+
+        eccentricities = self._eccentricities()
+
+        if eccentricities:
+            vertex = max(eccentricities, key=eccentricities.get)
             result = self._dfs_longest_path(vertex)
             if result['length'] > max_length:
                 max_length = result['length']
@@ -188,28 +320,43 @@ class MSTAnalyzer:
         }
     
     def _dfs_longest_path(self, start):
-        """DFS para encontrar o caminho mais longo a partir de um vértice"""
+        """
+        DFS iterativa para encontrar o caminho mais longo a partir de um vértice
+
+        Usa uma pilha explícita (sem limite de recursão) e ponteiros para o
+        pai; o caminho só é montado uma vez, no final.
+        """
         max_length = 0
-        longest_path = [start]
         end_vertex = start
-        
-        def dfs(v, visited, current_length, path):
-            nonlocal max_length, longest_path, end_vertex
-            
-            if current_length > max_length:
-                max_length = current_length
-                longest_path = path.copy()
-                end_vertex = v
-            
-            for neighbor, weight in self.adj[v]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    path.append(neighbor)
-                    dfs(neighbor, visited, current_length + weight, path)
-                    path.pop()
-                    visited.remove(neighbor)
-        
-        dfs(start, {start}, 0, [start])
+
+        parent = {start: None}
+        distance = {start: 0}
+        stack = [(start, iter(self.adj[start]))]
+
+        while stack:
+            v, neighbors = stack[-1]
+
+            for neighbor, weight in neighbors:
+                if neighbor not in distance:
+                    distance[neighbor] = distance[v] + weight
+                    parent[neighbor] = v
+
+                    if distance[neighbor] > max_length:
+                        max_length = distance[neighbor]
+                        end_vertex = neighbor
+
+                    stack.append((neighbor, iter(self.adj[neighbor])))
+                    break
+            else:
+                stack.pop()
+
+        # Reconstrução do caminho pelos pais
+        longest_path = []
+        v = end_vertex
+        while v is not None:
+            longest_path.append(v)
+            v = parent[v]
+        longest_path.reverse()
         
         return {
             'length': max_length,
@@ -217,6 +364,18 @@ class MSTAnalyzer:
             'end': end_vertex
         }
     
+    def path_index(self):
+        """
+        Índice de consultas de caminho (aresta mais cara, distância, caminho)
+        sobre esta MST, em O(log V) por consulta
+
+        Returns:
+            PathQueryIndex
+        """
+        from analysis.path_queries import PathQueryIndex
+
+        return PathQueryIndex(self.mst_edges)
+    
     def _calculate_variance(self, values):
         """Calcula a variância de uma lista de valores"""
         if not values:
@@ -239,10 +398,12 @@ class MSTAnalyzer:
             'diameter': diameter_info,
             'center_and_radius': center_info,
             'balance': balance_info,
+            'components': self.analyze_components(),
             'summary': {
                 'total_vertices': len(self.vertices),
                 'total_edges': len(self.mst_edges),
-                'total_weight': sum(w for _, _, w in self.mst_edges)
+                'total_weight': sum(w for _, _, w in self.mst_edges),
+                'components': len(self.components())
             }
         }
     
@@ -260,6 +421,11 @@ class MSTAnalyzer:
         print(f"Total de vértices: {analysis['summary']['total_vertices']}")
         print(f"Total de arestas: {analysis['summary']['total_edges']}")
         print(f"Peso total da MST: {analysis['summary']['total_weight']}")
+        if analysis['summary']['components'] > 1:
+            print(f"Componentes (floresta): {analysis['summary']['components']}")
+            for i, comp in enumerate(analysis['components'], 1):
+                print(f"  {i}. {comp['vertices']} vértices, peso {comp['weight']}, "
+                      f"diâmetro {comp['diameter']}, centro {comp['center']}")
         
         # Diâmetro
         print("\n📏 DIÂMETRO DA MST")
@@ -0,0 +1,315 @@
+import numpy as np
+
+
+class PathQueryIndex:
+    """
+    Índice de consultas de caminho sobre uma MST (binary lifting)
+
+    Construído uma vez em O(V log V); depois responde em O(log V):
+    - path_max(u, v): aresta mais cara no caminho da árvore entre u e v
+    - path_length(u, v): distância na árvore entre u e v
+    - path(u, v): vértices do caminho
+
+    As versões *_many recebem uma lista de pares de nomes e respondem todas
+    as consultas de forma vetorizada; as versões *_ids recebem os pares já
+    convertidos em ids do índice (array k x 2, ver pair_ids). Pares em
+    componentes diferentes (floresta) não têm caminho: None nas consultas
+    unitárias e NaN nas vetorizadas.
+
+    min_cover faz o caminho inverso: para cada aresta da árvore, o par mais
+    leve cujo caminho passa por ela (a substituta, se a aresta sair).
+    """
+
+    def __init__(self, mst_edges):
+
+        self.names = []
+        self.index = {}
+        adj = []
+
+        def vertex_id(name):
+            i = self.index.get(name)
+            if i is None:
+                i = self.index[name] = len(self.names)
+                self.names.append(name)
+                adj.append([])
+            return i
+
+        integer = True
+        for u, v, weight in mst_edges:
+            a, b = vertex_id(u), vertex_id(v)
+            adj[a].append((b, weight))
+            adj[b].append((a, weight))
+            integer = integer and isinstance(weight, int)
+
+        self.integer = integer
+        n = len(self.names)
+
+        # BFS a partir de uma raiz por componente
+        parent = list(range(n))
+        parent_weight = [float("-inf")] * n
+        depth = [0] * n
+        dist = [0] * n
+        component = [-1] * n
+        order = []
+
+        for root in range(n):
+            if component[root] != -1:
+                continue
+            component[root] = root
+            start = len(order)
+            order.append(root)
+            for u in _iter_from(order, start):
+                for v, weight in adj[u]:
+                    if component[v] == -1:
+                        component[v] = root
+                        parent[v] = u
+                        parent_weight[v] = weight
+                        depth[v] = depth[u] + 1
+                        dist[v] = dist[u] + weight
+                        order.append(v)
+
+        self.order = np.array(order, dtype=np.int64)
+        self.parent = np.array(parent, dtype=np.int64)
+        self.parent_weight = np.array(parent_weight, dtype=np.float64)
+        self.depth = np.array(depth, dtype=np.int64)
+        self.dist = np.array(dist, dtype=np.float64)
+        self.component = np.array(component, dtype=np.int64)
+
+        # tabelas: up[k][v] = ancestral 2^k acima; top[k][v] = vértice cuja aresta
+        # para o pai é a mais cara nesse trecho; heavy[k][v] = peso dela
+        levels = max(1, int(self.depth.max()).bit_length()) if n else 1
+        up = [self.parent]
+        heavy = [self.parent_weight]
+        top = [np.arange(n, dtype=np.int64)]
+
+        for _ in range(1, levels):
+            prev_up, prev_heavy, prev_top = up[-1], heavy[-1], top[-1]
+            higher = prev_heavy[prev_up] > prev_heavy
+            up.append(prev_up[prev_up])
+            heavy.append(np.where(higher, prev_heavy[prev_up], prev_heavy))
+            top.append(np.where(higher, prev_top[prev_up], prev_top))
+
+        self.up = np.array(up)
+        self.heavy = np.array(heavy)
+        self.top = np.array(top)
+
+    def ids(self, vertices):
+        """Converte nomes de vértices em ids do índice"""
+        index = self.index
+        return np.fromiter((index[v] for v in vertices), dtype=np.int64, count=len(vertices))
+
+    def path_max(self, u, v):
+        """Peso da aresta mais cara no caminho entre u e v"""
+        _, heavy, _, connected = self._query(*self._pair(u, v))
+        if not connected[0] or u == v:
+            return None
+        return self._number(heavy[0])
+
+    def path_max_edge(self, u, v):
+        """Aresta (x, pai_de_x, peso) mais cara no caminho entre u e v"""
+        _, heavy, top, connected = self._query(*self._pair(u, v))
+        if not connected[0] or u == v:
+            return None
+        x = int(top[0])
+        return (self.names[x], self.names[self.parent[x]], self._number(heavy[0]))
+
+    def path_length(self, u, v):
+        """Distância na árvore entre u e v"""
+        a, b = self._pair(u, v)
+        lca, _, _, connected = self._query(a, b)
+        if not connected[0]:
+            return None
+        return self._number(self.dist[a[0]] + self.dist[b[0]] - 2 * self.dist[lca[0]])
+
+    def lca(self, u, v):
+        """Menor ancestral comum de u e v (com a raiz escolhida pelo índice)"""
+        lca, _, _, connected = self._query(*self._pair(u, v))
+        return self.names[lca[0]] if connected[0] else None
+
+    def path(self, u, v):
+        """Vértices do caminho de u até v na árvore"""
+        a, b = self._pair(u, v)
+        lca, _, _, connected = self._query(a, b)
+        if not connected[0]:
+            return None
+
+        lca = int(lca[0])
+        parent = self.parent
+        left, right = [], []
+
+        x = int(a[0])
+        while x != lca:
+            left.append(x)
+            x = int(parent[x])
+        x = int(b[0])
+        while x != lca:
+            right.append(x)
+            x = int(parent[x])
+
+        return [self.names[x] for x in left + [lca] + right[::-1]]
+
+    def path_max_many(self, pairs):
+        """Peso máximo no caminho de cada par (NaN sem caminho ou com u == v)"""
+        return self.path_max_many_ids(self.pair_ids(pairs))
+
+    def path_length_many(self, pairs):
+        """Distância na árvore de cada par (NaN sem caminho)"""
+        return self.path_length_many_ids(self.pair_ids(pairs))
+
+    def lca_many(self, pairs):
+        """Id do menor ancestral comum de cada par (-1 sem caminho)"""
+        return self.lca_many_ids(self.pair_ids(pairs))
+
+    def path_max_edges(self, pairs):
+        """
+        Aresta mais cara no caminho de cada par, identificada pelo vértice
+        de baixo (a aresta é v -> parent[v]); -1 sem caminho ou com u == v
+        """
+        return self.path_max_edges_ids(self.pair_ids(pairs))
+
+    def min_cover(self, pairs, weights):
+        """Ver min_cover_ids; aqui os pares são nomes de vértices"""
+        return self.min_cover_ids(self.pair_ids(pairs), weights)
+
+    def pair_ids(self, pairs):
+        """Converte pares de nomes de vértices (k x 2) em ids do índice"""
+        flat = [v for pair in pairs for v in pair]
+        return self.ids(flat).reshape(-1, 2)
+
+    # versões *_ids: os pares já são ids do índice (array k x 2), sem conversão
+
+    def path_max_many_ids(self, pairs):
+        a, b = _columns(pairs)
+        _, heavy, _, connected = self._query(a, b)
+        return np.where(connected & (a != b), heavy, np.nan)
+
+    def path_length_many_ids(self, pairs):
+        a, b = _columns(pairs)
+        lca, _, _, connected = self._query(a, b)
+        return np.where(connected, self.dist[a] + self.dist[b] - 2 * self.dist[lca], np.nan)
+
+    def lca_many_ids(self, pairs):
+        a, b = _columns(pairs)
+        lca, _, _, connected = self._query(a, b)
+        return np.where(connected, lca, -1)
+
+    def path_max_edges_ids(self, pairs):
+        a, b = _columns(pairs)
+        _, _, top, connected = self._query(a, b)
+        return np.where(connected & (a != b), top, -1)
+
+    def min_cover_ids(self, pairs, weights):
+        """
+        Para cada aresta da árvore, o par mais leve cujo caminho a contém
+
+        As arestas são identificadas pelo vértice de baixo (v -> parent[v]).
+        Os pares são percorridos em ordem crescente de peso e cada aresta
+        recebe o primeiro que passar por ela; um union-find de "saltos" pula
+        as arestas já cobertas, então o total é O(k log k + V), mais as
+        consultas de LCA.
+
+        Args:
+            pairs: array k x 2 de ids do índice
+            weights: peso de cada par
+
+        Returns:
+            np.ndarray: índice (em pairs) do par que cobre a aresta de cada
+            vértice, ou -1 (raízes e arestas que nenhum par cobre)
+        """
+        a, b = _columns(pairs)
+        lca, _, _, connected = self._query(a, b)
+
+        n = len(self.names)
+        cover = np.full(n, -1, dtype=np.int64)
+        jump = list(range(n)) #primeiro vértice ainda descoberto subindo a partir de cada um
+        parent = self.parent.tolist()
+        depth = self.depth.tolist()
+
+        def find(x):
+            root = x
+            while jump[root] != root:
+                root = jump[root]
+            while jump[x] != root: #compressão do caminho
+                jump[x], x = root, jump[x]
+            return root
+
+        order = np.argsort(np.asarray(weights), kind="stable")
+        order = order[connected[order] & (a[order] != b[order])]
+
+        for i, x, y, top in zip(order.tolist(), a[order].tolist(), b[order].tolist(), lca[order].tolist()):
+            stop = depth[top]
+            for x in (x, y):
+                x = find(x)
+                while depth[x] > stop:
+                    cover[x] = i
+                    jump[x] = parent[x]
+                    x = find(x)
+
+        return cover
+
+    def _pair(self, u, v):
+        return np.array([self.index[u]]), np.array([self.index[v]])
+
+    def _number(self, value):
+        return int(value) if self.integer else float(value)
+
+    def _query(self, a, b):
+        """
+        LCA e máximo do caminho para vetores de pares (a[i], b[i])
+
+        Returns:
+            tuple: (lca, peso_maximo, vertice_da_aresta_maxima, conectado)
+        """
+        up, heavy, top = self.up, self.heavy, self.top
+        depth = self.depth
+
+        connected = self.component[a] == self.component[b]
+        swap = depth[a] < depth[b] #a passa a ser o mais profundo
+        a, b = np.where(swap, b, a), np.where(swap, a, b)
+
+        best = np.full(len(a), -np.inf)
+        best_top = a.copy()
+
+        def absorb(x, k, mask): #incorpora o trecho de 2^k arestas acima de x
+            candidate = heavy[k][x]
+            higher = mask & (candidate > best)
+            best[higher] = candidate[higher]
+            best_top[higher] = top[k][x][higher]
+
+        # sobe o mais profundo até a mesma profundidade
+        diff = depth[a] - depth[b]
+        for k in range(len(up)):
+            jump = ((diff >> k) & 1).astype(bool) & connected
+            if jump.any():
+                absorb(a, k, jump)
+                a = np.where(jump, up[k][a], a)
+
+        # sobe os dois juntos enquanto os ancestrais forem diferentes
+        for k in reversed(range(len(up))):
+            move = (up[k][a] != up[k][b]) & connected
+            if move.any():
+                absorb(a, k, move)
+                absorb(b, k, move)
+                a = np.where(move, up[k][a], a)
+                b = np.where(move, up[k][b], b)
+
+        last = (a != b) & connected
+        absorb(a, 0, last)
+        absorb(b, 0, last)
+        lca = np.where(last, up[0][a], a)
+
+        return lca, best, best_top, connected
+
+
+def _columns(pairs):
+    """Colunas (a, b) de um array k x 2 de ids"""
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _iter_from(items, start):
+    """Percorre uma lista que cresce durante a iteração (fila da BFS)"""
+    i = start
+    while i < len(items):
+        yield items[i]
+        i += 1
@@ -0,0 +1,429 @@
+"""
+Cenários "e se" sobre a MST: arestas indisponíveis e mudanças de custo
+
+O ScenarioEngine calcula uma única vez, sobre o grafo base:
+
+- a MST (floresta) base, pelas mesmas regras de desempate do Kruskal
+- para cada aresta fora da árvore, a aresta mais cara do seu caminho na
+  árvore (PathQueryIndex.path_max_edges_ids)
+- para cada aresta da árvore, a substituta: a aresta fora da árvore mais
+  leve que cruza o corte dela (PathQueryIndex.min_cover_ids)
+
+Com isso um cenário de uma aresta sai em O(1): uma aresta da árvore que
+sai ou encarece só troca de lugar com a substituta, e uma aresta de fora
+que barateia só entra no lugar da mais cara do seu caminho. Cenários com
+várias arestas cortam da árvore as arestas que saíram ou encareceram; os
+pedaços restantes continuam na MST (propriedade do corte) e só são
+religados por um Kruskal sobre os pedaços, com as arestas que cruzam entre
+eles já em ordem de peso. Arestas de fora que ficaram mais baratas entram
+por um último Kruskal restrito à árvore resultante mais essas arestas.
+"""
+import heapq
+import os
+from operator import itemgetter
+
+import numpy as np
+
+# abaixo disso o custo de subir o pool supera o ganho do paralelismo
+PARALLEL_MIN_SCENARIOS = 2000
+
+# operações aceitas em um cenário
+OPERATIONS = ("remove", "set", "scale")
+
+_engine = None # ScenarioEngine de cada processo do pool
+
+
+class ScenarioEngine:
+    """
+    Avalia cenários de remoção e mudança de custo sem recalcular a MST
+
+    Um cenário é uma lista de mudanças, cada uma uma tupla:
+        ("remove", u, v)          a ligação u-v fica indisponível
+        ("set", u, v, peso)       novo custo
+        ("scale", u, v, fator)    custo multiplicado (1.3 = 30% mais caro)
+
+    Mudanças valem para todas as arestas entre u e v (arestas paralelas) e
+    são aplicadas em ordem, então ("set", ...) seguido de ("scale", ...)
+    sobre a mesma ligação se acumulam.
+
+    Args:
+        graph: Graph ou CompactGraph base
+    """
+
+    def __init__(self, graph):
+        from algorithms.union_find import UnionFind
+        from analysis.path_queries import PathQueryIndex
+
+        self.edges = list(graph.edges)
+        self.weights = [w for _, _, w in self.edges]
+        m = len(self.edges)
+
+        # MST base sobre índices de arestas (mesma ordem estável do kruskal)
+        uf = UnionFind(graph.vertices())
+        tree = []
+        for i in sorted(range(m), key=self.weights.__getitem__):
+            u, v, _ = self.edges[i]
+            if uf.union(u, v):
+                tree.append(i)
+
+        self.tree = tree
+        self.in_tree = np.zeros(m, dtype=bool)
+        self.in_tree[tree] = True
+        self.cost = sum(self.weights[i] for i in tree)
+        self.index = index = PathQueryIndex([self.edges[i] for i in tree])
+
+        # extremos de cada aresta no índice (-1: vértice sem arestas na árvore, só laços)
+        ids = index.index
+        self.ea = np.fromiter((ids.get(u, -1) for u, _, _ in self.edges), dtype=np.int64, count=m)
+        self.eb = np.fromiter((ids.get(v, -1) for _, v, _ in self.edges), dtype=np.int64, count=m)
+        weight = np.array(self.weights, dtype=np.float64)
+
+        # aresta da árvore <-> vértice de baixo (a aresta é x -> parent[x])
+        tree = np.array(tree, dtype=np.int64)
+        a, b = self.ea[tree], self.eb[tree]
+        child = np.where(index.parent[a] == b, a, b)
+        self.edge_of_child = np.full(len(index.names), -1, dtype=np.int64)
+        self.edge_of_child[child] = tree
+        self.child = np.full(m, -1, dtype=np.int64)
+        self.child[tree] = child
+
+        # arestas fora da árvore (sem laços), em ordem crescente de peso
+        non_tree = np.flatnonzero(~self.in_tree & (self.ea != self.eb) & (self.ea >= 0))
+        non_tree = non_tree[np.argsort(weight[non_tree], kind="stable")]
+        self.non_tree = non_tree
+        self.nt_weight = weight[non_tree]
+        self.nt_position = np.full(m, -1, dtype=np.int64)
+        self.nt_position[non_tree] = np.arange(len(non_tree))
+
+        pairs = np.column_stack((self.ea[non_tree], self.eb[non_tree]))
+        self.path_max = np.full(m, -1, dtype=np.int64) #aresta da árvore mais cara do caminho
+        self.replacement = np.full(m, -1, dtype=np.int64) #substituta de cada aresta da árvore
+
+        if len(non_tree):
+            self.path_max[non_tree] = self.edge_of_child[index.path_max_edges_ids(pairs)]
+            cover = index.min_cover_ids(pairs, self.nt_weight)
+            covered = child[cover[child] >= 0]
+            self.replacement[self.edge_of_child[covered]] = non_tree[cover[covered]]
+
+        # pré-ordem da árvore: a subárvore de x ocupa tin[x] .. tin[x] + size[x] - 1
+        self.tin, self.size = _preorder(index.order.tolist(), index.parent.tolist())
+        self.pre_root = np.empty(len(index.names), dtype=np.int64)
+        self.pre_root[self.tin] = index.component
+
+        # ligação (u, v), na orientação do arquivo -> índices das arestas
+        self.lookup = {}
+        for i, (u, v, _) in enumerate(self.edges):
+            self.lookup.setdefault((u, v), []).append(i)
+
+    def evaluate(self, scenario):
+        """
+        Nova MST de um cenário, em relação à base
+
+        Returns:
+            dict: {
+                "cost": custo da nova MST (floresta),
+                "delta": cost - custo base,
+                "removed": arestas (u, v, peso_original) que saem da árvore,
+                "added": arestas (u, v, peso_novo) que entram,
+                "disconnected": ligações perdidas sem substituta (cada uma
+                    parte uma componente em duas)
+            }
+        """
+        changes = self._resolve(scenario)
+
+        if len(changes) == 1:
+            (i, weight), = changes.items()
+            return self._single(i, weight)
+
+        return self._multiple(changes)
+
+    def evaluate_many(self, scenarios, workers=None, min_parallel=PARALLEL_MIN_SCENARIOS):
+        """
+        Avalia vários cenários independentes, em paralelo quando compensa
+
+        Args:
+            scenarios: sequência de cenários (ver evaluate)
+            workers: número de processos (padrão: os.cpu_count())
+            min_parallel: abaixo disso tudo roda no processo atual
+
+        Returns:
+            list: resultado de evaluate para cada cenário, na mesma ordem
+        """
+        scenarios = list(scenarios)
+        workers = min(workers or os.cpu_count() or 1, len(scenarios))
+
+        if workers <= 1 or len(scenarios) < min_parallel:
+            return [self.evaluate(scenario) for scenario in scenarios]
+
+        from multiprocessing import Pool
+
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        with Pool(workers, initializer=_init_engine, initargs=(self,)) as pool:
+            return pool.map(_evaluate, scenarios, chunksize=chunksize)
+
+    def _single(self, i, weight):
+        """Uma aresta alterada: resposta direta pelas tabelas pré-calculadas"""
+        old = self.weights[i]
+        edge = self.edges[i]
+
+        if self.in_tree[i]:
+            if weight is not None and weight <= old: #continua na árvore
+                return self._result(weight - old)
+
+            r = int(self.replacement[i])
+            if r >= 0 and (weight is None or weight > self.weights[r]):
+                return self._result(self.weights[r] - old, [edge], [self.edges[r]])
+
+            if weight is None: #sem substituta: a componente se parte
+                return self._result(-old, [edge], disconnected=1)
+            return self._result(weight - old)
+
+        t = int(self.path_max[i])
+        if weight is None or weight >= old or t < 0 or weight >= self.weights[t]:
+            return self._result(0)
+
+        u, v, _ = edge
+        return self._result(weight - self.weights[t], [self.edges[t]], [(u, v, weight)])
+
+    def _multiple(self, changes):
+        """Várias arestas alteradas: religa os pedaços da árvore e insere as que baratearam"""
+        weights = self.weights
+        in_tree = self.in_tree
+
+        cut = [] # arestas da árvore que saíram ou encareceram
+        extra = [] # (peso, aresta) candidatas com peso novo
+        cheaper = {} # arestas de fora que ficaram mais baratas
+        delta = 0
+
+        for i, weight in changes.items():
+            if in_tree[i]:
+                if weight is not None and weight <= weights[i]:
+                    delta += weight - weights[i]
+                    continue
+                cut.append(i)
+                if weight is not None:
+                    extra.append((weight, i))
+            elif weight is not None and self.nt_position[i] >= 0:
+                if weight < weights[i]:
+                    cheaper[i] = weight #na religação entra com o peso antigo
+                else:
+                    extra.append((weight, i))
+
+        chosen, disconnected = self._reconnect(cut, extra, changes) if cut else ({}, 0)
+
+        if not cheaper:
+            cost = self.cost + delta - sum(weights[i] for i in cut) + sum(chosen.values())
+            removed = [self.edges[i] for i in cut if i not in chosen]
+            added = [self._edge(i, w) for i, w in chosen.items() if not in_tree[i]]
+            return self._result(cost - self.cost, removed, added, disconnected)
+
+        return self._insert(changes, cut, chosen, cheaper, disconnected)
+
+    def _insert(self, changes, cut, chosen, cheaper, disconnected):
+        """
+        Insere as arestas que baratearam na árvore religada
+
+        A árvore é comprimida na árvore virtual dos vértices tocados (pontas
+        das arestas alteradas e escolhidas, mais os LCAs). Cada trecho sem
+        mudanças entre dois vértices virtuais só pode perder sua aresta mais
+        cara, então vira uma aresta com esse peso e o Kruskal final roda
+        sobre O(k) arestas em vez da árvore inteira.
+        """
+        index = self.index
+        weights, in_tree, tin = self.weights, self.in_tree, self.tin
+        ea, eb = self.ea, self.eb
+
+        cut = set(cut)
+        extras = dict(chosen)
+        extras.update(cheaper) #com o peso novo
+        touched = [i for i in changes if in_tree[i]] + list(extras)
+
+        keys = np.unique(np.concatenate((ea[touched], eb[touched])))
+        keys = keys[np.argsort(tin[keys])]
+        lca = index.lca_many_ids(np.column_stack((keys[:-1], keys[1:])))
+        nodes = np.unique(np.concatenate((keys, lca[lca >= 0])))
+        nodes = nodes[np.argsort(tin[nodes])]
+
+        # pai virtual de cada nó: LCA com o anterior na pré-ordem
+        below, above = nodes[1:], index.lca_many_ids(np.column_stack((nodes[:-1], nodes[1:])))
+        linked = above >= 0
+        below, above = below[linked], above[linked]
+        heaviest = self.edge_of_child[index.path_max_edges_ids(np.column_stack((below, above)))]
+        single = index.depth[below] - index.depth[above] == 1
+
+        # (peso, aresta, ponta, ponta); um trecho liga os dois nós virtuais
+        candidates = [(w, i, int(ea[i]), int(eb[i])) for i, w in extras.items()]
+        for x, y, e, one in zip(below.tolist(), above.tolist(), heaviest.tolist(), single.tolist()):
+            t = int(self.edge_of_child[x])
+            if one and t in changes: #a própria aresta alterada
+                if t not in cut:
+                    candidates.append((changes[t], t, x, y))
+            else:
+                candidates.append((weights[e], e, x, y))
+
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                x = parent[x]
+            return x
+
+        final = {}
+        for weight, i, x, y in sorted(candidates, key=itemgetter(0)):
+            x, y = find(x), find(y)
+            if x != y:
+                parent[x] = y
+                final[i] = weight
+
+        # aresta da árvore base sai se era candidata (cortada, alterada ou
+        # máxima de um trecho) e o Kruskal não a escolheu
+        dropped = [i for _, i, _, _ in candidates if in_tree[i] and i not in final] + \
+                  [i for i in cut if i not in final]
+        dropped = list(dict.fromkeys(dropped))
+
+        cost = self.cost
+        for i, weight in changes.items():
+            if in_tree[i] and i not in cut: #ficou mais barata ou igual
+                cost += weight - weights[i]
+        for i in dropped:
+            cost -= changes[i] if i in changes and i not in cut else weights[i]
+        added = [self._edge(i, w) for i, w in final.items() if not in_tree[i]]
+        cost += sum(w for _, _, w in added)
+        cost += sum(w - weights[i] for i, w in final.items() if i in cut) #voltou com o peso novo
+
+        return self._result(cost - self.cost, [self.edges[i] for i in dropped], added, disconnected)
+
+    def _reconnect(self, cut, extra, changes):
+        """
+        Religa os pedaços da árvore sem as arestas cortadas
+
+        Returns:
+            tuple: ({aresta: peso} escolhidas, cortes que ficaram sem religação)
+        """
+        tin, size = self.tin, self.size
+        depth = self.index.depth
+
+        # pedaço de cada vértice: o corte mais profundo acima dele (ou a raiz)
+        children = sorted((int(self.child[i]) for i in cut), key=depth.__getitem__)
+        label = self.pre_root.copy()
+        for c in children:
+            label[tin[c]:tin[c] + size[c]] = c
+        label = label[tin]
+
+        # arestas de fora sem mudança que cruzam entre pedaços, já em ordem de peso
+        a, b = self.ea[self.non_tree], self.eb[self.non_tree]
+        crossing = label[a] != label[b]
+        for i, weight in changes.items():
+            if self.nt_position[i] >= 0 and (weight is None or weight >= self.weights[i]):
+                crossing[self.nt_position[i]] = False #removida, ou entra em `extra`
+        crossing = np.flatnonzero(crossing)
+
+        weights, non_tree = self.weights, self.non_tree
+
+        def unchanged(): #lidas em blocos: em geral poucas bastam para religar tudo
+            for start in range(0, len(crossing), 1024):
+                for i in non_tree[crossing[start:start + 1024]].tolist():
+                    yield weights[i], i
+
+        parent = {}
+
+        def find(x):
+            while parent.get(x, x) != x:
+                x = parent[x]
+            return x
+
+        chosen = {}
+        needed = len(cut)
+        ea, eb = self.ea, self.eb
+
+        for weight, i in heapq.merge(unchanged(), sorted(extra), key=itemgetter(0)):
+            x, y = find(int(label[ea[i]])), find(int(label[eb[i]]))
+            if x != y:
+                parent[x] = y
+                chosen[i] = weight
+                if len(chosen) == needed:
+                    break
+
+        return chosen, needed - len(chosen)
+
+    def _resolve(self, scenario):
+        """Cenário -> {índice da aresta: peso novo, ou None se removida}"""
+        if scenario and isinstance(scenario[0], str): #uma única mudança
+            scenario = [scenario]
+
+        changes = {}
+        for change in scenario:
+            operation, u, v, *value = change
+            if operation not in OPERATIONS:
+                raise ValueError(f"operação desconhecida: {operation!r} (use {', '.join(OPERATIONS)})")
+            edges = self.lookup.get((u, v), []) + (self.lookup.get((v, u), []) if u != v else [])
+            if not edges:
+                raise ValueError(f"aresta inexistente: {u} - {v}")
+
+            for i in edges:
+                current = changes.get(i, self.weights[i])
+                if operation == "remove" or current is None:
+                    changes[i] = None
+                elif operation == "set":
+                    changes[i] = value[0]
+                else:
+                    changes[i] = current * value[0]
+
+        return changes
+
+    def _edge(self, i, weight):
+        u, v, _ = self.edges[i]
+        return (u, v, weight)
+
+    def _result(self, delta, removed=(), added=(), disconnected=0):
+        return {
+            "cost": self.cost + delta,
+            "delta": delta,
+            "removed": list(removed),
+            "added": list(added),
+            "disconnected": disconnected,
+        }
+
+
+def evaluate_scenarios(graph, scenarios, workers=None):
+    """Atalho: monta o ScenarioEngine do grafo e avalia todos os cenários"""
+    return ScenarioEngine(graph).evaluate_many(scenarios, workers)
+
+
+def _preorder(order, parent):
+    """
+    Posição de cada vértice numa pré-ordem da floresta e tamanho da subárvore
+
+    Usa a ordem de BFS do índice: os filhos de cada vértice recebem
+    posições consecutivas logo após o pai, cada um reservando o tamanho da
+    própria subárvore.
+    """
+    n = len(order)
+    size = [1] * n
+    for v in reversed(order):
+        if parent[v] != v:
+            size[parent[v]] += size[v]
+
+    tin = [0] * n
+    cursor = [0] * n
+    offset = 0
+    for v in order:
+        p = parent[v]
+        if p == v: #raiz de uma componente
+            tin[v] = offset
+            offset += size[v]
+        else:
+            tin[v] = cursor[p]
+            cursor[p] += size[v]
+        cursor[v] = tin[v] + 1
+
+    return np.array(tin, dtype=np.int64), np.array(size, dtype=np.int64)
+
+
+def _init_engine(engine):
+    global _engine
+    _engine = engine
+
+
+def _evaluate(scenario):
+    return _engine.evaluate(scenario)
@@ -0,0 +1,111 @@
+"""
+Sensibilidade de cada aresta: quanto o custo pode variar sem mudar a MST
+
+Para cada aresta o intervalo [lower, upper] de custos em que a MST base
+continua ótima (None = sem limite):
+
+- aresta da árvore: pode baratear à vontade e encarecer até o custo da
+  substituta (a aresta de fora mais leve que cruza o seu corte); sem
+  substituta (ponte) não há limite
+- aresta de fora: pode encarecer à vontade e só entra se ficar abaixo da
+  aresta mais cara do seu caminho na árvore
+- laços nunca entram, qualquer custo serve
+
+As duas tabelas vêm do ScenarioEngine (PathQueryIndex.min_cover e
+path_max_edges), então o total é O(E log V) em vez de um Kruskal por
+aresta.
+"""
+
+# colunas da tabela exportada, na ordem
+COLUMNS = ("u", "v", "weight", "in_mst", "lower", "upper", "slack", "swap_u", "swap_v", "swap_weight")
+
+# formatos de exportação
+TABLE_FORMATS = ("csv", "json", "ndjson")
+
+
+def edge_sensitivity(graph, engine=None):
+    """
+    Intervalo de tolerância de cada aresta do grafo
+
+    Args:
+        graph: Graph ou CompactGraph
+        engine: ScenarioEngine já montado para o grafo (opcional)
+
+    Returns:
+        list: um dict por aresta, na ordem de graph.edges, com as chaves de
+        COLUMNS:
+            lower/upper: limites do custo (None = sem limite)
+            slack: folga até a MST mudar (upper - weight na árvore,
+                weight - lower fora dela; None = sem limite)
+            swap_*: aresta que troca de lugar com ela no limite (a
+                substituta, ou a mais cara do caminho)
+    """
+    if engine is None:
+        from analysis.scenarios import ScenarioEngine
+        engine = ScenarioEngine(graph)
+
+    edges, weights = engine.edges, engine.weights
+    in_tree = engine.in_tree.tolist()
+    swap = [int(r) if t else int(p) for t, r, p in
+            zip(in_tree, engine.replacement.tolist(), engine.path_max.tolist())]
+
+    rows = []
+    for (u, v, weight), tree, s in zip(edges, in_tree, swap):
+        lower = upper = slack = None
+        swap_u = swap_v = swap_weight = None
+
+        if s >= 0:
+            swap_u, swap_v, swap_weight = edges[s]
+            if tree:
+                upper = swap_weight
+                slack = upper - weight
+            else:
+                lower = swap_weight
+                slack = weight - lower
+
+        rows.append({
+            "u": u, "v": v, "weight": weight, "in_mst": tree,
+            "lower": lower, "upper": upper, "slack": slack,
+            "swap_u": swap_u, "swap_v": swap_v, "swap_weight": swap_weight,
+        })
+
+    return rows
+
+
+def write_table(rows, path, format=None):
+    """
+    Grava a tabela de sensibilidade
+
+    Args:
+        rows: saída de edge_sensitivity
+        path: arquivo de destino
+        format: "csv", "json" ou "ndjson" (padrão: pela extensão, como no loader)
+
+    Returns:
+        int: número de linhas gravadas
+    """
+    import json
+    from utils.loader import _detect_format
+
+    format = format or _detect_format(path)
+    if format not in TABLE_FORMATS:
+        raise ValueError(f"formato desconhecido: {format!r} (use {', '.join(TABLE_FORMATS)})")
+
+    with open(path, "w", encoding="utf-8", newline="") as f:
+
+        if format == "csv":
+            import csv
+
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for row in rows:
+                writer.writerow(["" if row[c] is None else row[c] for c in COLUMNS]) #vazio = sem limite
+            return len(rows)
+
+        if format == "ndjson":
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            return len(rows)
+
+        json.dump(rows, f, ensure_ascii=False, indent=2)
+        return len(rows)
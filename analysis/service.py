@@ -0,0 +1,423 @@
+"""
+Serviço local de MST (HTTP sobre TCP ou socket Unix, asyncio)
+
+Rotas:
+    POST /mst     {"edges": [[u, v, peso], ...]} ou {"path": "data/x.json"},
+                  com "algorithm" opcional (nomes de ALGORITHM_NAMES ou de
+                  VARIANTS; padrão "kruskal"). Responde custo, arestas da
+                  MST e MSTAnalyzer.get_full_analysis.
+    GET  /health  {"ok": true}
+    GET  /stats   acertos, faltas e uso do cache
+
+O trabalho de CPU (carga, MST e métricas) roda num pool de processos, fora
+do laço de eventos. As respostas ficam num cache endereçado pelo conteúdo:
+a chave é o sha256 das arestas (ou do arquivo) mais o algoritmo, e o valor
+é a resposta já serializada. Um pedido de arestas repetido byte a byte é
+reconhecido pelo sha256 do corpo cru, antes de qualquer parse, então só
+custa esse hash e uma consulta ao dicionário; corpos diferentes com as
+mesmas arestas chegam à mesma chave depois do parse. O cache é LRU com
+limite de bytes. Pedidos iguais simultâneos esperam o mesmo cálculo.
+"""
+import asyncio
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+# memória padrão das respostas guardadas
+DEFAULT_CACHE_BYTES = 64 << 20
+
+# tamanho máximo aceito para o corpo de um pedido
+MAX_BODY_BYTES = 256 << 20
+
+# corpos até este tamanho têm o sha256 calculado no próprio laço de eventos (~0,5 ms)
+INLINE_HASH_BYTES = 1 << 20
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ResultCache:
+    """
+    Cache LRU de respostas serializadas, limitado em bytes
+
+    Entradas maiores que o orçamento inteiro não são guardadas. Além das
+    chaves canônicas, aceita apelidos (o sha256 do corpo cru de um pedido)
+    que somem junto com a entrada.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict() # chave -> bytes
+        self.aliases = {} # apelido -> chave
+        self.aliases_of = {} # chave -> apelidos
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        body = self.entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def lookup(self, alias):
+        """Resposta guardada sob um apelido (None, sem contar falta, se não houver)"""
+        key = self.aliases.get(alias)
+        return None if key is None else self.get(key)
+
+    def alias(self, alias, key):
+        """Registra um apelido para uma chave já guardada"""
+        if key in self.entries and alias not in self.aliases:
+            self.aliases[alias] = key
+            self.aliases_of.setdefault(key, []).append(alias)
+
+    def put(self, key, body):
+
+        if len(body) > self.max_bytes:
+            return
+
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= len(old)
+
+        self.entries[key] = body
+        self.bytes += len(body)
+
+        while self.bytes > self.max_bytes:
+            evicted_key, evicted = self.entries.popitem(last=False) #menos usada recentemente
+            self.bytes -= len(evicted)
+            self.evictions += 1
+            for alias in self.aliases_of.pop(evicted_key, ()):
+                del self.aliases[alias]
+
+    def stats(self):
+        return {
+            "entries": len(self.entries), "bytes": self.bytes, "max_bytes": self.max_bytes,
+            "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+        }
+
+
+def compute_result(source, algorithm):
+    """
+    MST e análise completa de um grafo (roda nos processos do pool)
+
+    Args:
+        source: caminho de arquivo ou lista de arestas (u, v, peso)
+        algorithm: nome em analysis.compare.VARIANTS
+    """
+    from graph.graph import Graph
+    from utils.loader import load_graph
+    from analysis.compare import mst_runner
+    from analysis.mst_metrics import MSTAnalyzer
+
+    if isinstance(source, str):
+        graph = load_graph(source)
+    else:
+        graph = Graph()
+        for u, v, weight in source:
+            graph.add_edge(u, v, weight)
+
+    mst, cost = mst_runner(graph, algorithm)()
+
+    return {
+        "algorithm": algorithm,
+        "vertices": len(graph.vertices()),
+        "edges": len(graph.edges),
+        "cost": cost,
+        "mst": mst,
+        "analysis": MSTAnalyzer(mst, graph.vertices()).get_full_analysis() if mst else None,
+    }
+
+
+class MSTService:
+    """
+    Servidor asyncio com o pool de processos e o cache de resultados
+
+    Uso:
+        service = MSTService(workers=4)
+        await service.start(port=8765)          # ou start_unix("/tmp/mst.sock")
+        await service.serve_forever()
+
+    Args:
+        workers: processos do pool (padrão: os.cpu_count())
+        cache_bytes: orçamento de memória do cache de respostas
+        executor: executor próprio (ex.: ThreadPoolExecutor em testes)
+    """
+
+    def __init__(self, workers=None, cache_bytes=DEFAULT_CACHE_BYTES, executor=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = ResultCache(cache_bytes)
+        self.executor = executor
+        self.server = None
+        self.inflight = {} # chave -> future do cálculo em andamento
+        self.file_digests = {} # caminho -> (tamanho, mtime_ns, sha256)
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Escuta em TCP; port=0 escolhe uma porta livre (ver self.port)"""
+        self._ensure_executor()
+        self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server
+
+    async def start_unix(self, path):
+        """Escuta num socket Unix"""
+        self._ensure_executor()
+        self.server = await asyncio.start_unix_server(self._handle, path)
+        return self.server
+
+    @property
+    def port(self):
+        return self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    async def solve(self, request, raw=None):
+        """
+        Resposta serializada para um pedido /mst
+
+        Args:
+            request: pedido já decodificado
+            raw: sha256 do corpo cru; para pedidos de arestas vira apelido da
+                chave, e a repetição do mesmo corpo nem precisa de parse
+
+        Returns:
+            tuple: (corpo_json_em_bytes, veio_do_cache)
+        """
+        from analysis.compare import ALGORITHM_NAMES, VARIANTS
+
+        algorithm = request.get("algorithm", "kruskal")
+        algorithm = ALGORITHM_NAMES.get(algorithm, algorithm)
+        if algorithm not in VARIANTS:
+            raise ValueError(f"algoritmo desconhecido: {request.get('algorithm')!r}")
+
+        loop = asyncio.get_running_loop()
+
+        # o hash de um arquivo (ou lista) grande levaria tempo: fora do laço de eventos
+        if "path" in request:
+            source = request["path"]
+            digest = await self._file_digest(source)
+        elif "edges" in request:
+            source = request["edges"]
+            digest = await loop.run_in_executor(None, _edges_digest, source)
+        else:
+            raise ValueError('o pedido precisa de "edges" ou "path"')
+
+        key = f"{digest}:{algorithm}"
+
+        remember = raw is not None and "path" not in request #o arquivo pode mudar; o corpo não diz
+
+        body = self.cache.get(key)
+        if body is not None:
+            if remember:
+                self.cache.alias(raw, key)
+            return body, True
+
+        pending = self.inflight.get(key)
+        if pending is not None: #mesmo grafo já em cálculo
+            return await asyncio.shield(pending), False
+
+        future = loop.create_future()
+        self.inflight[key] = future
+        try:
+            result = await loop.run_in_executor(self.executor, compute_result, source, algorithm)
+            result["key"] = key
+            body = json.dumps(result, ensure_ascii=False, default=str).encode("utf-8")
+            self.cache.put(key, body)
+            if remember:
+                self.cache.alias(raw, key)
+            future.set_result(body)
+            return body, False
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception() #evita aviso de exceção não lida
+            raise
+        finally:
+            del self.inflight[key]
+
+    async def _file_digest(self, path):
+        """
+        sha256 do arquivo, recalculado só quando tamanho ou mtime mudam
+
+        A leitura e o hash rodam no executor padrão de threads (o hashlib
+        libera o GIL), sem ocupar o pool de processos das MSTs.
+        """
+        from utils.graph_cache import file_hash
+
+        stat = os.stat(path)
+        known = self.file_digests.get(path)
+        if known is not None and known[:2] == (stat.st_size, stat.st_mtime_ns):
+            return known[2]
+
+        digest = (await asyncio.get_running_loop().run_in_executor(None, file_hash, path)).hex()
+        self.file_digests[path] = (stat.st_size, stat.st_mtime_ns, digest)
+        return digest
+
+    def _ensure_executor(self):
+        if self.executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(self.workers)
+
+    async def _handle(self, reader, writer):
+        """Uma conexão HTTP/1.1, com keep-alive"""
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+
+                status, payload, cached = await self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                _write_response(writer, status, payload, cached, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except _BadRequest as e: #corpo não lido: responde e encerra a conexão
+            _write_response(writer, e.status, _error(str(e)), False, False)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except asyncio.CancelledError: #servidor encerrado com a conexão aberta
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        """
+        Returns:
+            tuple: (status, corpo_em_bytes, veio_do_cache)
+        """
+        if path == "/health":
+            return 200, b'{"ok": true}', False
+        if path == "/stats":
+            return 200, json.dumps(self.cache.stats()).encode(), False
+        if path != "/mst":
+            return 404, _error("rota não encontrada"), False
+        if method != "POST":
+            return 405, _error("use POST"), False
+
+        # repetição byte a byte de um pedido de arestas: sem parse nem hash canônico
+        raw = await _body_digest(body)
+        payload = self.cache.lookup(raw)
+        if payload is not None:
+            return 200, payload, True
+
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict):
+                raise ValueError("o corpo deve ser um objeto JSON")
+            payload, cached = await self.solve(request, raw)
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            return 400, _error(f"{type(e).__name__}: {e}"), False
+        except Exception as e:
+            return 500, _error(f"{type(e).__name__}: {e}"), False
+
+        return 200, payload, cached
+
+
+class _BadRequest(Exception):
+    """Pedido HTTP que não dá para atender; status é o código da resposta"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_request(reader):
+    """(método, caminho, cabeçalhos, corpo) ou None quando a conexão fecha"""
+    line = await reader.readline()
+    if not line.strip():
+        return None
+
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3:
+        raise _BadRequest(400, "linha de pedido inválida")
+    method, path, _ = parts
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise _BadRequest(400, "Content-Length inválido") from None
+    if length < 0:
+        raise _BadRequest(400, "Content-Length inválido")
+    if length > MAX_BODY_BYTES:
+        raise _BadRequest(413, "corpo grande demais")
+    body = await reader.readexactly(length) if length else b""
+
+    return method.upper(), path.split("?", 1)[0], headers, body
+
+
+def _write_response(writer, status, body, cached, keep_alive):
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"X-Cache: {'hit' if cached else 'miss'}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+async def _body_digest(body):
+    """sha256 do corpo cru; corpos grandes são resumidos fora do laço de eventos"""
+    if len(body) <= INLINE_HASH_BYTES:
+        return hashlib.sha256(body).hexdigest()
+    digest = await asyncio.get_running_loop().run_in_executor(None, hashlib.sha256, body)
+    return digest.hexdigest()
+
+
+def _edges_digest(edges):
+    """sha256 da lista de arestas serializada de forma canônica"""
+    return hashlib.sha256(
+        json.dumps(edges, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def _error(message):
+    return json.dumps({"error": message}, ensure_ascii=False).encode("utf-8")
+
+
+def serve(host="127.0.0.1", port=8765, unix_path=None, workers=None, cache_bytes=DEFAULT_CACHE_BYTES):
+    """Sobe o serviço e atende até ser interrompido (Ctrl+C)"""
+
+    async def run():
+        service = MSTService(workers, cache_bytes)
+        if unix_path:
+            await service.start_unix(unix_path)
+            print(f"serviço de MST em {unix_path}")
+        else:
+            await service.start(host, port)
+            print(f"serviço de MST em http://{host}:{service.port}")
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,106 @@
+from collections import Counter
+
+import numpy as np
+
+from algorithms.union_find import UnionFind
+from analysis.path_queries import PathQueryIndex
+
+
+def verify_mst(graph, candidate_edges):
+    """
+    Verifica se uma lista de arestas é uma MST (floresta geradora mínima) do grafo
+
+    Em vez de recalcular a MST com outro algoritmo e comparar custos, usa a
+    propriedade do ciclo: a árvore é mínima se nenhuma aresta fora dela for
+    mais barata que a aresta mais cara do caminho, na árvore, entre suas
+    pontas. As consultas de máximo do caminho são feitas todas de uma vez
+    pelo PathQueryIndex, então a verificação custa O(E + V log V).
+
+    Args:
+        graph: Graph (ou CompactGraph) de origem
+        candidate_edges: lista de tuplas (u, v, peso) a verificar
+
+    Returns:
+        dict: {
+            "valid": a candidata é uma MST,
+            "spanning": é uma árvore (floresta) geradora do grafo,
+            "cost": custo total da candidata,
+            "errors": problemas estruturais encontrados,
+            "violations": arestas fora da árvore mais baratas que o caminho,
+                cada uma como {"edge": (u, v, peso), "tree_edge": (x, y, peso)}
+        }
+    """
+    candidate_edges = [tuple(edge) for edge in candidate_edges]
+    errors = []
+
+    # multiconjunto das arestas do grafo (pelos ids dos vértices): a candidata precisa sair dele
+    vertex_ids = {name: i for i, name in enumerate(graph.vertices())}
+    available = Counter(_key(vertex_ids, u, v, w) for u, v, w in graph.edges)
+    used = Counter()
+
+    tree = [] # arestas válidas da candidata
+    uf = UnionFind(graph.vertices())
+    for u, v, w in candidate_edges:
+        key = _key(vertex_ids, u, v, w)
+        used[key] += 1
+        if used[key] > available[key]:
+            errors.append(f"aresta {u} - {v} (peso {w}) não existe no grafo")
+            continue
+        if not uf.union(u, v):
+            errors.append(f"aresta {u} - {v} (peso {w}) fecha um ciclo")
+            continue
+        tree.append((u, v, w))
+
+    # o restante do multiconjunto são as arestas fora da árvore
+    remaining = available - used
+    non_tree = [
+        (u, v, w) for u, v, w in graph.edges
+        if u != v and _take(remaining, _key(vertex_ids, u, v, w))
+    ]
+
+    index = PathQueryIndex(tree)
+    ids = index.index
+
+    # arestas que ligam vértices soltos da candidata também denunciam falta de cobertura
+    loose = [(u, v, w) for u, v, w in non_tree if u not in ids or v not in ids]
+    queried = [(u, v, w) for u, v, w in non_tree if u in ids and v in ids]
+
+    pairs = np.array([(ids[u], ids[v]) for u, v, _ in queried], dtype=np.int64).reshape(-1, 2)
+    path_max = index.path_max_many_ids(pairs)
+
+    disconnected = loose + [edge for edge, heaviest in zip(queried, path_max) if np.isnan(heaviest)]
+    if disconnected:
+        u, v, _ = disconnected[0]
+        errors.append(
+            f"a candidata não cobre o grafo: {len(disconnected)} aresta(s) ligam "
+            f"partes que ela deixa separadas (ex.: {u} - {v})"
+        )
+
+    violations = [
+        {"edge": (u, v, w), "tree_edge": index.path_max_edge(u, v)}
+        for (u, v, w), heaviest in zip(queried, path_max)
+        if w < heaviest
+    ]
+
+    spanning = not errors
+
+    return {
+        "valid": spanning and not violations,
+        "spanning": spanning,
+        "cost": sum(w for _, _, w in candidate_edges),
+        "errors": errors,
+        "violations": violations,
+    }
+
+
+def _key(vertex_ids, u, v, weight):
+    a, b = vertex_ids.get(u, -1), vertex_ids.get(v, -1)
+    return (a, b, weight) if a <= b else (b, a, weight)
+
+
+def _take(counter, key):
+    """Consome uma ocorrência de key do multiconjunto, se houver"""
+    if counter[key] > 0:
+        counter[key] -= 1
+        return True
+    return False
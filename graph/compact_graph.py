@@ -0,0 +1,294 @@
+from array import array
+from collections.abc import Mapping, Sequence
+
+
+class CompactGraph:
+    """
+    Grafo compacto indexado por inteiros
+
+    Os nomes dos vértices são convertidos uma única vez em ids densos
+    (0..V-1). As arestas ficam em três colunas tipadas (u, v, peso) e a
+    adjacência é montada sob demanda no formato CSR (offsets/indices).
+
+    Mantém a mesma interface de leitura de `Graph` (`adj`, `edges`,
+    `vertices()`), sempre devolvendo os nomes originais, então `prim`,
+    `kruskal`, `MSTAnalyzer` e os visualizadores funcionam sem mudanças.
+    """
+
+    def __init__(self):
+
+        self.names = []  # id -> nome
+        self.index = {}  # nome -> id
+
+        # colunas das arestas
+        self.u = array("i")
+        self.v = array("i")
+        self.weight = array("q")  # promovida para 'd' ao receber um float
+
+        self._csr = None  # (offsets, neighbors, edge_ids), invalidado a cada add_edge
+        self._mapping = None  # dono da memória das colunas (ex.: mmap do cache), fechado em close()
+
+        self.adj = _AdjacencyView(self)
+        self.edges = _EdgeView(self)
+
+    @classmethod
+    def from_graph(cls, graph):
+        """Converte um `Graph` (ou qualquer grafo com `edges`) para a forma compacta"""
+        compact = cls()
+        for u, v, weight in graph.edges:
+            compact.add_edge(u, v, weight)
+        return compact
+
+    @classmethod
+    def from_columns(cls, names, u, v, weight, csr=None, mapping=None):
+        """
+        Monta o grafo diretamente a partir de colunas já prontas
+
+        Args:
+            names: sequência id -> nome
+            u, v: sequências de ids (array, memoryview, ...)
+            weight: sequência de pesos
+            csr: tupla opcional (offsets, neighbors, edge_ids) já calculada
+            mapping: dono da memória das colunas (ex.: o mmap do cache),
+                fechado por close()
+        """
+        compact = cls.__new__(cls)
+        compact.names = names
+        compact.index = None  # construído sob demanda em vertex_id()
+        compact.u = _from_numpy(u, "i")
+        compact.v = _from_numpy(v, "i")
+        compact.weight = _from_numpy(weight, "d" if _numpy_dtype(weight) == "float64" else "q")
+        compact._csr = csr
+        compact._mapping = mapping
+        compact.adj = _AdjacencyView(compact)
+        compact.edges = _EdgeView(compact)
+        return compact
+
+    # Registra as conexoes internando os nomes dos vértices
+    def add_edge(self, u, v, weight):
+
+        self._ensure_mutable()
+
+        iu = self._intern(u)
+        iv = self._intern(v)
+
+        if isinstance(weight, float) and self.weight.typecode != "d":
+            self.weight = array("d", self.weight)
+
+        self.u.append(iu)
+        self.v.append(iv)
+        self.weight.append(weight)
+        self._csr = None
+
+    def add_vertex(self, name):
+        """Registra um vértice (mesmo sem arestas) e devolve seu id"""
+        self._ensure_mutable()
+        return self._intern(name)
+
+    def vertices(self):
+        return self.adj.keys()
+
+    def vertex_id(self, name):
+        """Id denso de um vértice a partir do nome"""
+        return self._name_index()[name]
+
+    def num_vertices(self):
+        return len(self.names)
+
+    def num_edges(self):
+        return len(self.u)
+
+    def csr(self):
+        """
+        Adjacência no formato CSR
+
+        Returns:
+            tuple: (offsets, neighbors, edge_ids). Os vizinhos do vértice i
+            estão em neighbors[offsets[i]:offsets[i + 1]] e edge_ids aponta
+            para a linha correspondente nas colunas de arestas.
+        """
+        if self._csr is None:
+            self._csr = self._build_csr()
+        return self._csr
+
+    def neighbor_ids(self, i):
+        """Lista de (vizinho_id, peso) do vértice de id i"""
+        offsets, neighbors, edge_ids = self.csr()
+        weight = self.weight
+        start, end = offsets[i], offsets[i + 1]
+        return [(neighbors[k], weight[edge_ids[k]]) for k in range(start, end)]
+
+    def columns(self):
+        """
+        Colunas das arestas como arrays NumPy (sem cópia quando possível)
+
+        Returns:
+            tuple: (u, v, weight)
+        """
+        import numpy as np
+
+        return (
+            np.frombuffer(self.u, dtype=np.int32),
+            np.frombuffer(self.v, dtype=np.int32),
+            np.frombuffer(self.weight, dtype=_numpy_dtype(self.weight)),
+        )
+
+    def close(self):
+        """
+        Libera o arquivo mapeado de um grafo vindo do cache binário e deixa
+        o grafo vazio (nos demais não faz nada)
+
+        Arrays de columns() ainda vivos mantêm o arquivo mapeado até
+        sumirem; close() não falha por causa deles.
+        """
+        if self._mapping is None:
+            return
+        mapping, self._mapping = self._mapping, None
+
+        # solta as visões sobre o arquivo antes de fechá-lo
+        self.names, self.index = [], {}
+        self.u, self.v, self.weight = array("i"), array("i"), array("q")
+        self._csr = None
+
+        try:
+            mapping.close()
+        except BufferError: #ainda exportado para arrays de columns()
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def nbytes(self):
+        """Memória aproximada ocupada pelas colunas e pelo CSR (sem os nomes)"""
+        total = sum(_buffer_size(col) for col in (self.u, self.v, self.weight))
+        if self._csr is not None:
+            total += sum(_buffer_size(col) for col in self._csr)
+        return total
+
+    def _name_index(self):
+        if self.index is None:
+            self.index = {name: i for i, name in enumerate(self.names)}
+        return self.index
+
+    def _intern(self, name):
+
+        index = self._name_index()
+        i = index.get(name)
+        if i is None:
+            i = len(self.names)
+            index[name] = i
+            self.names.append(name)
+        return i
+
+    def _ensure_mutable(self):
+        # grafos vindos de from_columns (ex.: memória mapeada) são copiados antes de editar
+        if not isinstance(self.u, array):
+            self.u = array("i", self.u)
+            self.v = array("i", self.v)
+            typecode = "d" if _numpy_dtype(self.weight) == "float64" else "q"
+            self.weight = array(typecode, self.weight)
+        if not isinstance(self.names, list):
+            self.names = list(self.names)
+
+    def _build_csr(self):
+        """Counting sort das arestas por vértice, preservando a ordem de inserção"""
+        n = len(self.names)
+        m = len(self.u)
+        u, v = self.u, self.v
+
+        degree = array("q", bytes(8 * (n + 1)))
+        for i in u:
+            degree[i + 1] += 1
+        for i in v:
+            degree[i + 1] += 1
+
+        offsets = degree
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array("q", offsets)
+        neighbors = array("i", bytes(4 * 2 * m))
+        edge_ids = array("i", bytes(4 * 2 * m))
+
+        for e in range(m):
+            a, b = u[e], v[e]
+            k = cursor[a]
+            neighbors[k] = b
+            edge_ids[k] = e
+            cursor[a] = k + 1
+            k = cursor[b]
+            neighbors[k] = a
+            edge_ids[k] = e
+            cursor[b] = k + 1
+
+        return offsets, neighbors, edge_ids
+
+
+class _AdjacencyView(Mapping):
+    """Visão `nome -> [(vizinho, peso), ...]` montada a partir do CSR"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, name):
+        graph = self._graph
+        names = graph.names
+        return [(names[j], w) for j, w in graph.neighbor_ids(graph.vertex_id(name))]
+
+    def __iter__(self):
+        return iter(self._graph.names)
+
+    def __len__(self):
+        return len(self._graph.names)
+
+    def __contains__(self, name):
+        return name in self._graph._name_index()
+
+
+class _EdgeView(Sequence):
+    """Visão `[(u, v, peso), ...]` com os nomes originais"""
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, i):
+        graph = self._graph
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        names = graph.names
+        return (names[graph.u[i]], names[graph.v[i]], graph.weight[i])
+
+    def __iter__(self):
+        graph = self._graph
+        names = graph.names
+        return ((names[a], names[b], w) for a, b, w in zip(graph.u, graph.v, graph.weight))
+
+    def __len__(self):
+        return len(self._graph.u)
+
+
+_TYPECODE_DTYPES = {"i": "int32", "q": "int64", "d": "float64"}
+
+
+def _numpy_dtype(column):
+    dtype = getattr(column, "dtype", None) #colunas que já são arrays NumPy
+    if dtype is not None:
+        return "float64" if dtype.kind == "f" else "int64"
+    typecode = getattr(column, "typecode", None) or getattr(column, "format", None)
+    return "float64" if typecode == "d" else "int64"
+
+
+def _from_numpy(column, typecode):
+    # arrays NumPy viram array.array para que as visões devolvam números do Python
+    if getattr(column, "dtype", None) is None:
+        return column
+    converted = array(typecode)
+    converted.frombytes(column.astype(_TYPECODE_DTYPES[typecode]).tobytes())
+    return converted
+
+
+def _buffer_size(column):
+    return memoryview(column).nbytes
@@ -1,8 +1,26 @@
 class Edge :
+    __slots__ = ("u", "v", "weight") # sem __dict__ por instância
+
     def __init__(self, u, v, weight):
         self.u = u
         self.v = v
         self.weight = weight
     
     def __lt__(self, other):
-        return self.weight < other.weight
\ No newline at end of file
+        return self.weight < other.weight
+
+    def __iter__(self): # permite desempacotar como a tupla (u, v, peso)
+        return iter((self.u, self.v, self.weight))
+
+    def __eq__(self, other): # igual a outra Edge ou à tupla (u, v, peso), com o mesmo hash
+        if isinstance(other, Edge):
+            other = tuple(other)
+        elif not isinstance(other, tuple):
+            return NotImplemented
+        return (self.u, self.v, self.weight) == other
+
+    def __hash__(self):
+        return hash((self.u, self.v, self.weight))
+
+    def __repr__(self):
+        return f"Edge({self.u!r}, {self.v!r}, {self.weight!r})"
@@ -1,21 +1,49 @@
-from utils.loader import load_graph
-from analysis.compare import compare
-from visualize import generate_all_visualizations
+"""
+Linha de comando do projeto
+
+    python main.py mst data/bairros.json --algorithm prim --format json
+    python main.py analyze data/bigger.json
+    python main.py compare data/bigger.json --verify
+    python main.py forest data/distritos.json --workers 4
+    python main.py scenarios data/bigger.json -s cenarios.json
+    python main.py sensitivity data/bigger.json -o results/sensibilidade.csv
+    python main.py clusters data/bigger.json --budget 5
+    python main.py render data/bairros.json --sample accepted
+    python main.py batch "data/distritos/*.json" -o results/lote.jsonl
+    python main.py serve --port 8765 --cache-mb 128
+
+Sem subcomando roda o fluxo completo (comparação e visualizações de
+data/bairros.json). matplotlib e networkx só são importados por `render`,
+então os demais subcomandos iniciam em poucas dezenas de milissegundos.
+"""
+import argparse
+import json
+import sys
+
+from analysis.compare import ALGORITHM_NAMES as ALGORITHMS
+
+DEFAULT_GRAPH = "data/bairros.json"
+
+
+def run_all(path=DEFAULT_GRAPH):
+    """Fluxo completo: carrega, compara os algoritmos e gera as visualizações"""
+    from utils.loader import load_graph
+    from analysis.compare import compare
+    from visualize import generate_all_visualizations
 
-def main():
     print("\n" + "="*60)
     print("ANÁLISE DE ÁRVORE GERADORA MÍNIMA")
     print("="*60)
-    
+
     # Carregar grafo
     print("\n1. Carregando grafo...")
-    graph = load_graph("data/bairros.json")
+    graph = load_graph(path)
     print(f"   ✓ Grafo carregado com {len(graph.edges)} arestas")
-    
+
     # Comparar algoritmos
     print("\n2. Comparando algoritmos...")
     result = compare(graph)
-    
+
     print("\n" + "-"*60)
     print("RESULTADOS DA COMPARAÇÃO")
     print("-"*60)
@@ -24,11 +52,11 @@ def main():
         print(f"  Custo total: {data['cost']}")
         print(f"  Tempo: {data['time']:.6f}s")
     print("-"*60)
-    
+
     # Gerar visualizações
     print("\n3. Gerando visualizações...")
     generate_all_visualizations(graph)
-    
+
     print("\n" + "="*60)
     print("PROCESSO CONCLUÍDO COM SUCESSO!")
     print("="*60)
@@ -38,5 +66,300 @@ def main():
     print("  - Abra results/kruskal_animation.gif")
     print()
 
+
+def cmd_mst(args):
+    graph = _load(args)
+    mst, cost = _run_mst(graph, args)
+
+    if args.format == "json":
+        _print_json({
+            "file": args.graph, "algorithm": ALGORITHMS[args.algorithm],
+            "vertices": len(graph.vertices()), "cost": cost, "edges": mst,
+        })
+    else:
+        print(f"{ALGORITHMS[args.algorithm]}: custo total {cost} "
+              f"({len(mst)} arestas, {len(graph.vertices())} vértices)")
+        for u, v, w in mst:
+            print(f"  {u} - {v} ({w})")
+    return 0
+
+
+def cmd_analyze(args):
+    from analysis.mst_metrics import MSTAnalyzer
+
+    graph = _load(args)
+    mst, cost = _run_mst(graph, args)
+    analyzer = MSTAnalyzer(mst, graph.vertices())
+
+    if args.format == "json":
+        _print_json({
+            "file": args.graph, "algorithm": ALGORITHMS[args.algorithm], "cost": cost,
+            "analysis": analyzer.get_full_analysis(),
+        })
+    else:
+        analyzer.print_analysis()
+    return 0
+
+
+def cmd_compare(args):
+    from analysis.compare import compare
+
+    graph = _load(args)
+    names = [ALGORITHMS[name] for name in args.algorithms] if args.algorithms else None
+    result = compare(graph, names, verify=args.verify)
+
+    if args.format == "json":
+        _print_json({"file": args.graph, "results": result})
+    else:
+        for name, data in result.items():
+            valid = ""
+            if "valid" in data:
+                valid = "  válida" if data["valid"] else "  INVÁLIDA"
+            print(f"{name:<18} custo {data['cost']:<12} {data['time']:.6f}s{valid}")
+    return 0
+
+
+def cmd_forest(args):
+    from analysis.forest import spanning_forest
+
+    graph = _load(args)
+    forest = spanning_forest(graph, ALGORITHMS[args.algorithm], args.workers)
+
+    if args.format == "json":
+        _print_json({"file": args.graph, **forest.summary()})
+    else:
+        summary = forest.summary()
+        print(f"{forest.algorithm}: custo total {forest.total_cost} em "
+              f"{forest.num_components} componente(s), {summary['vertices']} vértices")
+        for i, (vertices, comp) in enumerate(zip(forest.components, summary["per_component"]), 1):
+            print(f"  {i}. custo {comp['cost']:<12} {comp['vertices']} vértices (ex.: {vertices[0]})")
+    return 0
+
+
+def cmd_scenarios(args):
+    from analysis.scenarios import ScenarioEngine
+
+    graph = _load(args)
+    with open(args.scenarios, encoding="utf-8") as f:
+        scenarios = [[tuple(change) for change in scenario] for scenario in json.load(f)]
+
+    engine = ScenarioEngine(graph)
+    results = engine.evaluate_many(scenarios, args.workers)
+
+    if args.format == "json":
+        _print_json({"file": args.graph, "base_cost": engine.cost, "results": results})
+    else:
+        print(f"custo base: {engine.cost}")
+        for i, result in enumerate(results, 1):
+            line = f"{i:>4}. custo {result['cost']} ({result['delta']:+.10g})"
+            if result["removed"]:
+                line += "  sai " + ", ".join(f"{u}-{v}" for u, v, _ in result["removed"])
+            if result["added"]:
+                line += "  entra " + ", ".join(f"{u}-{v}" for u, v, _ in result["added"])
+            if result["disconnected"]:
+                line += f"  {result['disconnected']} ligação(ões) sem substituta"
+            print(line)
+    return 0
+
+
+def cmd_sensitivity(args):
+    from analysis.sensitivity import edge_sensitivity, write_table
+
+    graph = _load(args)
+    rows = edge_sensitivity(graph)
+
+    if args.output:
+        count = write_table(rows, args.output)
+        print(f"{count} aresta(s) gravada(s) em {args.output}", file=sys.stderr)
+    elif args.format == "json":
+        _print_json({"file": args.graph, "edges": rows})
+    else:
+        for row in rows:
+            lower = "-inf" if row["lower"] is None else row["lower"]
+            upper = "+inf" if row["upper"] is None else row["upper"]
+            where = "MST " if row["in_mst"] else "fora"
+            print(f"{where} {row['u']} - {row['v']} ({row['weight']}): [{lower}, {upper}]")
+    return 0
+
+
+def cmd_clusters(args):
+    from algorithms.kruskal_tree import KruskalTree
+
+    tree = KruskalTree.from_graph(_load(args))
+    groups = tree.cut(args.k) if args.k is not None else tree.clusters(args.budget)
+
+    if args.format == "json":
+        _print_json({"file": args.graph, "budget": args.budget, "k": args.k, "clusters": groups})
+    else:
+        print(f"{len(groups)} grupo(s)")
+        for i, group in enumerate(groups, 1):
+            print(f"  {i}. {len(group)} vértice(s): {', '.join(map(str, group[:10]))}"
+                  f"{', ...' if len(group) > 10 else ''}")
+    return 0
+
+
+def cmd_render(args):
+    from visualize import generate_all_visualizations
+
+    graph = _load(args)
+    options = {
+        "sample": args.sample, "every": args.every, "max_frames": args.max_frames,
+        "max_bytes": args.max_bytes, "workers": args.workers,
+    }
+    generate_all_visualizations(graph, _start(graph, args), args.output_dir, **options)
+    return 0
+
+
+def cmd_batch(args):
+    from analysis.batch import expand_inputs, run_batch, write_jsonl
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("nenhum arquivo de grafo encontrado", file=sys.stderr)
+        return 1
+
+    records = run_batch(paths, ALGORITHMS[args.algorithm], args.workers)
+
+    if args.output == "-":
+        ok, failed = write_jsonl(records, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8") as f:
+            ok, failed = write_jsonl(records, f)
+
+    print(f"{ok} arquivo(s) processado(s), {failed} falha(s)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+def cmd_serve(args):
+    from analysis.service import serve
+
+    serve(args.host, args.port, args.unix, args.workers, args.cache_mb << 20)
+    return 0
+
+
+def _load(args):
+    from utils.loader import load_graph
+
+    return load_graph(args.graph, compact=args.compact, cache=args.cache)
+
+
+def _run_mst(graph, args):
+    from analysis.compare import mst_runner
+
+    return mst_runner(graph, ALGORITHMS[args.algorithm], _start(graph, args))()
+
+
+def _print_json(data):
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2, default=str)
+    print()
+
+
+def build_parser():
+
+    parser = argparse.ArgumentParser(description="Árvore geradora mínima de redes urbanas")
+    commands = parser.add_subparsers(dest="command")
+
+    graph_args = argparse.ArgumentParser(add_help=False)
+    graph_args.add_argument("graph", nargs="?", default=DEFAULT_GRAPH,
+                            help=f"arquivo de arestas (padrão: {DEFAULT_GRAPH})")
+    graph_args.add_argument("--compact", action="store_true", help="usa o CompactGraph")
+    graph_args.add_argument("--cache", action="store_true", help="usa o cache binário .mstcache")
+    graph_args.add_argument("--start", help="vértice inicial do Prim (padrão: o primeiro)")
+
+    output_args = argparse.ArgumentParser(add_help=False)
+    output_args.add_argument("--format", choices=["text", "json"], default="text")
+
+    algorithm_args = argparse.ArgumentParser(add_help=False)
+    algorithm_args.add_argument("--algorithm", choices=list(ALGORITHMS), default="kruskal")
+
+    mst = commands.add_parser("mst", parents=[graph_args, algorithm_args, output_args],
+                              help="calcula a MST")
+    mst.set_defaults(run=cmd_mst)
+
+    analyze = commands.add_parser("analyze", parents=[graph_args, algorithm_args, output_args],
+                                  help="MST e métricas (diâmetro, centro, balanceamento)")
+    analyze.set_defaults(run=cmd_analyze)
+
+    compare = commands.add_parser("compare", parents=[graph_args, output_args],
+                                  help="roda e cronometra as variantes")
+    compare.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS))
+    compare.add_argument("--verify", action="store_true", help="confere cada árvore com verify_mst")
+    compare.set_defaults(run=cmd_compare)
+
+    forest = commands.add_parser("forest", parents=[graph_args, algorithm_args, output_args],
+                                 help="floresta geradora mínima, por componente conexa")
+    forest.add_argument("--workers", type=int, help="processos para as componentes grandes")
+    forest.set_defaults(run=cmd_forest)
+
+    scenarios = commands.add_parser("scenarios", parents=[graph_args, output_args],
+                                    help="cenários 'e se' (remoções e mudanças de custo)")
+    scenarios.add_argument("-s", "--scenarios", required=True,
+                           help='JSON: lista de cenários, ex.: [[["remove", "A", "B"]], [["scale", "A", "C", 1.3]]]')
+    scenarios.add_argument("--workers", type=int, help="processos (padrão: número de CPUs)")
+    scenarios.set_defaults(run=cmd_scenarios)
+
+    sensitivity = commands.add_parser("sensitivity", parents=[graph_args, output_args],
+                                      help="intervalo de custo de cada aresta sem mudar a MST")
+    sensitivity.add_argument("-o", "--output", help="exporta a tabela (.csv, .json ou .ndjson)")
+    sensitivity.set_defaults(run=cmd_sensitivity)
+
+    clusters = commands.add_parser("clusters", parents=[graph_args, output_args],
+                                   help="grupos conectados por orçamento (dendrograma do Kruskal)")
+    cut = clusters.add_mutually_exclusive_group(required=True)
+    cut.add_argument("--budget", type=float, help="só ligações de custo <= budget")
+    cut.add_argument("-k", type=int, help="corta a hierarquia em k grupos")
+    clusters.set_defaults(run=cmd_clusters)
+
+    render = commands.add_parser("render", parents=[graph_args], help="gera o PNG e os GIFs")
+    render.add_argument("--output-dir", default="results")
+    render.add_argument("--sample", choices=["all", "accepted"], default="all")
+    render.add_argument("--every", type=int, help="um quadro a cada N passos")
+    render.add_argument("--max-frames", type=int, help="orçamento de quadros por GIF")
+    render.add_argument("--max-bytes", type=int, help="tamanho máximo de cada GIF")
+    render.add_argument("--workers", type=int, help="processos para renderizar")
+    render.set_defaults(run=cmd_render)
+
+    batch = commands.add_parser("batch", parents=[algorithm_args],
+                                help="MST e análise de vários arquivos em paralelo (JSON Lines)")
+    batch.add_argument("inputs", nargs="+", help="diretórios, globs ou arquivos")
+    batch.add_argument("-o", "--output", default="-", help="arquivo .jsonl (padrão: saída padrão)")
+    batch.add_argument("--workers", type=int, help="processos (padrão: número de CPUs)")
+    batch.set_defaults(run=cmd_batch)
+
+    serve = commands.add_parser("serve", help="serviço local de MST com cache de resultados")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--unix", help="socket Unix no lugar de TCP")
+    serve.add_argument("--workers", type=int, help="processos (padrão: número de CPUs)")
+    serve.add_argument("--cache-mb", type=int, default=64, help="memória do cache de respostas")
+    serve.set_defaults(run=cmd_serve)
+
+    return parser
+
+
+def main(argv=None):
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command is None:
+        run_all()
+        return 0
+
+    try:
+        return args.run(args)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"erro: {e}", file=sys.stderr)
+        return 1
+
+
+def _start(graph, args):
+    """Vértice inicial; nomes inteiros chegam como texto pela linha de comando"""
+    start = args.start
+    if start is not None and start not in graph.adj and start.lstrip("-").isdigit():
+        start = int(start)
+    return start
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
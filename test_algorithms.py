@@ -0,0 +1,266 @@
+"""
+Testes dos algoritmos de MST e das estruturas auxiliares
+"""
+import random
+
+from graph.graph import Graph
+from utils.loader import load_graph
+from algorithms.kruskal import kruskal, kruskal_vectorized
+
+
+def random_graph(n, m, seed):
+    """Multigrafo aleatório (pode ser desconexo e ter laços)"""
+    rng = random.Random(seed)
+    graph = Graph()
+    for _ in range(m):
+        graph.add_edge(rng.randrange(n), rng.randrange(n), rng.randint(1, 9))
+    return graph
+
+
+def test_kruskal_vectorized_matches_kruskal():
+    for filepath in ("data/bairros.json", "data/bigger.json"):
+        graph = load_graph(filepath)
+        assert kruskal_vectorized(graph) == kruskal(graph)
+
+    for seed in range(50):
+        graph = random_graph(30, 90, seed)
+        for batch_size in (None, 1, 7):
+            assert kruskal_vectorized(graph, batch_size) == kruskal(graph)
+
+
+def test_union_find_long_chain():
+    """Cadeias longas não devem estourar o limite de recursão"""
+    from algorithms.union_find import UnionFind
+
+    n = 50000
+    graph = Graph()
+    for i in range(n - 1, 0, -1):
+        graph.add_edge(i - 1, i, n - i)
+    mst, cost = kruskal(graph)
+    assert len(mst) == n - 1
+
+    for union_by in ("size", "rank"):
+        uf = UnionFind(n, union_by=union_by)
+        assert all(uf.union_many((i, i + 1) for i in range(n - 1)))
+        assert uf.component_count() == 1
+        assert uf.component_size(0) == n
+        assert len(set(uf.find_many(range(n)))) == 1
+
+
+def test_union_find_rollback():
+    from algorithms.union_find import UnionFind
+
+    uf = UnionFind("ABCDE", union_by="rank", rollback=True)
+    uf.union("A", "B")
+    mark = uf.checkpoint()
+    uf.union("C", "D")
+    uf.union("A", "C")
+    assert uf.connected("B", "D") and uf.component_size("A") == 4
+
+    uf.rollback()
+    assert not uf.connected("B", "D") and uf.connected("C", "D")
+
+    uf.rollback(mark)
+    assert uf.component_count() == 4
+    assert uf.connected("A", "B") and not uf.connected("C", "D")
+
+
+def test_prim_modes_agree():
+    from algorithms.prim import prim
+
+    for seed in range(30):
+        graph = random_graph(25, 120, seed)
+        start = next(iter(graph.vertices()))
+        mst, cost = prim(graph, start)
+        for mode in ("eager", "dense"):
+            mst_mode, cost_mode = prim(graph, start, mode=mode)
+            assert cost_mode == cost
+            assert len(mst_mode) == len(mst)
+
+
+def test_step_events():
+    from algorithms.prim import prim
+    from algorithms.events import EventRecorder, StepCounters, EDGE_ACCEPTED, EDGE_CONSIDERED
+
+    graph = load_graph("data/bigger.json")
+    start = next(iter(graph.vertices()))
+
+    for run in (lambda sink: prim(graph, start, sink=sink), lambda sink: kruskal(graph, sink=sink)):
+        events, counters = EventRecorder(), StepCounters()
+        mst, _ = run(lambda e: (events(e), counters(e)))
+
+        # o fluxo de eventos reproduz a árvore devolvida
+        accepted = [(e.u, e.v, e.weight) for e in events if e.kind == EDGE_ACCEPTED]
+        assert accepted == mst and run(None) == (mst, sum(w for _, _, w in mst))
+
+        counts = counters.counts
+        assert counts[EDGE_CONSIDERED] == counts["edge_accepted"] + counts["edge_rejected"]
+        assert 0 < counters.edges_scanned <= counts[EDGE_CONSIDERED]
+
+    assert counts["find"] == 2 * counts[EDGE_CONSIDERED] #kruskal: dois finds por aresta
+
+    counters = StepCounters()
+    prim(graph, start, sink=counters)
+    assert counters.counts["heap_pop"] == counters.counts["heap_push"]
+    assert counters.stale_pop_ratio == counters.counts["stale_skip"] / counters.counts["heap_pop"]
+
+
+def test_indexed_heap_decrease_key():
+    from algorithms.indexed_heap import IndexedMinHeap
+
+    heap = IndexedMinHeap()
+    for item, priority in zip("ABCDE", (5, 3, 8, 1, 7)):
+        heap.push(item, priority)
+    heap.decrease_key("C", 0)
+    heap.decrease_key("E", 2)
+
+    assert [heap.pop() for _ in range(len(heap))] == [("C", 0), ("D", 1), ("E", 2), ("B", 3), ("A", 5)]
+
+
+def test_boruvka_matches_kruskal():
+    from algorithms.boruvka import boruvka
+
+    for filepath in ("data/bairros.json", "data/bigger.json"):
+        graph = load_graph(filepath)
+        assert boruvka(graph) == kruskal(graph)
+
+    for seed in range(20):
+        graph = random_graph(30, 90, seed)
+        assert boruvka(graph, workers=1) == kruskal(graph)
+
+    # pool de processos lendo as arestas de memória compartilhada
+    graph = random_graph(200, 1500, 99)
+    assert boruvka(graph, workers=2, min_parallel_edges=0) == kruskal(graph)
+
+
+def test_euclidean_mst_matches_complete_graph():
+    import itertools
+    import math
+    from algorithms.euclidean import euclidean_mst
+
+    rng = random.Random(7)
+    for n in (0, 1, 2, 3, 25, 60):
+        points = {f"P{i}": (rng.randint(0, 20), rng.randint(0, 20)) for i in range(n)}
+
+        complete = Graph()
+        for (a, pa), (b, pb) in itertools.combinations(points.items(), 2):
+            complete.add_edge(a, b, math.dist(pa, pb))
+
+        mst, cost = euclidean_mst(points)
+        assert len(mst) == max(n - 1, 0)
+        assert math.isclose(cost, kruskal(complete)[1])
+
+    # pontos colineares não formam triangulação
+    mst, cost = euclidean_mst([("A", 0, 0), ("C", 2, 2), ("B", 1, 1)])
+    assert math.isclose(cost, 2 * math.sqrt(2))
+
+
+def test_dynamic_mst_replacement_and_split():
+    from algorithms.dynamic_mst import DynamicMST
+
+    # caminho A-B-C-D com atalhos A-C (6) e B-D (9) fora da árvore
+    graph = Graph()
+    for u, v, w in [("A", "B", 1), ("B", "C", 2), ("C", "D", 3), ("A", "C", 6), ("B", "D", 9)]:
+        graph.add_edge(u, v, w)
+    dynamic = DynamicMST(graph)
+    assert dynamic.total_cost == 6
+
+    def edges():
+        return sorted(tuple(sorted((u, v))) + (w,) for u, v, w in dynamic.mst())
+
+    # remoção da árvore com substituta: A-C entra no lugar de B-C
+    dynamic.delete_edge("B", "C")
+    assert edges() == [("A", "B", 1), ("A", "C", 6), ("C", "D", 3)]
+    assert dynamic.total_cost == 10
+
+    # aumento que mantém a aresta (ainda é a mais barata do corte)
+    dynamic.update_weight("C", "D", 8)
+    assert ("C", "D", 8) in edges() and dynamic.total_cost == 15
+
+    # aumento que força a troca: B-D (9) fica mais barata que C-D (12)
+    dynamic.update_weight("C", "D", 12)
+    assert edges() == [("A", "B", 1), ("A", "C", 6), ("B", "D", 9)]
+    assert dynamic.total_cost == 16
+
+    # remoção sem substituta: a árvore se parte
+    dynamic.delete_edge("B", "D")
+    assert dynamic.total_cost == 19 #C-D volta a ser a única ligação de D
+    dynamic.delete_edge("C", "D")
+    assert edges() == [("A", "B", 1), ("A", "C", 6)]
+    assert dynamic.total_cost == 7
+    assert not dynamic.lct.connected(dynamic.index["A"], dynamic.index["D"])
+
+    # a ponte volta: D se religa
+    dynamic.insert_edge("D", "A", 4)
+    assert dynamic.total_cost == 11 and len(edges()) == 3
+
+
+def test_dynamic_mst_tracks_kruskal():
+    from algorithms.dynamic_mst import DynamicMST
+
+    # block_size=2 força divisões e junções de blocos a cada atualização
+    for block_size in (None, 2):
+        rng = random.Random(11)
+        n = 15
+        weights = {}
+        graph = Graph()
+        for _ in range(30):
+            a, b = sorted(rng.sample(range(n), 2))
+            weights[(a, b)] = rng.randint(1, 20)
+        for (a, b), w in weights.items():
+            graph.add_edge(a, b, w)
+
+        dynamic = DynamicMST(graph, block_size=block_size)
+
+        for _ in range(200):
+            op = rng.random()
+            if op < 0.4 or not weights:
+                a, b = sorted(rng.sample(range(n + 3), 2)) #inclui vértices novos
+                weights[(a, b)] = rng.randint(1, 20)
+                dynamic.insert_edge(a, b, weights[(a, b)])
+            elif op < 0.7:
+                key = rng.choice(list(weights))
+                del weights[key]
+                dynamic.delete_edge(*key)
+            else:
+                key = rng.choice(list(weights))
+                weights[key] = rng.randint(1, 20)
+                dynamic.update_weight(*key, weights[key])
+
+            current = Graph()
+            for (a, b), w in weights.items():
+                current.add_edge(a, b, w)
+            mst, cost = kruskal(current)
+
+            assert dynamic.total_cost == cost
+            assert len(dynamic.mst()) == len(mst)
+            assert sum(w for _, _, w in dynamic.mst()) == cost
+
+
+def test_dynamic_mst_update_cost_is_sublinear():
+    from algorithms.dynamic_mst import DynamicMST
+
+    def cost_per_update(n):
+        # caminho com atalhos i-(i+2): toda remoção da árvore tem substituta
+        graph = Graph()
+        for i in range(n - 1):
+            graph.add_edge(i, i + 1, 1)
+        for i in range(n - 2):
+            graph.add_edge(i, i + 2, 10 + i % 7)
+
+        dynamic = DynamicMST(graph)
+        dynamic.work = 0
+        for k in range(1, 10): #cortes equilibrados e desequilibrados
+            mid = n * k // 10
+            dynamic.delete_edge(mid, mid + 1)
+            dynamic.insert_edge(mid, mid + 1, 1)
+            dynamic.update_weight(mid - 1, mid, 50)
+            dynamic.update_weight(mid - 1, mid, 1)
+
+        mst, cost = kruskal(graph)
+        assert dynamic.total_cost == cost
+        return dynamic.work / 36
+
+    # 16x mais vértices e arestas; a busca linear antiga custaria ~16x mais
+    small, large = cost_per_update(1000), cost_per_update(16000)
+    assert large < small * 16 ** 0.8
@@ -0,0 +1,525 @@
+"""
+Testes das análises sobre MSTs já calculadas
+"""
+import math
+
+import numpy as np
+
+from utils.loader import load_graph
+from algorithms.kruskal import kruskal
+from analysis.mst_metrics import MSTAnalyzer
+from analysis.verify import verify_mst
+from analysis.compare import compare
+
+
+def test_path_query_index():
+    mst = [("A", "B", 1), ("B", "C", 2), ("C", "D", 1), ("B", "E", 3), ("X", "Y", 5)]
+    index = MSTAnalyzer(mst).path_index()
+
+    assert index.path("A", "D") == ["A", "B", "C", "D"]
+    assert index.path_max("A", "D") == 2
+    assert index.path_max_edge("E", "D") == ("E", "B", 3)
+    assert index.path_length("E", "D") == 6
+    assert index.path_max("A", "A") is None
+    assert index.path_max("A", "X") is None # outra componente
+
+    pairs = [("A", "D"), ("E", "C"), ("D", "D"), ("A", "Y")]
+    assert index.path_max_many(pairs)[:2].tolist() == [2, 3]
+    assert np.isnan(index.path_max_many(pairs)[2:]).all()
+    assert index.path_length_many(pairs)[:3].tolist() == [4, 5, 0]
+    assert math.isnan(index.path_length_many(pairs)[3])
+
+
+def test_path_query_index_integer_names():
+    from analysis.path_queries import PathQueryIndex
+
+    index = PathQueryIndex([(10, 20, 5), (20, 30, 1), (30, 0, 9)])
+
+    assert index.path_max(10, 30) == 5
+    assert index.path_max_many([[10, 30], [0, 20]]).tolist() == [5, 9]
+    assert index.path_max_many(np.array([[0, 10]])).tolist() == [9] #nomes, não ids
+    assert index.path_length_many([(0, 10)]).tolist() == [15]
+    assert [index.names[x] for x in index.lca_many([(0, 10), (0, 30)])] == [10, 30] #raiz em 10
+
+    ids = index.pair_ids([(10, 30), (0, 20)])
+    assert index.path_max_many_ids(ids).tolist() == [5, 9]
+    assert index.path_max_edges([(0, 10)]).tolist() == index.path_max_edges_ids(index.pair_ids([(0, 10)])).tolist()
+    cover = index.min_cover([(10, 0)], [7])
+    assert sorted(index.names[x] for x in np.flatnonzero(cover == 0)) == sorted(
+        x for x in (10, 20, 30, 0) if index.parent[index.index[x]] != index.index[x])
+
+
+def test_path_query_index_matches_bfs():
+    graph = load_graph("data/bigger.json")
+    mst, _ = kruskal(graph)
+    analyzer = MSTAnalyzer(mst)
+    index = analyzer.path_index()
+
+    for u in analyzer.vertices:
+        distances = analyzer._bfs_distances(u)
+        pairs = [(u, v) for v in distances]
+        assert index.path_length_many(pairs).tolist() == list(distances.values())
+
+
+def test_verify_mst():
+    graph = load_graph("data/bigger.json")
+    mst, cost = kruskal(graph)
+
+    report = verify_mst(graph, mst)
+    assert report["valid"] and report["cost"] == cost
+    assert all(result["valid"] for result in compare(graph, verify=True).values())
+
+    # troca uma aresta da árvore por uma mais cara que reconecta os dois lados
+    for removed in mst:
+        tree = [edge for edge in mst if edge is not removed]
+        index = MSTAnalyzer(tree).path_index()
+        crossing = [
+            (u, v, w) for u, v, w in graph.edges
+            if w > removed[2] and index.index.get(u) is not None
+            and index.index.get(v) is not None and index.path_max(u, v) is None
+        ]
+        if crossing:
+            break
+
+    report = verify_mst(graph, tree + crossing[:1])
+    assert report["spanning"] and not report["valid"]
+    assert frozenset(removed[:2]) in {frozenset(v["edge"][:2]) for v in report["violations"]}
+
+    # ciclo, aresta inexistente e árvore incompleta
+    assert not verify_mst(graph, mst + [mst[0]])["spanning"]
+    assert not verify_mst(graph, mst[:-1] + [("X", "Y", 1)])["spanning"]
+    assert not verify_mst(graph, mst[1:])["spanning"]
+
+
+def test_benchmark_sweep_and_baseline():
+    from analysis.benchmark import sweep, make_report, compare_to_baseline
+
+    records = sweep([50, 200], [2], ["Kruskal", "Borůvka"], repeats=3, warmup=0)
+    assert [(r["algorithm"], r["vertices"]) for r in records] == [
+        ("Kruskal", 50), ("Borůvka", 50), ("Kruskal", 200), ("Borůvka", 200),
+    ]
+    for r in records:
+        assert len(r["samples_ns"]) == 3 and r["min_ns"] <= r["median_ns"] <= r["max_ns"]
+        assert r["peak_bytes"] > 0
+    # mesmas entradas: o custo de cada tamanho é igual entre as variantes
+    assert records[0]["cost"] == records[1]["cost"]
+
+    report = make_report(records)
+    assert compare_to_baseline(report, report) == []
+
+    faster = make_report([dict(r, median_ns=r["median_ns"] / 2) for r in records])
+    regressions = compare_to_baseline(report, faster, metrics=("median_ns",))
+    assert len(regressions) == len(records)
+    assert all(r["ratio"] > 1.9 for r in regressions)
+
+    # mesma V/E com densidades diferentes (geradores estruturados) não se misturam
+    other = make_report([dict(r, density=r["density"] + 1, median_ns=1) for r in records])
+    assert compare_to_baseline(report, other, metrics=("median_ns",)) == []
+
+    import pytest
+    from analysis.benchmark import main, measure
+    with pytest.raises(ValueError):
+        measure(lambda: None, repeats=0)
+    with pytest.raises(SystemExit):
+        main(["--repeats", "0"])
+
+
+def test_columnar_variants_convert_graph_once(monkeypatch):
+    from graph.compact_graph import CompactGraph
+    from analysis.benchmark import benchmark
+
+    calls = []
+    original = CompactGraph.from_graph.__func__
+    monkeypatch.setattr(CompactGraph, "from_graph",
+                        classmethod(lambda cls, graph: calls.append(graph) or original(cls, graph)))
+
+    # NumPy e Borůvka, 3 repetições cada: uma única conversão, fora da medição
+    graph = load_graph("data/bigger.json")
+    results = benchmark(graph, ["Kruskal", "Kruskal (NumPy)", "Borůvka"], repeats=3, warmup=1, memory=False)
+    assert len(calls) == 1
+    assert len({r["cost"] for r in results.values()}) == 1
+
+    # um CompactGraph já pronto não é convertido de novo
+    compare(CompactGraph.from_graph(graph), ["Kruskal (NumPy)", "Borůvka"])
+    assert len(calls) == 2
+
+
+def test_cli_is_headless(capsys):
+    import sys
+    import json
+    import subprocess
+    from main import main
+
+    assert main(["mst", "data/bigger.json", "--algorithm", "prim", "--format", "json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["cost"] == kruskal(load_graph("data/bigger.json"))[1]
+    assert len(result["edges"]) == result["vertices"] - 1
+
+    assert main(["mst", "nao_existe.json"]) == 1
+
+    # sem render, matplotlib e networkx não são importados
+    code = ("import sys, main; main.main(['analyze', 'data/bigger.json', '--format', 'json']); "
+            "sys.exit('matplotlib' in sys.modules or 'networkx' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True).returncode == 0
+
+    # compare só importa as variantes pedidas: Kruskal sozinho não carrega o NumPy
+    code = ("import sys, main; main.main(['compare', 'data/bigger.json', '--algorithms', 'kruskal']); "
+            "sys.exit('numpy' in sys.modules or 'multiprocessing' in sys.modules)")
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True).returncode == 0
+
+
+def test_batch_streams_results_and_failures(tmp_path):
+    import json
+    import shutil
+    from analysis.batch import expand_inputs, run_batch, write_jsonl
+
+    for name in ("bairros.json", "bigger.json"):
+        shutil.copy(f"data/{name}", tmp_path / name)
+    (tmp_path / "quebrado.json").write_text("[[1, 2")
+    (tmp_path / "notas.txt").write_text("ignorado")
+
+    paths = expand_inputs(str(tmp_path))
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["bairros.json", "bigger.json", "quebrado.json"]
+
+    out = tmp_path / "lote.jsonl"
+    with open(out, "w", encoding="utf-8") as f:
+        assert write_jsonl(run_batch(paths, workers=2), f) == (2, 1)
+
+    records = {r["file"].rsplit("/", 1)[-1]: r for r in map(json.loads, out.read_text().splitlines())}
+    assert records["bigger.json"]["cost"] == kruskal(load_graph("data/bigger.json"))[1]
+    assert records["bigger.json"]["analysis"]["summary"]["total_edges"] == 10
+    assert not records["quebrado.json"]["ok"] and "error" in records["quebrado.json"]
+
+
+def test_service_caches_results_by_content(tmp_path, monkeypatch):
+    import json
+    import asyncio
+    import shutil
+    from analysis.service import MSTService, ResultCache
+
+    edges = [list(e) for e in load_graph("data/bigger.json").edges]
+    shutil.copy("data/bigger.json", tmp_path / "g.json")
+
+    async def request(reader, writer, method, path, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        writer.write(f"{method} {path} HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+        status = int((await reader.readline()).split()[1])
+        headers = {}
+        while (line := await reader.readline()) != b"\r\n":
+            name, _, value = line.decode().partition(":")
+            headers[name.lower()] = value.strip()
+        data = await reader.readexactly(int(headers["content-length"]))
+        return status, headers.get("x-cache"), json.loads(data)
+
+    async def scenario():
+        service = MSTService(workers=2)
+        await service.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+        try:
+            # mesma conexão (keep-alive): a segunda resposta vem do cache
+            status, cache, first = await request(reader, writer, "POST", "/mst", {"edges": edges})
+            assert (status, cache) == (200, "miss")
+            assert first["cost"] == kruskal(load_graph("data/bigger.json"))[1]
+            assert first["analysis"]["summary"]["total_edges"] == 10
+
+            _, cache, again = await request(reader, writer, "POST", "/mst", {"edges": edges})
+            assert cache == "hit" and again == first
+
+            _, cache, prim = await request(reader, writer, "POST", "/mst", {"edges": edges, "algorithm": "prim"})
+            assert cache == "miss" and prim["cost"] == first["cost"]
+
+            path = str(tmp_path / "g.json")
+            assert (await request(reader, writer, "POST", "/mst", {"path": path}))[1] == "miss"
+            assert (await request(reader, writer, "POST", "/mst", {"path": path}))[1] == "hit"
+
+            status, _, error = await request(reader, writer, "POST", "/mst", {"edges": edges, "algorithm": "x"})
+            assert status == 400 and "algoritmo" in error["error"]
+            assert (await request(reader, writer, "POST", "/mst", {"path": str(tmp_path / "nada.json")}))[0] == 400
+
+            _, _, stats = await request(reader, writer, "GET", "/stats")
+            assert stats["hits"] == 2 and stats["entries"] == 3
+
+            # corpo grande demais: 413 e a conexão é encerrada
+            import analysis.service
+            monkeypatch.setattr(analysis.service, "MAX_BODY_BYTES", 100)
+            other = await asyncio.open_connection("127.0.0.1", service.port)
+            status, _, error = await request(*other, "POST", "/mst", {"edges": edges})
+            assert status == 413 and "grande" in error["error"]
+            assert await other[0].read() == b""
+            other[1].close()
+
+            # linha de pedido malformada: 400
+            other = await asyncio.open_connection("127.0.0.1", service.port)
+            other[1].write(b"LIXO\r\n\r\n")
+            assert (await other[0].readline()).split()[1] == b"400"
+            other[1].close()
+        finally:
+            writer.close()
+            await service.close()
+
+    asyncio.run(scenario())
+
+    # LRU com orçamento de bytes
+    cache = ResultCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234" #"b" passa a ser a menos usada
+    cache.put("c", b"1234")
+    assert cache.get("b") is None and cache.get("c") == b"1234"
+    cache.put("grande", b"x" * 11)
+    assert cache.get("grande") is None and cache.stats()["bytes"] == 8
+
+
+def test_service_answers_repeated_bodies_without_parsing():
+    import json
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+    from analysis.service import MSTService
+
+    body = json.dumps({"edges": [["A", "B", 4], ["B", "C", 2], ["A", "C", 5]]}).encode()
+    spaced = json.dumps(json.loads(body), indent=2).encode()
+
+    async def scenario():
+        service = MSTService(executor=ThreadPoolExecutor(1))
+        try:
+            status, first, cached = await service._route("POST", "/mst", body)
+            assert (status, cached) == (200, False)
+
+            # mesmo texto com outra formatação: acerta a chave canônica depois do parse
+            assert await service._route("POST", "/mst", spaced) == (200, first, True)
+
+            async def unreachable(*args):
+                raise AssertionError("a repetição não deveria chegar ao parse")
+
+            # o mesmo corpo cru nem passa por solve
+            service.solve = unreachable
+            assert await service._route("POST", "/mst", body) == (200, first, True)
+            assert await service._route("POST", "/mst", spaced) == (200, first, True)
+            assert service.cache.stats()["hits"] == 3
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())
+
+    # o apelido some junto com a entrada
+    from analysis.service import ResultCache
+    cache = ResultCache(max_bytes=4)
+    cache.put("a", b"1234")
+    cache.alias("corpo", "a")
+    assert cache.lookup("corpo") == b"1234"
+    cache.put("b", b"1234")
+    assert cache.lookup("corpo") is None and not cache.aliases
+
+
+def test_spanning_forest_of_disconnected_graph():
+    from graph.graph import Graph
+    from graph.compact_graph import CompactGraph
+    from algorithms.prim import prim
+    from analysis.compare import VARIANTS
+    from analysis.forest import connected_components, spanning_forest
+    from utils.generators import district_edges
+
+    graph = Graph()
+    for u, v, w in district_edges(3, 4, 5, seed=7):
+        graph.add_edge(u, v, w)
+    graph.add_edge("X", "Y", 3) #quarto distrito, só uma ligação
+
+    components = connected_components(graph)
+    assert [len(c) for c in components] == [20, 20, 20, 2]
+    assert connected_components(CompactGraph.from_graph(graph)) == components
+
+    expected = kruskal(graph)[1]
+    assert prim(graph, 0)[1] < expected #sem forest, só a componente de 0
+    assert all(r["cost"] == expected and r["valid"] for r in compare(graph, list(VARIANTS), verify=True).values())
+
+    serial = spanning_forest(graph)
+    assert serial.total_cost == expected and serial.num_components == 4 and not serial.is_tree()
+    assert [len(t) for t in serial.trees] == [19, 19, 19, 1] and serial.costs[3] == 3
+    assert serial.connected(0, 19) and not serial.connected(0, 20) and serial.component_of("Y") == 3
+
+    # componentes grandes vão para o pool; as pequenas ficam juntas no processo atual
+    for g in (graph, CompactGraph.from_graph(graph)):
+        for name in ("Kruskal", "Prim (eager)", "Borůvka"):
+            parallel = spanning_forest(g, name, workers=2, min_parallel_edges=30)
+            assert parallel.costs == serial.costs
+            assert verify_mst(graph, parallel.edges)["valid"]
+
+    analysis = serial.analyzer().get_full_analysis()
+    assert analysis["summary"]["components"] == 4
+    assert [c["vertices"] for c in analysis["components"]] == [20, 20, 20, 2]
+    assert analysis["components"][3]["diameter"] == 3
+    assert analysis["center_and_radius"]["center"] in components[0] + components[1] + components[2]
+
+
+def test_scenarios_match_recomputation():
+    import random
+    from graph.graph import Graph
+    from analysis.scenarios import ScenarioEngine
+
+    for seed in range(60):
+        rng = random.Random(seed)
+        graph = Graph()
+        for _ in range(rng.randint(1, 120)): #multigrafo, possivelmente desconexo e com laços
+            graph.add_edge(rng.randrange(30), rng.randrange(30), rng.randint(1, 9))
+        engine = ScenarioEngine(graph)
+        assert engine.cost == kruskal(graph)[1]
+
+        scenarios = []
+        for _ in range(20):
+            scenario = []
+            for _ in range(rng.choice([1, 1, 2, 3, 6])):
+                u, v, _ = rng.choice(graph.edges)
+                scenario.append(rng.choice([("remove", u, v), ("set", u, v, rng.randint(0, 12)),
+                                            ("scale", u, v, rng.choice([0.5, 1.3]))]))
+            scenarios.append(scenario)
+
+        for scenario, result in zip(scenarios, engine.evaluate_many(scenarios)):
+            changes = engine._resolve(scenario)
+            modified = Graph()
+            for i, (u, v, w) in enumerate(graph.edges):
+                if changes.get(i, w) is not None:
+                    modified.add_edge(u, v, changes.get(i, w))
+            assert math.isclose(result["cost"], kruskal(modified)[1])
+
+            # base - removidas + adicionadas (com os pesos novos) é uma MST do grafo modificado
+            tree = {i: engine.edges[i] for i in engine.tree}
+            for edge in result["removed"]:
+                del tree[next(i for i, base in tree.items() if base == edge)]
+            tree = [(u, v, changes.get(i, w)) for i, (u, v, w) in tree.items()]
+            if len(modified.edges):
+                assert verify_mst(modified, tree + result["added"])["valid"]
+
+    graph = load_graph("data/bigger.json")
+    engine = ScenarioEngine(graph)
+    u, v, w = engine.edges[engine.tree[0]]
+    single = engine.evaluate(("remove", u, v))
+    assert single["removed"] == [(u, v, w)] and len(single["added"]) == 1 and single["delta"] >= 0
+
+    scenarios = [[("scale", a, b, 1.3)] for a, b, _ in graph.edges] * 3
+    assert engine.evaluate_many(scenarios, workers=2, min_parallel=1) == engine.evaluate_many(scenarios)
+
+
+def test_edge_sensitivity_matches_recomputation(tmp_path):
+    import random
+    from graph.graph import Graph
+    import csv
+    import json
+    from analysis.sensitivity import COLUMNS, edge_sensitivity, write_table
+
+    def cost_with(graph, i, weight):
+        modified = Graph()
+        for j, (u, v, w) in enumerate(graph.edges):
+            modified.add_edge(u, v, weight if j == i else w)
+        return kruskal(modified)[1]
+
+    for seed in range(30):
+        rng = random.Random(seed)
+        graph = Graph()
+        for _ in range(rng.randint(1, 60)): #multigrafo, possivelmente desconexo e com laços
+            graph.add_edge(rng.randrange(15), rng.randrange(15), rng.randint(1, 9))
+        base = kruskal(graph)[1]
+
+        for i, row in enumerate(edge_sensitivity(graph)):
+            weight = row["weight"]
+            if row["in_mst"]:
+                assert row["lower"] is None
+                if row["upper"] is None: #ponte: a MST nunca troca a aresta
+                    assert cost_with(graph, i, weight + 100) == base + 100
+                else:
+                    upper = row["upper"]
+                    assert cost_with(graph, i, upper) == base + upper - weight
+                    assert cost_with(graph, i, upper + 0.5) == base + upper - weight
+            else:
+                assert row["upper"] is None
+                assert cost_with(graph, i, weight + 100) == base
+                if row["lower"] is None: #laço
+                    assert row["u"] == row["v"] and cost_with(graph, i, -100) == base
+                else:
+                    assert cost_with(graph, i, row["lower"]) == base
+                    assert cost_with(graph, i, row["lower"] - 0.5) == base - 0.5
+
+    rows = edge_sensitivity(load_graph("data/bigger.json"))
+    assert write_table(rows, str(tmp_path / "s.csv")) == len(rows)
+    with open(tmp_path / "s.csv", encoding="utf-8", newline="") as f:
+        table = list(csv.reader(f))
+    assert tuple(table[0]) == COLUMNS and len(table) == len(rows) + 1
+    write_table(rows, str(tmp_path / "s.json"))
+    with open(tmp_path / "s.json", encoding="utf-8") as f:
+        assert json.load(f) == rows
+
+
+def test_kruskal_tree_thresholds_and_cuts():
+    import random
+    from graph.graph import Graph
+    from algorithms.union_find import UnionFind
+    from algorithms.kruskal_tree import KruskalTree
+
+    for seed in range(30):
+        rng = random.Random(seed)
+        graph = Graph()
+        for _ in range(rng.randint(1, 60)): #multigrafo, possivelmente desconexo e com laços
+            graph.add_edge(rng.randrange(20), rng.randrange(20), rng.randint(1, 9))
+
+        mst, cost, tree = kruskal(graph, hierarchy=True)
+        assert (mst, cost) == kruskal(graph)
+        vertices = list(graph.vertices())
+
+        for budget in range(0, 11):
+            uf = UnionFind(vertices) #conexão usando só as ligações de custo <= budget
+            for u, v, w in graph.edges:
+                if w <= budget:
+                    uf.union(u, v)
+            labels = tree.labels(budget)
+            for u in vertices:
+                for v in vertices:
+                    same = uf.connected(u, v)
+                    assert tree.connected(u, v, budget) == same
+                    assert (labels[tree.index[u]] == labels[tree.index[v]]) == same
+            u = rng.choice(vertices)
+            assert sorted(tree.cluster(u, budget)) == sorted(v for v in vertices if uf.connected(u, v))
+            assert len(tree.clusters(budget)) == uf.count
+
+        pairs = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(50)]
+        thresholds = tree.threshold_many(pairs) #nomes inteiros, diferentes dos ids das folhas
+        assert (tree.threshold_many_ids(tree.pair_ids(pairs)) == thresholds).all()
+        for (u, v), value in zip(pairs, thresholds):
+            expected = [b for b in range(0, 11) if tree.connected(u, v, b)]
+            if u == v:
+                assert value == -np.inf and tree.threshold(u, v) is None
+            elif not expected:
+                assert value == np.inf and tree.threshold(u, v) is None
+            else:
+                assert value == expected[0] == tree.threshold(u, v)
+        assert (tree.connected_many(pairs, 5) == (thresholds <= 5)).all()
+
+        # cortar em k grupos = desfazer as k - c uniões mais caras
+        for k in range(tree.num_components, len(vertices) + 1):
+            uf = UnionFind(vertices)
+            for u, v, _ in mst[:len(vertices) - k]:
+                uf.union(u, v)
+            groups = tree.cut(k)
+            assert len(groups) == k and sum(map(len, groups)) == len(vertices)
+            assert all(uf.connected(g[0], x) for g in groups for x in g)
+
+    # nomes inteiros que não coincidem com os ids das folhas
+    tree = KruskalTree([(10, 20, 5), (20, 30, 7)], [10, 20, 30, 0])
+    assert tree.threshold_many([(10, 30), (0, 10)]).tolist() == [7, np.inf]
+    assert tree.connected_many([(10, 20), (20, 30)], 5).tolist() == [True, False]
+
+    # dendrograma igual ao single linkage do scipy
+    from scipy.cluster.hierarchy import cophenet, linkage
+    from scipy.spatial.distance import squareform
+
+    rng = np.random.default_rng(0)
+    points = rng.random((25, 2))
+    distance = np.linalg.norm(points[:, None] - points[None], axis=2)
+    graph = Graph()
+    for i in range(25):
+        for j in range(i + 1, 25):
+            graph.add_edge(i, j, float(distance[i, j]))
+    tree = KruskalTree.from_graph(graph)
+    order = np.argsort(tree.names)
+    expected = cophenet(linkage(squareform(distance, checks=False), "single"))
+    assert np.allclose(squareform(cophenet(tree.linkage()))[np.ix_(order, order)], squareform(expected))
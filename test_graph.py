@@ -0,0 +1,217 @@
+"""
+Testes das estruturas de grafo e do carregamento de arquivos
+"""
+from utils.loader import load_graph
+from graph.graph import Graph
+from graph.compact_graph import CompactGraph
+from graph.edge import Edge
+from algorithms.prim import prim
+from algorithms.kruskal import kruskal
+from analysis.mst_metrics import MSTAnalyzer
+
+
+def test_compact_graph_matches_graph():
+    """O grafo compacto deve se comportar como o Graph original"""
+    for filepath in ("data/bairros.json", "data/bigger.json"):
+        graph = load_graph(filepath)
+        compact = load_graph(filepath, compact=True)
+
+        assert isinstance(compact, CompactGraph)
+        assert list(compact.vertices()) == list(graph.vertices())
+        assert list(compact.edges) == graph.edges
+        for v in graph.vertices():
+            assert compact.adj[v] == graph.adj[v]
+
+        start = next(iter(graph.vertices()))
+        assert prim(compact, start) == prim(graph, start)
+        assert kruskal(compact) == kruskal(graph)
+
+        mst, _ = kruskal(compact)
+        assert MSTAnalyzer(mst).get_full_analysis() == MSTAnalyzer(kruskal(graph)[0]).get_full_analysis()
+
+
+def test_compact_graph_columns_and_csr():
+    compact = CompactGraph()
+    compact.add_edge("A", "B", 4)
+    compact.add_edge("B", "C", 2)
+    compact.add_edge("A", "C", 1.5)
+
+    assert compact.num_vertices() == 3
+    assert compact.num_edges() == 3
+    assert compact.weight.typecode == "d"
+
+    offsets, neighbors, edge_ids = compact.csr()
+    assert list(offsets) == [0, 2, 4, 6]
+    assert [compact.names[j] for j in neighbors[offsets[0]:offsets[1]]] == ["B", "C"]
+    assert compact.adj["C"] == [("B", 2.0), ("A", 1.5)]
+
+    u, v, w = compact.columns()
+    assert u.tolist() == [0, 1, 0]
+    assert w.tolist() == [4.0, 2.0, 1.5]
+
+
+def test_edge_slots():
+    edge = Edge("A", "B", 3)
+    assert not hasattr(edge, "__dict__")
+    assert tuple(edge) == ("A", "B", 3)
+    assert Edge("A", "C", 1) < edge
+
+    assert edge == Edge("A", "B", 3) == ("A", "B", 3)
+    assert hash(edge) == hash(("A", "B", 3))
+    assert edge != ["A", "B", 3] # listas não têm o mesmo hash
+    assert edge != None and edge != 3
+
+
+def test_load_points(tmp_path):
+    from utils.loader import load_points, load_point_graph
+
+    csv_file = tmp_path / "centroides.csv"
+    csv_file.write_text("nome,x,y\nCentro,0,0\nBairro A,3,4\nBairro B,3,0\n", encoding="utf-8")
+    json_file = tmp_path / "centroides.json"
+    json_file.write_text('{"Centro": [0, 0], "Bairro A": [3, 4], "Bairro B": [3, 0]}', encoding="utf-8")
+
+    assert load_points(str(csv_file)) == load_points(str(json_file))
+
+    graph = load_point_graph(str(csv_file))
+    assert sorted(kruskal(graph)[0]) == [("Bairro A", "Bairro B", 4.0), ("Centro", "Bairro B", 3.0)]
+
+
+def test_streaming_loader_formats(tmp_path):
+    import json
+
+    edges = json.loads(open("data/bigger.json", encoding="utf-8").read())
+    expected = load_graph("data/bigger.json").edges
+
+    ndjson_file = tmp_path / "arestas.ndjson"
+    ndjson_file.write_text("\n".join(json.dumps({"u": u, "v": v, "weight": w}) for u, v, w in edges),
+                           encoding="utf-8")
+    csv_file = tmp_path / "arestas.csv"
+    csv_file.write_text("u,v,peso\n" + "\n".join(f"{u},{v},{w}" for u, v, w in edges), encoding="utf-8")
+
+    assert load_graph(str(ndjson_file)).edges == expected
+    assert load_graph(str(csv_file)).edges == expected
+    # blocos minúsculos forçam linhas partidas entre leituras
+    assert load_graph("data/bigger.json", chunk_size=3).edges == expected
+
+
+def test_streaming_loader_stops_at_malformed_row():
+    import io
+    import json
+    import pytest
+    from utils.loader import _iter_json_array
+
+    # escapes, expoentes e negativos partidos em qualquer ponto continuam válidos
+    text = '[["S\\u00e3o", "B", 1.5e2], ["B", "C", -2], ["C", "D", 3]]'
+    for chunk_size in range(1, len(text) + 1):
+        assert list(_iter_json_array(io.StringIO(text), chunk_size)) == [["São", "B", 150.0], ["B", "C", -2], ["C", "D", 3]]
+
+    # aresta inválida no começo: o erro sai sem ler o resto do arquivo para o buffer
+    rows = [json.dumps([f"v{i}", f"v{i + 1}", i]) for i in range(20000)]
+    rows[10] = '["v10" "v11", 10]'
+    f = io.StringIO("[" + ",\n".join(rows) + "]")
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_array(f, 256))
+    assert f.tell() < 4096
+
+
+def test_streaming_loader_filters():
+    graph = load_graph("data/bigger.json", max_weight=4, vertices={"Centro", "Bairro A", "Bairro B", "Bairro C"})
+    assert graph.edges == [("Centro", "Bairro A", 4), ("Centro", "Bairro B", 3), ("Bairro A", "Bairro B", 2)]
+
+
+def test_binary_cache_roundtrip(tmp_path):
+    import os
+    from utils.graph_cache import cache_path_for
+
+    source = tmp_path / "rede.json"
+    source.write_text('[[1, 2, 4], [2, 3, 2.5], ["Centro", 1, 7]]', encoding="utf-8")
+    path = str(source)
+
+    cold = load_graph(path, compact=True, cache=True)
+    assert os.path.exists(cache_path_for(path))
+
+    warm = load_graph(path, compact=True, cache=True)
+    assert not isinstance(warm.names, list) # veio do mmap
+    assert list(warm.edges) == list(cold.edges) == [(1, 2, 4.0), (2, 3, 2.5), ("Centro", 1, 7.0)]
+    assert warm.adj[1] == cold.adj[1]
+    assert kruskal(warm) == kruskal(cold)
+
+    # sem compact=True o cache vira um Graph comum
+    plain = load_graph(path, cache=True)
+    assert isinstance(plain, Graph) and plain.edges == list(warm.edges)
+
+    # conteúdo novo invalida o cache
+    source.write_text('[[1, 2, 4], [2, 3, 1]]', encoding="utf-8")
+    assert list(load_graph(path, cache=True).edges) == [(1, 2, 4), (2, 3, 1)]
+
+    # format e chunk_size chegam ao loader mesmo com cache (extensão não diz o formato)
+    other = tmp_path / "rede.txt"
+    other.write_text('{"u": "A", "v": "B", "weight": 3}\n', encoding="utf-8")
+    assert load_graph(str(other), format="ndjson", chunk_size=4, cache=True).edges == [("A", "B", 3)]
+
+    # outro formato não reaproveita o grafo lido como ndjson
+    assert load_graph(str(other), format="csv", cache=True).edges == [] #a linha vira cabeçalho
+    assert load_graph(str(other), format="ndjson", cache=True).edges == [("A", "B", 3)]
+
+    # close() libera o mmap e esvazia o grafo; arrays de columns() não o fazem falhar
+    with load_graph(path, compact=True, cache=True) as mapped:
+        assert not isinstance(mapped.names, list)
+        u, _, _ = mapped.columns()
+    assert list(mapped.edges) == [] and list(u) == [0, 1] #o array continua válido
+    mapped.close()
+
+
+def test_binary_cache_tuple_names(tmp_path):
+    import os
+    import pytest
+    from utils.graph_cache import map_graph, write_cache
+
+    source = tmp_path / "rede.json"
+    source.write_text("[]", encoding="utf-8")
+    stat = os.stat(source)
+
+    graph = CompactGraph()
+    graph.add_edge((0, 1), (0, 2), 4)
+    graph.add_edge((0, 2), ("x", (1, 1)), 2)
+    write_cache(graph, str(tmp_path / "c"), stat, bytes(32))
+
+    mapped = map_graph(str(tmp_path / "c"))
+    assert list(mapped.edges) == list(graph.edges)
+    assert mapped.adj[(0, 2)] == graph.adj[(0, 2)]
+
+    bad = CompactGraph()
+    bad.add_edge(frozenset({1}), 2, 1)
+    with pytest.raises(ValueError):
+        write_cache(bad, str(tmp_path / "d"), stat, bytes(32))
+    assert not os.path.exists(tmp_path / "d")
+
+
+def test_generators(tmp_path):
+    from utils.generators import GENERATORS, generate_edges, write_edges
+    from algorithms.union_find import UnionFind
+
+    for kind in GENERATORS:
+        edges = list(generate_edges(kind, 2000, seed=7))
+        assert edges == list(generate_edges(kind, 2000, seed=7)) #determinístico
+        assert edges != list(generate_edges(kind, 2000, seed=8))
+        assert 1000 < len(edges) < 3000
+
+        costs = set()
+        for ext in ("json", "ndjson", "csv"):
+            path = str(tmp_path / f"{kind}.{ext}")
+            assert write_edges(iter(edges), path) == len(edges)
+            graph = load_graph(path)
+            assert len(graph.edges) == len(edges)
+            costs.add(round(kruskal(graph)[1], 6))
+        assert len(costs) == 1
+
+    # caminho embaralhado sem lista de índices: cada aresta aparece uma vez
+    from utils.generators import chain_edges
+    for n in (1, 2, 3, 17, 1000):
+        assert sorted(chain_edges(n, seed=3)) == [(i, i + 1, n - 1 - i) for i in range(n - 1)]
+
+    # bairros sem ligação entre si
+    uf = UnionFind(range(8 * 16 * 16))
+    for u, v, _ in generate_edges("districts", 8 * 2 * 16 * 16, seed=1):
+        uf.union(u, v)
+    assert uf.component_count() == 8
@@ -3,8 +3,8 @@ Script para testar as métricas da MST com diferentes grafos
 """
 from utils.loader import load_graph
 from algorithms.prim import prim
-from algorithms.kruskal import kruskal
 from analysis.mst_metrics import MSTAnalyzer
+from analysis.verify import verify_mst
 
 def test_with_different_graphs():
     """Testa as métricas com diferentes arquivos de grafo"""
@@ -29,13 +29,12 @@ def test_with_different_graphs():
             mst_prim, cost_prim = prim(graph, start)
             print(f"✓ MST (Prim) calculada: custo = {cost_prim}")
             
-            # Executar Kruskal
-            mst_kruskal, cost_kruskal = kruskal(graph)
-            print(f"✓ MST (Kruskal) calculada: custo = {cost_kruskal}")
-            
-            # Verificar se ambos têm o mesmo custo
-            if cost_prim == cost_kruskal:
-                print(f"✅ Ambos algoritmos encontraram o mesmo custo!")
+            # Verificar a MST pela propriedade do ciclo (sem rodar um segundo algoritmo)
+            report = verify_mst(graph, mst_prim)
+            if report["valid"]:
+                print(f"✅ MST verificada: nenhuma aresta de fora é mais barata que o caminho!")
+            else:
+                print(f"❌ MST inválida: {report['errors']} {report['violations']}")
             
             # Analisar MST com Prim
             print(f"\n{'='*80}")
@@ -90,6 +89,39 @@ def test_individual_metrics():
     
     print("\n✅ Todos os testes individuais concluídos!")
 
+def test_linear_time_metrics():
+    """Diâmetro, centro e raio em caminho longo (O(V), sem BFS por vértice)"""
+    n = 100000
+    mst_chain = [(i, i + 1, 1) for i in range(n - 1)]
+
+    analyzer = MSTAnalyzer(mst_chain)
+
+    diameter = analyzer.calculate_diameter()
+    assert diameter['diameter'] == n - 1
+    assert diameter['path_vertices'] == (0, n - 1)
+
+    center = analyzer.calculate_center_and_radius()
+    assert center['center'] == (n - 1) // 2
+    assert center['radius'] == n // 2
+    assert center['all_eccentricities'][0] == n - 1
+
+    # MST de teste do README
+    analyzer = MSTAnalyzer([("A", "B", 1), ("B", "C", 2), ("C", "D", 1), ("B", "E", 3)])
+    assert analyzer.calculate_diameter()['diameter'] == 6
+    assert analyzer.calculate_center_and_radius()['center'] == "B"
+    assert analyzer.calculate_center_and_radius()['radius'] == 3
+
+def test_longest_branch_deep_tree():
+    """Braço mais longo em árvore profunda, sem estourar a recursão"""
+    n = 200000
+    mst_chain = [(i, i + 1, 2) for i in range(n - 1)]
+
+    branch = MSTAnalyzer(mst_chain).analyze_balance()['longest_branch']
+
+    assert branch['from'] == 0 and branch['to'] == n - 1
+    assert branch['length'] == 2 * (n - 1)
+    assert branch['path'] == list(range(n))
+
 if __name__ == "__main__":
     # Executar testes
     test_individual_metrics()
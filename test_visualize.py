@@ -0,0 +1,111 @@
+"""
+Testes das animações (renderização com background em cache)
+"""
+import pytest
+from PIL import Image
+
+from utils.loader import load_graph
+from algorithms.kruskal import kruskal
+from visualize import visualize_prim_gif, visualize_kruskal_gif
+
+
+def test_animations_match_algorithms(tmp_path):
+    from visualize import create_networkx_graph, get_layout
+
+    graph = load_graph("data/bairros.json")
+    _, cost = kruskal(graph)
+
+    # layout sem cache em disco: o teste não escreve em results/.layouts
+    pos = get_layout(create_networkx_graph(graph), graph, cache_dir=None)
+    prim_edges, prim_cost = visualize_prim_gif(graph, "Centro", str(tmp_path / "prim.gif"), pos=pos)
+    kruskal_edges, kruskal_cost = visualize_kruskal_gif(graph, str(tmp_path / "kruskal.gif"), pos=pos)
+
+    assert prim_cost == kruskal_cost == cost
+    assert len(prim_edges) == len(kruskal_edges) == len(graph.vertices()) - 1
+
+    with Image.open(tmp_path / "kruskal.gif") as gif:
+        assert gif.size == (1200, 800)
+        assert gif.n_frames > len(graph.edges) #ao menos um quadro por aresta verificada
+
+
+def test_frame_sampling_and_parallel_rendering(tmp_path):
+    from visualize import (kruskal_steps, sample_frames, render_frames, animate,
+                           create_networkx_graph, get_layout)
+
+    graph = load_graph("data/bigger.json")
+    ops, mst_edges, _ = kruskal_steps(graph)
+    frames = [i for i, op in enumerate(ops) if op[0] == "frame"]
+
+    assert sample_frames(ops) == frames
+    accepted = sample_frames(ops, "accepted")
+    assert len(accepted) == len(mst_edges) + 2 #mais o quadro inicial e o final
+    assert len(sample_frames(ops, every=3)) == 2 + (len(frames) - 2) // 3
+    budget = sample_frames(ops, max_frames=10)
+    assert len(budget) == 10 and budget[0] == frames[0] and budget[-1] == frames[-1]
+    assert len(sample_frames(ops, max_frames=2)) == 2
+    assert sample_frames(ops, max_frames=1) == [frames[-1]] #só a árvore final
+    with pytest.raises(ValueError):
+        sample_frames(ops, max_frames=0)
+
+    # em paralelo, os quadros saem iguais e na mesma ordem
+    G = create_networkx_graph(graph)
+    pos = get_layout(G, graph, cache_dir=str(tmp_path))
+    serial = render_frames(G, pos, ops, accepted, workers=1)
+    parallel = render_frames(G, pos, ops, accepted, workers=2, min_parallel_frames=1)
+    assert [f.tobytes() for f in serial] == [f.tobytes() for f in parallel]
+
+    written = animate(graph, ops, str(tmp_path / "k.gif"), pos, max_bytes=150_000)
+    assert (tmp_path / "k.gif").stat().st_size <= 150_000
+    assert 2 <= written < len(frames)
+
+
+def test_layout_cache(tmp_path):
+    from visualize import create_networkx_graph, get_layout, layout_key
+    from algorithms.euclidean import candidate_graph
+
+    graph = load_graph("data/bigger.json")
+    G = create_networkx_graph(graph)
+
+    pos = get_layout(G, graph, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    assert get_layout(G, graph, cache_dir=str(tmp_path)) == pos
+
+    # mesma estrutura em outra ordem tem a mesma chave; outro peso, não
+    H = create_networkx_graph(graph)
+    H.remove_edges_from(list(H.edges()))
+    H.add_weighted_edges_from([(v, u, w) for u, v, w in reversed(graph.edges)])
+    assert layout_key(H) == layout_key(G)
+    u, v, w = graph.edges[0]
+    H[u][v]["weight"] = w + 1
+    assert layout_key(H) != layout_key(G)
+
+    # nomes em tupla voltam do cache como tuplas
+    from graph.graph import Graph
+    grid = Graph()
+    grid.add_edge((0, 0), (0, 1), 1)
+    grid.add_edge((0, 1), (1, 1), 2)
+    T = create_networkx_graph(grid)
+    first = get_layout(T, grid, cache_dir=str(tmp_path / "t"))
+    assert get_layout(T, grid, cache_dir=str(tmp_path / "t")) == first
+    assert set(first) == {(0, 0), (0, 1), (1, 1)}
+
+    # coordenadas reais são usadas diretamente
+    points = {"A": (0.0, 0.0), "B": (1.0, 0.0), "C": (0.0, 2.0)}
+    point_graph = candidate_graph(points)
+    assert get_layout(create_networkx_graph(point_graph), point_graph, cache_dir=None) == points
+
+
+def test_large_graph_rendering(tmp_path, capsys):
+    from visualize import visualize_original_graph, pivot_mds_layout, create_networkx_graph
+    from utils.generators import build_graph
+
+    graph = build_graph("grid", 3000, seed=1)
+    assert len(graph.vertices()) > 200
+
+    pos = pivot_mds_layout(create_networkx_graph(graph))
+    assert len(pos) == len(graph.vertices())
+    assert len(set(pos.values())) == len(pos) #nenhum vértice empilhado
+
+    visualize_original_graph(graph, str(tmp_path / "mapa.png"), pos)
+    assert (tmp_path / "mapa.png").stat().st_size > 0
+    assert "mapa.png" in capsys.readouterr().out
@@ -0,0 +1,301 @@
+"""
+Geradores de redes urbanas sintéticas para testes de escala
+
+Cada gerador é determinístico (random.Random com semente) e produz as
+arestas (u, v, peso) uma a uma, com vértices numerados a partir de 0, de
+modo que write_edges grava direto no disco, em qualquer formato do
+loader (JSON, NDJSON ou CSV), sem montar o grafo em memória.
+
+    python -m utils.generators grid --edges 1000000 --seed 1 -o data/grade.ndjson
+
+Tipos disponíveis (ver GENERATORS):
+- grid: malha de ruas com quarteirões de comprimento variável
+- geometric: pontos aleatórios ligados quando estão a menos de um raio
+  (peso = distância euclidiana)
+- scale_free: crescimento com ligação preferencial (Barabási-Albert)
+- districts: vários bairros em malha sem ligação entre si (grafo desconexo)
+- chain: caminho com pesos crescentes, que força árvores profundas no
+  Union-Find e recursão profunda em percursos
+- random: árvore aleatória mais arestas entre pares sorteados
+"""
+import argparse
+import json
+import math
+import random
+import sys
+from array import array
+
+
+def grid_edges(rows, cols, seed=0, block=100, jitter=0.3):
+    """
+    Malha rows x cols (ruas horizontais e verticais)
+
+    O peso de cada trecho é o comprimento do quarteirão, block metros
+    com variação aleatória de ±jitter.
+    """
+    rng = random.Random(seed)
+    low, high = int(block * (1 - jitter)), int(block * (1 + jitter))
+
+    for r in range(rows):
+        base = r * cols
+        for c in range(cols):
+            v = base + c
+            if c + 1 < cols:
+                yield v, v + 1, rng.randint(low, high)
+            if r + 1 < rows:
+                yield v, v + cols, rng.randint(low, high)
+
+
+def random_points(n, seed=0, side=10.0):
+    """n pontos uniformes num quadrado de lado `side` (km)"""
+    rng = random.Random(seed)
+    return [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(n)]
+
+
+def geometric_edges(n, radius, seed=0, side=10.0):
+    """
+    Grafo geométrico aleatório: liga pontos a menos de `radius` km
+
+    Os pontos são distribuídos numa grade de células de lado `radius`, e
+    cada ponto só é comparado com a própria célula e as vizinhas, então o
+    custo é proporcional ao número de arestas e não a n².
+
+    As arestas saem uma a uma, mas os n pontos e a grade de células ficam
+    em memória (O(n), bem menos que as ~grau * n / 2 arestas).
+    """
+    points = random_points(n, seed, side)
+    cells = {}
+    for i, (x, y) in enumerate(points):
+        cells.setdefault((int(x // radius), int(y // radius)), []).append(i)
+
+    radius2 = radius * radius
+    # metade das células vizinhas: cada par é visitado uma vez só
+    forward = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    for (cx, cy), members in cells.items():
+        for k, i in enumerate(members):
+            xi, yi = points[i]
+            for j in members[k + 1:]:
+                d2 = (xi - points[j][0]) ** 2 + (yi - points[j][1]) ** 2
+                if d2 <= radius2:
+                    yield i, j, round(math.sqrt(d2), 4)
+            for dx, dy in forward:
+                for j in cells.get((cx + dx, cy + dy), ()):
+                    d2 = (xi - points[j][0]) ** 2 + (yi - points[j][1]) ** 2
+                    if d2 <= radius2:
+                        yield i, j, round(math.sqrt(d2), 4)
+
+
+def scale_free_edges(n, attach=4, seed=0, max_weight=1000):
+    """
+    Rede livre de escala (Barabási-Albert)
+
+    Cada vértice novo se liga a `attach` vértices escolhidos com
+    probabilidade proporcional ao grau. A lista de pontas usada no sorteio
+    fica num array compacto de inteiros (2 * E posições).
+    """
+    rng = random.Random(seed)
+    ends = array("i")
+
+    # núcleo inicial: caminho entre os primeiros attach + 1 vértices
+    for v in range(1, min(attach + 1, n)):
+        ends.extend((v - 1, v))
+        yield v - 1, v, rng.randint(1, max_weight)
+
+    for v in range(attach + 1, n):
+        targets = set()
+        while len(targets) < attach:
+            targets.add(ends[rng.randrange(len(ends))])
+        for t in sorted(targets):
+            ends.extend((v, t))
+            yield v, t, rng.randint(1, max_weight)
+
+
+def district_edges(districts, rows, cols, seed=0, block=100, jitter=0.3):
+    """Vários bairros em malha, numerados em sequência e sem ligação entre si"""
+    size = rows * cols
+    for d in range(districts):
+        offset = d * size
+        for u, v, w in grid_edges(rows, cols, seed + d, block, jitter):
+            yield u + offset, v + offset, w
+
+
+def chain_edges(n, seed=0):
+    """
+    Caminho 0 - 1 - ... - (n-1) com pesos crescentes a partir da ponta final
+
+    O Kruskal une (n-2, n-1), depois (n-3, n-2) e assim por diante: sem
+    união por tamanho, a árvore do Union-Find vira uma lista de n nós. A
+    semente só embaralha a ordem em que as arestas aparecem no arquivo,
+    por uma permutação gerada sob demanda (_permutation), em memória O(1).
+    """
+    for i in _permutation(n - 1, seed):
+        yield i, i + 1, n - 1 - i
+
+
+def _permutation(m, seed=0):
+    """
+    Permutação pseudoaleatória de range(m), sem guardar os índices
+
+    Um LCG x -> (a x + c) mod 2^k com c ímpar e a ≡ 1 (mod 4) percorre
+    todos os valores de 0..2^k-1 antes de repetir (Hull-Dobell); cada um
+    ainda passa por uma bijeção sorteada (xor e multiplicação por ímpar)
+    para que sementes diferentes não deem o mesmo ciclo deslocado. Com 2^k
+    a menor potência de 2 >= m, os valores >= m são pulados (no máximo
+    metade deles), então cada índice sai em O(1) amortizado.
+    """
+    if m <= 0:
+        return
+    rng = random.Random(seed)
+    modulus = 1 << max(2, (m - 1).bit_length())
+    mask = modulus - 1
+
+    a = rng.randrange(modulus >> 2) << 2 | 1
+    c = rng.randrange(modulus) | 1
+    scramble, odd = rng.randrange(modulus), rng.randrange(modulus) | 1
+    x = rng.randrange(modulus)
+
+    for _ in range(modulus):
+        x = (a * x + c) & mask
+        y = ((x ^ scramble) * odd) & mask
+        if y < m:
+            yield y
+
+
+def random_edges(vertices, edges, seed=0, max_weight=1000):
+    """Árvore aleatória (garante conexidade) mais arestas entre pares sorteados"""
+    rng = random.Random(seed)
+
+    for v in range(1, vertices):
+        yield rng.randrange(v), v, rng.randint(1, max_weight)
+
+    for _ in range(max(0, edges - (vertices - 1))):
+        yield rng.randrange(vertices), rng.randrange(vertices), rng.randint(1, max_weight)
+
+
+def _grid_for(edges, seed):
+    side = max(2, round(math.sqrt(edges / 2)))
+    return grid_edges(side, side, seed)
+
+
+def _geometric_for(edges, seed, degree=8):
+    # E ≈ π r² n² / (2 A): com grau médio fixo, n = 2E / grau
+    n = max(2, 2 * edges // degree)
+    side = 10.0
+    radius = side * math.sqrt(degree / (math.pi * n))
+    return geometric_edges(n, radius, seed, side)
+
+
+def _scale_free_for(edges, seed, attach=4):
+    return scale_free_edges(max(attach + 2, edges // attach), attach, seed)
+
+
+def _districts_for(edges, seed, districts=8):
+    side = max(2, round(math.sqrt(edges / (2 * districts))))
+    return district_edges(districts, side, side, seed)
+
+
+def _chain_for(edges, seed):
+    return chain_edges(edges + 1, seed)
+
+
+def _random_for(edges, seed, density=4):
+    return random_edges(max(2, edges // density), edges, seed)
+
+
+# tipo -> função (arestas_alvo, semente) que gera aproximadamente esse número de arestas
+GENERATORS = {
+    "grid": _grid_for,
+    "geometric": _geometric_for,
+    "scale_free": _scale_free_for,
+    "districts": _districts_for,
+    "chain": _chain_for,
+    "random": _random_for,
+}
+
+
+def generate_edges(kind, edges, seed=0):
+    """Arestas de um gerador de GENERATORS com cerca de `edges` arestas"""
+    if kind not in GENERATORS:
+        raise ValueError(f"gerador desconhecido: {kind!r} (use {', '.join(GENERATORS)})")
+    return GENERATORS[kind](edges, seed)
+
+
+def build_graph(kind, edges, seed=0, compact=False):
+    """Monta o grafo gerado direto em memória (Graph ou CompactGraph)"""
+    from graph.graph import Graph
+    from graph.compact_graph import CompactGraph
+
+    graph = CompactGraph() if compact else Graph()
+    for u, v, w in generate_edges(kind, edges, seed):
+        graph.add_edge(u, v, w)
+    return graph
+
+
+def write_edges(edges, path, format=None):
+    """
+    Grava as arestas em disco à medida que são geradas
+
+    Args:
+        edges: iterável de (u, v, peso)
+        path: arquivo de destino
+        format: "json", "ndjson" ou "csv" (padrão: pela extensão, como no loader)
+
+    Returns:
+        int: número de arestas gravadas
+    """
+    from utils.loader import FORMATS, _detect_format
+
+    format = format or _detect_format(path)
+    if format not in FORMATS:
+        raise ValueError(f"formato desconhecido: {format!r} (use {', '.join(FORMATS)})")
+
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+
+        if format == "csv":
+            f.write("u,v,weight\n")
+            for u, v, w in edges:
+                f.write(f"{u},{v},{w}\n")
+                count += 1
+            return count
+
+        if format == "ndjson":
+            for u, v, w in edges:
+                f.write(_row(u, v, w) + "\n")
+                count += 1
+            return count
+
+        f.write("[")
+        for u, v, w in edges:
+            f.write(",\n" if count else "\n")
+            f.write(_row(u, v, w))
+            count += 1
+        f.write("\n]\n")
+
+    return count
+
+
+def _row(u, v, w):
+    if type(u) is int and type(v) is int and type(w) in (int, float):
+        return f"[{u}, {v}, {w!r}]"
+    return json.dumps([u, v, w], ensure_ascii=False)
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Gera redes urbanas sintéticas")
+    parser.add_argument("kind", choices=list(GENERATORS))
+    parser.add_argument("--edges", type=int, default=10_000, help="número aproximado de arestas")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True, help="arquivo .json, .ndjson/.jsonl ou .csv")
+    parser.add_argument("--format", choices=["json", "ndjson", "csv"])
+    args = parser.parse_args(argv)
+
+    count = write_edges(generate_edges(args.kind, args.edges, args.seed), args.output, args.format)
+    print(f"{count} arestas gravadas em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
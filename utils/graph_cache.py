@@ -0,0 +1,255 @@
+"""
+Cache binário de grafos ao lado do arquivo de origem
+
+O arquivo `<origem>.mstcache` guarda a tabela de vértices internados, as
+colunas u/v/peso empacotadas e a adjacência CSR. Nas execuções seguintes
+ele é mapeado em memória (mmap) e o grafo fica disponível quase em tempo
+constante, sem parse de JSON nem laço de add_edge.
+
+O cache é invalidado quando o tamanho, o mtime ou o hash (sha256) do
+arquivo de origem mudam, ou quando o arquivo é lido com outro formato.
+
+O mmap pertence ao grafo devolvido por map_graph: graph.close() o fecha
+na hora; sem isso ele é liberado quando o grafo e todas as visões sobre
+as colunas (inclusive arrays de columns()) deixam de existir.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+
+from graph.compact_graph import CompactGraph
+
+MAGIC = b"MSTCACHE"
+VERSION = 2
+SUFFIX = ".mstcache"
+
+# magic, versão, tamanho, mtime_ns, sha256, V, E, tipo do peso, tipo dos nomes, formato, bytes dos nomes
+HEADER = struct.Struct("<8sIQq32sQQcBB5xQ")
+
+NAMES_UTF8 = 0 # todos os nomes são str
+NAMES_JSON = 1 # nomes de outros tipos (ex.: inteiros, tuplas) guardados como JSON
+
+
+def cache_path_for(path):
+    return path + SUFFIX
+
+
+def load_cached_graph(path, cache_path=None, verify_hash=False, format=None, chunk_size=None):
+    """
+    Carrega o grafo pelo cache binário, (re)criando-o quando necessário
+
+    Args:
+        path: arquivo de arestas de origem
+        cache_path: onde fica o cache (padrão: path + ".mstcache")
+        verify_hash: confere o sha256 da origem mesmo com tamanho e mtime iguais
+        format, chunk_size: repassados a load_graph ao (re)criar o cache
+
+    Returns:
+        CompactGraph: mapeado em memória quando o cache é válido (ver
+        map_graph sobre quem fecha o mmap)
+    """
+    from utils.loader import CHUNK_SIZE, _detect_format, load_graph
+
+    format = format or _detect_format(path)
+    cache_path = cache_path or cache_path_for(path)
+    stat = os.stat(path)
+    header = _read_header(cache_path)
+
+    if header is not None and _is_fresh(path, cache_path, header, stat, verify_hash, format):
+        return map_graph(cache_path)
+
+    graph = load_graph(path, compact=True, format=format, chunk_size=chunk_size or CHUNK_SIZE)
+    write_cache(graph, cache_path, stat, file_hash(path), format)
+    return graph
+
+
+def write_cache(graph, cache_path, stat, digest, format="json"):
+    """
+    Grava o grafo compacto no formato do cache (escrita atômica)
+
+    `format` é o formato em que a origem foi lida; carregar com outro
+    formato invalida o cache.
+
+    Nomes que não sejam str passam por JSON; listas voltam como tuplas.
+    Nomes que não sobrevivem a essa ida e volta (ex.: frozenset, objetos)
+    geram ValueError e o cache não é gravado.
+    """
+    names = list(graph.names)
+    kind = NAMES_UTF8 if all(isinstance(name, str) for name in names) else NAMES_JSON
+    encoded = [_encode_name(name, kind) for name in names]
+
+    name_offsets = array("q", [0])
+    for raw in encoded:
+        name_offsets.append(name_offsets[-1] + len(raw))
+    blob = b"".join(encoded)
+
+    offsets, neighbors, edge_ids = graph.csr()
+    weight = graph.weight
+    typecode = b"d" if _is_float(weight) else b"q"
+
+    from utils.loader import FORMATS
+
+    header = HEADER.pack(
+        MAGIC, VERSION, stat.st_size, stat.st_mtime_ns, digest,
+        len(names), len(graph.u), typecode, kind, FORMATS.index(format), len(blob),
+    )
+
+    sections = [
+        name_offsets, blob,
+        array("i", graph.u), array("i", graph.v), array(typecode.decode(), weight),
+        array("q", offsets), array("i", neighbors), array("i", edge_ids),
+    ]
+
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for section in sections:
+            data = section if isinstance(section, bytes) else section.tobytes()
+            f.write(data)
+            f.write(bytes(-len(data) % 8)) #cada seção começa alinhada em 8 bytes
+    os.replace(tmp_path, cache_path)
+
+
+def map_graph(cache_path):
+    """
+    Abre o cache com mmap; as colunas são visões diretas sobre o arquivo
+
+    O grafo devolvido é o dono do mmap: graph.close() libera o arquivo (e
+    o grafo fica vazio); sem close(), ele é liberado quando o grafo e as
+    visões sobre as colunas somem.
+    """
+    with open(cache_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapped)
+    fields = HEADER.unpack_from(buffer)
+    n, m, typecode, kind, blob_size = fields[5], fields[6], fields[7].decode(), fields[8], fields[10]
+
+    cursor = HEADER.size
+
+    def take(size, fmt=None):
+        nonlocal cursor
+        view = buffer[cursor:cursor + size]
+        cursor += size + (-size % 8)
+        return view.cast(fmt) if fmt else view
+
+    name_offsets = take(8 * (n + 1), "q")
+    blob = take(blob_size)
+    u = take(4 * m, "i")
+    v = take(4 * m, "i")
+    weight = take(8 * m, typecode)
+    csr = (take(8 * (n + 1), "q"), take(4 * 2 * m, "i"), take(4 * 2 * m, "i"))
+
+    names = _NameTable(name_offsets, blob, kind)
+    return CompactGraph.from_columns(names, u, v, weight, csr, mapping=mapped)
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.digest()
+
+
+def _read_header(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            raw = f.read(HEADER.size)
+    except FileNotFoundError:
+        return None
+
+    if len(raw) < HEADER.size:
+        return None
+
+    header = HEADER.unpack(raw)
+    if header[0] != MAGIC or header[1] != VERSION:
+        return None
+    return header
+
+
+def _is_fresh(path, cache_path, header, stat, verify_hash, format):
+    from utils.loader import FORMATS
+
+    size, mtime_ns, digest = header[2], header[3], header[4]
+
+    if size != stat.st_size or header[9] != FORMATS.index(format): #mesmo arquivo lido com outro formato
+        return False
+
+    if mtime_ns == stat.st_mtime_ns and not verify_hash:
+        return True
+
+    # mtime mudou (ex.: checkout/cópia) ou verificação explícita: decide pelo conteúdo
+    if file_hash(path) != digest:
+        return False
+
+    if mtime_ns != stat.st_mtime_ns: #conteúdo igual: só atualiza o mtime guardado
+        with open(cache_path, "r+b") as f:
+            f.write(HEADER.pack(*header[:3], stat.st_mtime_ns, *header[4:]))
+
+    return True
+
+
+def _encode_name(name, kind):
+    if kind == NAMES_UTF8:
+        return name.encode("utf-8")
+    try:
+        raw = json.dumps(name).encode("utf-8")
+    except TypeError:
+        raw = None
+    if raw is None or not _same_name(_decode_name(raw), name):
+        raise ValueError(f"o nome de vértice {name!r} não pode ser guardado no cache")
+    return raw
+
+
+def _decode_name(raw):
+    return hashable_name(json.loads(raw))
+
+
+def hashable_name(value):
+    """
+    Nome de vértice lido de JSON: listas voltam a ser tuplas (nomes precisam
+    ser hasheáveis). Usado também pelo cache de layouts (visualize.get_layout).
+    """
+    if isinstance(value, list):
+        return tuple(hashable_name(item) for item in value)
+    return value
+
+
+def _same_name(decoded, name):
+    if type(decoded) is not type(name):
+        return False
+    if isinstance(name, tuple):
+        return len(decoded) == len(name) and all(map(_same_name, decoded, name))
+    return decoded == name
+
+
+def _is_float(column):
+    typecode = getattr(column, "typecode", None) or getattr(column, "format", None)
+    return typecode == "d"
+
+
+class _NameTable(Sequence):
+    """Tabela id -> nome decodificada sob demanda a partir do mmap"""
+
+    def __init__(self, offsets, blob, kind):
+        self._offsets = offsets
+        self._blob = blob
+        self._kind = kind
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        raw = bytes(self._blob[self._offsets[i]:self._offsets[i + 1]])
+        if self._kind == NAMES_UTF8:
+            return raw.decode("utf-8")
+        return _decode_name(raw)
+
+    def __len__(self):
+        return len(self._offsets) - 1
@@ -1,8 +1,22 @@
 import json
 from graph.graph import Graph
+from graph.compact_graph import CompactGraph
 
 
-def load_graph(path):
+# caracteres lidos por vez; a memória de leitura fica limitada a isso (mais uma aresta cortada entre blocos)
+CHUNK_SIZE = 1 << 16
+
+# erro de JSON a até essa distância do fim do buffer pode ser só aresta cortada ("tru", "1e", "\\u00")
+CUT_MARGIN = 8
+
+# maior aresta aceita no JSON em caracteres; acima disso o arquivo é tratado como inválido
+MAX_ROW_CHARS = 1 << 20
+
+FORMATS = ("json", "ndjson", "csv")
+
+
+def load_graph(path, compact=False, format=None, max_weight=None, vertices=None,
+               chunk_size=CHUNK_SIZE, cache=False):
     """
     Carrega um grafo a partir de um arquivo JSON.
     Formato esperado:
@@ -11,13 +25,207 @@ def load_graph(path):
         ["B", "C", 2],
         ...
     ]
+
+    O arquivo é lido em blocos e cada aresta vai direto para o grafo, sem
+    montar a lista completa em memória. Também aceita NDJSON (uma aresta
+    por linha, como lista ou {"u": ..., "v": ..., "weight": ...}) e CSV
+    (u,v,peso com cabeçalho opcional); o formato vem da extensão
+    (.json, .ndjson/.jsonl, .csv) ou do parâmetro `format`.
+
+    Com compact=True devolve um `CompactGraph` (ids inteiros, colunas
+    tipadas e adjacência CSR), indicado para grafos grandes.
+
+    Args:
+        max_weight: descarta arestas mais caras que esse valor durante a leitura
+        vertices: se informado, mantém só arestas com os dois extremos no conjunto
+        chunk_size: tamanho dos blocos de leitura
+        cache: usa o cache binário `<path>.mstcache` (ver utils.graph_cache);
+            não se aplica quando há filtros. O cache guarda um CompactGraph;
+            com compact=False ele é convertido num Graph
     """
-    graph = Graph()
+    if cache and max_weight is None and vertices is None:
+        from utils.graph_cache import load_cached_graph
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        graph = load_cached_graph(path, format=format, chunk_size=chunk_size)
+        if compact:
+            return graph
+
+        converted = Graph()
+        for u, v, weight in graph.edges:
+            converted.add_edge(u, v, weight)
+        graph.close() #o Graph não aponta para o arquivo mapeado
+        return converted
+
+    graph = CompactGraph() if compact else Graph()
+
+    if vertices is not None:
+        vertices = set(vertices)
+
+    for u, v, weight in iter_edges(path, format, chunk_size):
+
+        if max_weight is not None and weight > max_weight:
+            continue
+        if vertices is not None and (u not in vertices or v not in vertices):
+            continue
 
-    for u, v, weight in data:
         graph.add_edge(u, v, weight)
 
     return graph
+
+
+def iter_edges(path, format=None, chunk_size=CHUNK_SIZE):
+    """Gera as arestas (u, v, peso) de um arquivo, lendo-o incrementalmente"""
+    format = format or _detect_format(path)
+
+    if format not in FORMATS:
+        raise ValueError(f"formato desconhecido: {format!r} (use {', '.join(FORMATS)})")
+
+    with open(path, "r", encoding="utf-8", newline="" if format == "csv" else None) as f:
+
+        if format == "json":
+            rows = _iter_json_array(f, chunk_size)
+        elif format == "ndjson":
+            rows = _iter_ndjson(f)
+        else:
+            rows = _iter_csv(f)
+
+        for u, v, weight in rows:
+            yield u, v, weight
+
+
+def _detect_format(path):
+    lowered = path.lower()
+    if lowered.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    if lowered.endswith(".csv"):
+        return "csv"
+    return "json"
+
+
+def _iter_json_array(f, chunk_size):
+    """Parser incremental de um array JSON de nível superior"""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    started = False
+
+    while True:
+
+        # pula espaços e vírgulas, lendo mais um bloco quando o buffer acaba
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos == len(buffer):
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError("JSON incompleto: o array de arestas não foi fechado")
+            buffer, pos = chunk, 0
+            continue
+
+        if not started:
+            if buffer[pos] != "[":
+                raise ValueError("o arquivo deve conter uma lista de arestas: [[u, v, peso], ...]")
+            started = True
+            pos += 1
+            continue
+
+        if buffer[pos] == "]":
+            return
+
+        try:
+            row, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            # só lê mais quando a aresta foi cortada no fim do buffer; erro no meio é JSON inválido
+            cut = e.pos >= len(buffer) - CUT_MARGIN or e.msg.startswith("Unterminated string")
+            if not cut or len(buffer) - pos > MAX_ROW_CHARS:
+                raise
+            chunk = f.read(chunk_size)
+            if not chunk: #nao e falta de dados, o JSON e invalido
+                raise
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        yield row
+        pos = end
+
+
+def _iter_ndjson(f):
+    for line in f:
+        line = line.strip()
+        if not line:
+            continue
+        row = json.loads(line)
+        if isinstance(row, dict):
+            row = (row["u"], row["v"], row["weight"])
+        yield row
+
+
+def _iter_csv(f):
+    import csv
+
+    for i, row in enumerate(csv.reader(f)):
+        if not row:
+            continue
+        u, v, weight = row
+        if i == 0 and not _is_number(weight): #cabeçalho
+            continue
+        yield u, v, _parse_number(weight)
+
+
+def _parse_number(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def load_points(path):
+    """
+    Carrega coordenadas de bairros (centroides) de um arquivo JSON ou CSV.
+    Formatos aceitos:
+    {"Centro": [x, y], "Bairro A": [x, y], ...}
+    [["Centro", x, y], ["Bairro A", x, y], ...]
+    CSV com as colunas nome,x,y (cabeçalho opcional)
+
+    Returns:
+        dict: {nome: (x, y)}
+    """
+    if path.endswith(".csv"):
+        import csv
+
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows = [row for row in csv.reader(f) if row]
+
+        if rows and not _is_number(rows[0][1]): #cabeçalho
+            rows = rows[1:]
+
+        return {name: (float(x), float(y)) for name, x, y in rows}
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        return {name: (x, y) for name, (x, y) in data.items()}
+
+    return {name: (x, y) for name, x, y in data}
+
+
+def load_point_graph(path, geographic=False):
+    """
+    Carrega pontos e devolve apenas o grafo esparso de candidatas
+    (triangulação de Delaunay), que contém a MST euclidiana, em vez do
+    grafo completo com O(n²) arestas.
+
+    Com geographic=True as coordenadas são (lat, lon) e os pesos ficam em km.
+    """
+    from algorithms.euclidean import candidate_graph
+
+    return candidate_graph(load_points(path), geographic)
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
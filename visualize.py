@@ -1,8 +1,29 @@
 import matplotlib.pyplot as plt
 import networkx as nx
-from matplotlib.animation import PillowWriter
 import os
 
+# Esquema de cores (ver README)
+EDGE_COLOR = '#CCCCCC'
+MST_COLOR = '#2ECC71'
+CURRENT_COLOR = '#F39C12'
+VISITED_COLOR = '#3498DB'
+UNVISITED_COLOR = '#ECF0F1'
+NODE_BORDER = '#2C3E50'
+
+# Layouts em cache, por hash do grafo; mudar a versão invalida os antigos
+LAYOUT_CACHE_DIR = os.path.join("results", ".layouts")
+LAYOUT_VERSION = "spring-k2-i50-seed42/pivot-mds-50"
+# acima disso spring_layout (O(V²) por iteração) fica lento demais
+LARGE_LAYOUT_NODES = 2000
+
+# abaixo disso o custo de subir o pool supera o ganho do paralelismo
+PARALLEL_MIN_FRAMES = 200
+
+# acima disso o PNG estático usa o modo de detalhe reduzido
+LARGE_GRAPH_NODES = 200
+# acima disso os pesos das arestas não são desenhados
+EDGE_LABEL_LIMIT = 500
+
 def create_networkx_graph(graph):
     """Converte o grafo customizado para NetworkX"""
     G = nx.Graph()
@@ -10,9 +31,123 @@ def create_networkx_graph(graph):
         G.add_edge(u, v, weight=weight)
     return G
 
-def get_layout(G):
-    """Gera layout consistente para o grafo"""
-    return nx.spring_layout(G, seed=42, k=2, iterations=50)
+def get_layout(G, graph=None, cache_dir=LAYOUT_CACHE_DIR):
+    """
+    Layout do grafo, calculado uma vez e reaproveitado entre as saídas
+
+    - Coordenadas reais (atributo `positions`, ex.: load_point_graph) são
+      usadas diretamente
+    - O layout calculado é gravado em `cache_dir`, com nome dado pelo hash
+      dos vértices e arestas (com pesos), e relido nas chamadas seguintes
+    - Até LARGE_LAYOUT_NODES nós usa spring_layout; acima disso
+      pivot_mds_layout, linear no tamanho do grafo
+
+    Args:
+        G: grafo NetworkX
+        graph: grafo de origem, consultado para coordenadas reais
+        cache_dir: pasta do cache em disco (None desliga o cache)
+
+    Returns:
+        dict: {vertice: (x, y)}
+    """
+    import json
+    from utils.graph_cache import hashable_name
+
+    positions = getattr(graph, "positions", None)
+    if positions:
+        return {node: tuple(positions[node]) for node in G.nodes()}
+
+    path = None
+    if cache_dir:
+        path = os.path.join(cache_dir, layout_key(G) + ".json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                #listas do JSON voltam a ser tuplas (nomes de vértices hasheáveis)
+                cached = {hashable_name(node): (x, y) for node, x, y in json.load(f)}
+            if cached.keys() == set(G.nodes()): #nomes que não sobrevivem ao JSON: recalcula
+                return cached
+        except (FileNotFoundError, ValueError, TypeError):
+            pass
+
+    if len(G) > LARGE_LAYOUT_NODES:
+        pos = pivot_mds_layout(G)
+    else:
+        pos = nx.spring_layout(G, seed=42, k=2, iterations=50)
+    pos = {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
+    if path:
+        try:
+            data = json.dumps([[node, x, y] for node, (x, y) in pos.items()])
+        except TypeError: #nomes sem representação JSON ficam fora do cache
+            data = None
+        if data is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+    return pos
+
+def pivot_mds_layout(G, pivots=50, seed=42):
+    """
+    Layout por Pivot MDS (Brandes e Pich), para grafos grandes
+
+    Faz uma BFS a partir de cada um de `pivots` vértices escolhidos pelo
+    critério max-min, centraliza a matriz V x pivots de distâncias ao
+    quadrado e projeta os vértices nos seus dois primeiros vetores
+    singulares: O(pivots · (V + E)), contra O(V²) por iteração do
+    spring_layout. Sem scipy, cai no spectral_layout do NetworkX.
+    """
+    try:
+        from scipy.sparse.csgraph import shortest_path
+    except ImportError:
+        return nx.spectral_layout(G)
+    import numpy as np
+
+    nodes = list(G.nodes())
+    n = len(nodes)
+    adjacency = nx.to_scipy_sparse_array(G, nodelist=nodes, weight=None, format="csr")
+    pivots = min(pivots, n)
+
+    rng = np.random.default_rng(seed)
+    chosen = [int(rng.integers(n))]
+    distances = np.empty((pivots, n))
+    nearest = np.full(n, np.inf)
+
+    for k in range(pivots):
+        d = shortest_path(adjacency, directed=False, unweighted=True, indices=chosen[k])
+        distances[k] = d
+        nearest = np.minimum(nearest, d)
+        if k + 1 < pivots: #próximo pivô: o vértice mais longe dos já escolhidos
+            chosen.append(int(np.argmax(np.where(np.isinf(nearest), -1, nearest))))
+
+    # componentes desconexas: distância um pouco maior que a maior finita
+    finite = np.isfinite(distances)
+    distances[~finite] = distances[finite].max() * 1.5 if finite.any() else 1
+
+    squared = distances.T ** 2
+    centered = (squared - squared.mean(axis=0) - squared.mean(axis=1)[:, None] + squared.mean()) * -0.5
+    left, singular, _ = np.linalg.svd(centered, full_matrices=False)
+    xy = left[:, :2] * singular[:2]
+    if xy.shape[1] < 2:
+        xy = np.column_stack([xy, np.zeros(n)])
+
+    return {node: (x, y) for node, (x, y) in zip(nodes, xy.tolist())}
+
+def layout_key(G):
+    """Hash (sha256) dos vértices e arestas com pesos, independente da ordem"""
+    import hashlib
+
+    nodes = sorted(repr(node) for node in G.nodes())
+    edges = sorted(repr(tuple(sorted((repr(u), repr(v)))) + (w,))
+                   for u, v, w in G.edges(data="weight"))
+
+    digest = hashlib.sha256(LAYOUT_VERSION.encode())
+    for item in nodes + ["--"] + edges:
+        digest.update(item.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
 
 def draw_graph_state(G, pos, edges_in_mst, current_edge=None, visited_nodes=None, 
                      title="Grafo", step_info=""):
@@ -22,28 +157,28 @@ def draw_graph_state(G, pos, edges_in_mst, current_edge=None, visited_nodes=None
     fig.set_size_inches(12, 8)
     
     # Desenhar todas as arestas em cinza claro
-    nx.draw_networkx_edges(G, pos, edge_color='#CCCCCC', width=2, alpha=0.3)
+    nx.draw_networkx_edges(G, pos, edge_color=EDGE_COLOR, width=2, alpha=0.3)
     
     # Desenhar arestas já na MST em verde
     if edges_in_mst:
         nx.draw_networkx_edges(G, pos, edgelist=edges_in_mst, 
-                              edge_color='#2ECC71', width=4)
+                              edge_color=MST_COLOR, width=4)
     
     # Destacar aresta sendo considerada em amarelo
     if current_edge:
         nx.draw_networkx_edges(G, pos, edgelist=[current_edge], 
-                              edge_color='#F39C12', width=4, style='dashed')
+                              edge_color=CURRENT_COLOR, width=4, style='dashed')
     
     # Desenhar nós
     node_colors = []
     for node in G.nodes():
         if visited_nodes and node in visited_nodes:
-            node_colors.append('#3498DB')  # Azul para visitados
+            node_colors.append(VISITED_COLOR)  # Azul para visitados
         else:
-            node_colors.append('#ECF0F1')  # Cinza claro para não visitados
+            node_colors.append(UNVISITED_COLOR)  # Cinza claro para não visitados
     
     nx.draw_networkx_nodes(G, pos, node_color=node_colors, 
-                          node_size=1500, edgecolors='#2C3E50', linewidths=3)
+                          node_size=1500, edgecolors=NODE_BORDER, linewidths=3)
     
     # Labels dos nós
     nx.draw_networkx_labels(G, pos, font_size=10, font_weight='bold')
@@ -57,12 +192,24 @@ def draw_graph_state(G, pos, edges_in_mst, current_edge=None, visited_nodes=None
     plt.axis('off')
     plt.tight_layout()
 
-def visualize_original_graph(graph, filename="results/grafo_original.png"):
-    """Gera imagem do grafo original"""
-    os.makedirs("results", exist_ok=True)
+def visualize_original_graph(graph, filename="results/grafo_original.png", pos=None, detail="auto"):
+    """
+    Gera imagem do grafo original
+
+    Args:
+        detail: "full" (todos os rótulos), "lod" (visualize_large_graph) ou
+            "auto", que usa "lod" acima de LARGE_GRAPH_NODES vértices
+    """
+    if detail not in ("auto", "full", "lod"):
+        raise ValueError(f"detail deve ser 'auto', 'full' ou 'lod', não {detail!r}")
+    if detail == "lod" or (detail == "auto" and len(graph.vertices()) > LARGE_GRAPH_NODES):
+        return visualize_large_graph(graph, filename, pos)
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
     
     G = create_networkx_graph(graph)
-    pos = get_layout(G)
+    if pos is None:
+        pos = get_layout(G, graph)
     
     plt.figure(figsize=(12, 8))
     draw_graph_state(G, pos, [], title="Grafo Original - Conexões entre Bairros")
@@ -77,152 +224,568 @@ def visualize_original_graph(graph, filename="results/grafo_original.png"):
     plt.close()
     print(f"✓ Grafo original salvo em: {filename}")
 
-def visualize_prim_gif(graph, start_vertex, filename="results/prim_animation.gif"):
-    """Gera GIF animado do algoritmo de Prim"""
-    import heapq
-    
-    os.makedirs("results", exist_ok=True)
-    
-    G = create_networkx_graph(graph)
-    pos = get_layout(G)
-    
-    # Configurar writer para GIF
-    fig = plt.figure(figsize=(12, 8))
-    writer = PillowWriter(fps=1)
-    
-    # Estruturas do algoritmo
-    visited = set()
-    mst_edges = []
-    total_cost = 0
-    pq = [(0, start_vertex, None)]
-    
-    frames = []
+def visualize_large_graph(graph, filename="results/grafo_original.png", pos=None, mst=None,
+                          hubs=10, max_edge_labels=EDGE_LABEL_LIMIT, rasterize=True):
+    """
+    Mapa estático em nível de detalhe reduzido, para grafos grandes
+
+    - todas as arestas em uma única LineCollection, e a MST em outra
+    - pesos das arestas só até max_edge_labels arestas
+    - rótulos apenas no centro e nas pontas do diâmetro da MST
+      (MSTAnalyzer) e nos `hubs` vértices de maior grau
+    - com rasterize=True as camadas densas (arestas e nós) viram imagem,
+      o que mantém SVG/PDF leves
+
+    O tempo cresce linearmente com o número de arestas.
+
+    Args:
+        mst: arestas (u, v, peso) da MST (padrão: kruskal_vectorized)
+    """
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from analysis.mst_metrics import MSTAnalyzer
+
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+
+    if pos is None:
+        pos = get_layout(create_networkx_graph(graph), graph)
+    if mst is None:
+        from algorithms.kruskal import kruskal_vectorized
+        mst, _ = kruskal_vectorized(graph)
+
+    names = list(graph.vertices())
+    index = {name: i for i, name in enumerate(names)}
+    xy = np.array([pos[name] for name in names], dtype=float).reshape(-1, 2)
+
+    def segments(edges):
+        ends = np.array([(index[u], index[v]) for u, v, _ in edges], dtype=np.int64).reshape(-1, 2)
+        return np.stack([xy[ends[:, 0]], xy[ends[:, 1]]], axis=1)
+
+    figure = Figure(figsize=(12, 8), facecolor='white')
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+
+    edges = list(graph.edges)
+    ax.add_collection(LineCollection(segments(edges), colors=EDGE_COLOR, linewidths=0.5,
+                                     alpha=0.5, rasterized=rasterize))
+    ax.add_collection(LineCollection(segments(mst), colors=MST_COLOR, linewidths=1.5,
+                                     rasterized=rasterize))
+    node_size = min(1500, max(4, 40000 / max(len(names), 1)))
+    ax.scatter(xy[:, 0], xy[:, 1], s=node_size, c=UNVISITED_COLOR, edgecolors=NODE_BORDER,
+               linewidths=0.5, zorder=2, rasterized=rasterize)
+
+    if len(edges) <= max_edge_labels:
+        for u, v, w in edges:
+            (x1, y1), (x2, y2) = pos[u], pos[v]
+            ax.text((x1 + x2) / 2, (y1 + y2) / 2, str(w), fontsize=6, ha='center', va='center',
+                    bbox=dict(boxstyle='round', facecolor='white', edgecolor='none', alpha=0.7))
+
+    # Rótulos só nos vértices de referência
+    labels = {}
+    if mst:
+        analyzer = MSTAnalyzer(mst)
+        center = analyzer.calculate_center_and_radius()['center']
+        labels[center] = f"{center} (centro)"
+        for end in analyzer.calculate_diameter()['path_vertices'] or ():
+            labels.setdefault(end, f"{end} (diâmetro)")
+    degree = {name: len(graph.adj[name]) for name in names}
+    for name in sorted(names, key=degree.get, reverse=True)[:hubs]:
+        labels.setdefault(name, str(name))
+
+    for name, text in labels.items():
+        x, y = pos[name]
+        ax.annotate(text, (x, y), xytext=(4, 4), textcoords='offset points', fontsize=8,
+                    fontweight='bold', zorder=3,
+                    bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+
+    ax.autoscale_view()
+    ax.set_aspect('equal', adjustable='datalim')
+    ax.axis('off')
+
+    total_weight = round(sum(w for _, _, w in edges), 2)
+    mst_weight = round(sum(w for _, _, w in mst), 2)
+    ax.set_title(f"Grafo Original - {len(names)} bairros, {len(edges)} arestas\n"
+                 f"Peso total: {total_weight} | MST: {mst_weight}",
+                 fontsize=14, fontweight='bold')
+
+    figure.savefig(filename, dpi=150, bbox_inches='tight', facecolor='white')
+    print(f"✓ Grafo original salvo em: {filename}")
+
+class AnimationScene:
+    """
+    Cena de animação com o grafo de fundo renderizado uma única vez
+
+    Arestas cinza, pesos, nós e rótulos são desenhados uma vez e guardados
+    como background em pixels. Cada quadro só restaura esse background e
+    desenha por cima o que muda (blitting): a aresta em destaque, os nós
+    nas pontas dela e o título. Arestas aceitas e nós visitados entram no
+    background uma única vez (commit_edge / visit), então o custo de cada
+    quadro não cresce com o tamanho do grafo.
+    """
+
+    def __init__(self, G, pos, figsize=(12, 8), dpi=100):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.collections import LineCollection
+
+        self.G = G
+        self.pos = pos
+        self.figure = Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.ax = self.figure.add_subplot()
+
+        # Fundo estático, na mesma ordem de draw_graph_state
+        nx.draw_networkx_edges(G, pos, ax=ax, edge_color=EDGE_COLOR, width=2, alpha=0.3)
+        nx.draw_networkx_nodes(G, pos, ax=ax, node_color=UNVISITED_COLOR,
+                               node_size=1500, edgecolors=NODE_BORDER, linewidths=3)
+        self.node_labels = nx.draw_networkx_labels(G, pos, ax=ax, font_size=10, font_weight='bold')
+        self.edge_labels = nx.draw_networkx_edge_labels(
+            G, pos, nx.get_edge_attributes(G, 'weight'), ax=ax, font_size=9)
+
+        # Artistas reaproveitados em todos os quadros (fora do background)
+        limits = ax.get_xlim(), ax.get_ylim()
+        self.mst_line = LineCollection([], colors=MST_COLOR, linewidths=4, animated=True)
+        self.current_line = LineCollection([], colors=CURRENT_COLOR, linewidths=4,
+                                           linestyles='dashed', animated=True)
+        ax.add_collection(self.mst_line, autolim=False)
+        ax.add_collection(self.current_line, autolim=False)
+        self.node_overlay = ax.scatter([], [], s=1500, marker='o', edgecolors=NODE_BORDER,
+                                       linewidths=3, animated=True)
+        ax.set_xlim(*limits[0])
+        ax.set_ylim(*limits[1])
+        ax.axis('off')
+
+        # Reserva espaço para título de até três linhas antes de fixar o layout
+        self.title = ax.set_title("\n\n", fontsize=14, fontweight='bold', pad=20)
+        self.figure.tight_layout()
+        self.title.set_animated(True)
+
+        self.colors = {node: UNVISITED_COLOR for node in G.nodes()}
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+        # Posições em pixels, para achar o que uma aresta nova encobre
+        import numpy as np
+        self.nodes = list(G.nodes())
+        self.node_pixels = ax.transData.transform(np.array([pos[n] for n in self.nodes]))
+        self.label_edges = list(self.edge_labels)
+        self.label_pixels = ax.transData.transform(
+            np.array([t.get_position() for t in self.edge_labels.values()]).reshape(-1, 2))
+        self.node_radius = (1500 ** 0.5 / 2 + 3) * dpi / 72
+
+    def visit(self, nodes):
+        """Pinta nós recém-visitados no background"""
+        nodes = list(nodes)
+        self.canvas.restore_region(self.background)
+        for node in nodes:
+            self.colors[node] = VISITED_COLOR
+        self._draw_nodes(nodes)
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def commit_edge(self, edge):
+        """Incorpora ao background uma aresta aceita na MST"""
+        self.canvas.restore_region(self.background)
+        self._draw_edge(self.mst_line, edge)
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+    def frame(self, title, step_info="", current_edge=None):
+        """Quadro atual como imagem PIL (background + destaque + título)"""
+        from PIL import Image
+
+        self.canvas.restore_region(self.background)
+        if current_edge is not None:
+            self._draw_edge(self.current_line, current_edge)
+
+        self.title.set_text(f"{title}\n{step_info}")
+        self.ax.draw_artist(self.title)
+
+        width, height = self.canvas.get_width_height()
+        return Image.frombuffer("RGBA", (width, height), bytes(self.canvas.buffer_rgba()),
+                                "raw", "RGBA", 0, 1).convert("RGB")
+
+    def _draw_edge(self, line, edge):
+        # a linha fica por cima dos nós e pesos que cruza; eles são redesenhados
+        u, v = edge
+        line.set_segments([[self.pos[u], self.pos[v]]])
+        self.ax.draw_artist(line)
+
+        a, b = self.ax.transData.transform([self.pos[u], self.pos[v]])
+        covered = _near_segment(self.node_pixels, a, b, self.node_radius)
+        self._draw_nodes([self.nodes[i] for i in covered])
+
+        for i in _near_segment(self.label_pixels, a, b, 12):
+            self.ax.draw_artist(self.edge_labels[self.label_edges[i]])
+
+    def _draw_nodes(self, nodes):
+        if not nodes:
+            return
+        self.node_overlay.set_offsets([self.pos[node] for node in nodes])
+        self.node_overlay.set_facecolor([self.colors[node] for node in nodes])
+        self.ax.draw_artist(self.node_overlay)
+        for node in nodes:
+            self.ax.draw_artist(self.node_labels[node])
+
+
+def _near_segment(points, a, b, radius):
+    """Índices dos pontos (pixels) a no máximo `radius` do segmento a-b"""
+    import numpy as np
+
+    d = b - a
+    length = float(d @ d)
+    t = np.clip((points - a) @ d / length, 0, 1) if length else np.zeros(len(points))
+    closest = a + t[:, None] * d
+    return np.flatnonzero(((points - closest) ** 2).sum(axis=1) <= radius ** 2)
+
+
+def prim_steps(graph, start_vertex):
+    """
+    Passos do algoritmo de Prim como lista de operações de animação
+
+    Os passos vêm dos eventos de algorithms.prim.prim (sink), então a
+    animação mostra exatamente o que o algoritmo fez.
+
+    Operações:
+        ("visit", vertice): pinta o vértice como visitado
+        ("commit", (u, v)): aresta passa a fazer parte da MST
+        ("frame", tipo, titulo, info, aresta_em_destaque): um quadro; tipo é
+            "start", "consider", "accept", "reject" ou "final"
+
+    Returns:
+        tuple: (operacoes, mst_edges, total_cost)
+    """
+    from algorithms.prim import prim
+    from algorithms.events import EventRecorder, VERTEX_VISITED, EDGE_ACCEPTED
+
+    events = EventRecorder()
+    mst, total_cost = prim(graph, start_vertex, sink=events)
+
+    ops = []
+    cost_so_far = 0
+    step = 0
     
-    # Frame inicial
-    frames.append({
-        'mst_edges': [],
-        'current_edge': None,
-        'visited': set(),
-        'info': f"Iniciando no vértice: {start_vertex}"
-    })
-    
-    with writer.saving(fig, filename, dpi=100):
-        step = 0
+    for event in events:
+        if event.kind == VERTEX_VISITED:
+            ops.append(("visit", event.u))
         
-        while pq:
-            cost, u, parent = heapq.heappop(pq)
-            
-            if u in visited:
-                continue
-            
-            visited.add(u)
-            total_cost += cost
+        elif event.kind == EDGE_ACCEPTED:
+            parent, u, cost = event.u, event.v, event.weight
+            edge = (parent, u)
+            cost_so_far += cost
+            step += 1
             
-            current_edge = None
-            if parent:
-                edge = (parent, u) if (parent, u) in G.edges() else (u, parent)
-                mst_edges.append(edge)
-                current_edge = edge
-                step += 1
-                
-                # Frame mostrando a aresta sendo adicionada
-                draw_graph_state(G, pos, mst_edges[:-1], current_edge, visited,
-                               title="Algoritmo de Prim",
-                               step_info=f"Passo {step}: Adicionando aresta {parent} → {u} (peso: {cost})\nCusto acumulado: {total_cost}")
-                writer.grab_frame()
-                
-                # Frame com a aresta já na MST
-                draw_graph_state(G, pos, mst_edges, None, visited,
-                               title="Algoritmo de Prim",
-                               step_info=f"Passo {step}: Aresta adicionada à MST\nCusto acumulado: {total_cost}")
-                writer.grab_frame()
+            # Frame mostrando a aresta sendo adicionada
+            ops.append(("frame", "consider", "Algoritmo de Prim",
+                        f"Passo {step}: Adicionando aresta {parent} → {u} (peso: {cost})\nCusto acumulado: {cost_so_far}",
+                        edge))
             
-            # Adicionar vizinhos à fila
-            for v, weight in graph.adj[u]:
-                if v not in visited:
-                    heapq.heappush(pq, (weight, v, u))
-        
-        # Frame final
-        draw_graph_state(G, pos, mst_edges, None, visited,
-                       title="Algoritmo de Prim - CONCLUÍDO",
-                       step_info=f"MST completa com {len(mst_edges)} arestas\nCusto total: {total_cost}")
-        writer.grab_frame()
-        writer.grab_frame()  # Pausa no final
+            # Frame com a aresta já na MST
+            ops.append(("commit", edge))
+            ops.append(("frame", "accept", "Algoritmo de Prim",
+                        f"Passo {step}: Aresta adicionada à MST\nCusto acumulado: {cost_so_far}", None))
     
-    plt.close()
-    print(f"✓ Animação do Prim salva em: {filename}")
-    return mst_edges, total_cost
+    # Frame final
+    ops.append(("frame", "final", "Algoritmo de Prim - CONCLUÍDO",
+                f"MST completa com {len(mst)} arestas\nCusto total: {total_cost}", None))
+    
+    return ops, [(u, v) for u, v, _ in mst], total_cost
+
+def kruskal_steps(graph):
+    """
+    Passos do algoritmo de Kruskal como lista de operações de animação
+    (mesmo formato de prim_steps), a partir dos eventos de
+    algorithms.kruskal.kruskal
+
+    Returns:
+        tuple: (operacoes, mst_edges, total_cost)
+    """
+    from algorithms.kruskal import kruskal
+    from algorithms.events import EventRecorder, EDGE_CONSIDERED, EDGE_ACCEPTED, EDGE_REJECTED
 
-def visualize_kruskal_gif(graph, filename="results/kruskal_animation.gif"):
-    """Gera GIF animado do algoritmo de Kruskal"""
-    from algorithms.union_find import UnionFind
+    events = EventRecorder()
+    mst, total_cost = kruskal(graph, sink=events)
+
+    # Frame inicial
+    ops = [("frame", "start", "Algoritmo de Kruskal",
+            "Arestas ordenadas por peso. Iniciando verificação...", None)]
     
-    os.makedirs("results", exist_ok=True)
+    cost_so_far = 0
+    step = 0
     
-    G = create_networkx_graph(graph)
-    pos = get_layout(G)
-    
-    fig = plt.figure(figsize=(12, 8))
-    writer = PillowWriter(fps=1)
-    
-    uf = UnionFind(graph.vertices())
-    edges = sorted(graph.edges, key=lambda x: x[2])
-    mst_edges = []
-    total_cost = 0
-    
-    with writer.saving(fig, filename, dpi=100):
-        # Frame inicial
-        draw_graph_state(G, pos, [], None, set(),
-                       title="Algoritmo de Kruskal",
-                       step_info="Arestas ordenadas por peso. Iniciando verificação...")
-        writer.grab_frame()
+    for event in events:
+        u, v, w = event.u, event.v, event.weight
         
-        step = 0
-        for u, v, w in edges:
+        if event.kind == EDGE_CONSIDERED:
             step += 1
-            edge = (u, v) if (u, v) in G.edges() else (v, u)
             
             # Frame considerando a aresta
-            draw_graph_state(G, pos, mst_edges, edge, set(),
-                           title="Algoritmo de Kruskal",
-                           step_info=f"Passo {step}: Verificando aresta {u} → {v} (peso: {w})")
-            writer.grab_frame()
+            ops.append(("frame", "consider", "Algoritmo de Kruskal",
+                        f"Passo {step}: Verificando aresta {u} → {v} (peso: {w})", (u, v)))
+        
+        elif event.kind == EDGE_ACCEPTED:
+            cost_so_far += w
             
-            if uf.union(u, v):
-                mst_edges.append(edge)
-                total_cost += w
-                
-                # Frame adicionando à MST
-                draw_graph_state(G, pos, mst_edges, None, set(),
-                               title="Algoritmo de Kruskal",
-                               step_info=f"Passo {step}: ✓ Aresta aceita (não forma ciclo)\nCusto acumulado: {total_cost}")
-                writer.grab_frame()
-            else:
-                # Frame rejeitando (formaria ciclo)
-                draw_graph_state(G, pos, mst_edges, None, set(),
-                               title="Algoritmo de Kruskal",
-                               step_info=f"Passo {step}: ✗ Aresta rejeitada (formaria ciclo)\nCusto acumulado: {total_cost}")
-                writer.grab_frame()
+            # Frame adicionando à MST
+            ops.append(("commit", (u, v)))
+            ops.append(("frame", "accept", "Algoritmo de Kruskal",
+                        f"Passo {step}: ✓ Aresta aceita (não forma ciclo)\nCusto acumulado: {cost_so_far}", None))
         
-        # Frame final
-        draw_graph_state(G, pos, mst_edges, None, set(),
-                       title="Algoritmo de Kruskal - CONCLUÍDO",
-                       step_info=f"MST completa com {len(mst_edges)} arestas\nCusto total: {total_cost}")
-        writer.grab_frame()
-        writer.grab_frame()  # Pausa no final
+        elif event.kind == EDGE_REJECTED:
+            # Frame rejeitando (formaria ciclo)
+            ops.append(("frame", "reject", "Algoritmo de Kruskal",
+                        f"Passo {step}: ✗ Aresta rejeitada (formaria ciclo)\nCusto acumulado: {cost_so_far}", None))
     
-    plt.close()
+    # Frame final
+    ops.append(("frame", "final", "Algoritmo de Kruskal - CONCLUÍDO",
+                f"MST completa com {len(mst)} arestas\nCusto total: {total_cost}", None))
+    
+    return ops, [(u, v) for u, v, _ in mst], total_cost
+
+def sample_frames(ops, sample="all", every=None, max_frames=None):
+    """
+    Escolhe quais quadros da lista de operações serão renderizados
+
+    Args:
+        ops: operações de prim_steps / kruskal_steps
+        sample: "all" (todos os passos) ou "accepted" (só arestas aceitas)
+        every: mantém um a cada N quadros de passo
+        max_frames: orçamento total (pelo menos 1); os quadros restantes
+            são espaçados uniformemente
+
+    Returns:
+        list: posições, em ops, dos quadros mantidos (o primeiro e o
+        último quadro ficam sempre que o orçamento permite; com
+        max_frames=1 só o último, a árvore final)
+    """
+    if sample not in ("all", "accepted"):
+        raise ValueError(f"sample deve ser 'all' ou 'accepted', não {sample!r}")
+    if max_frames is not None and max_frames < 1:
+        raise ValueError(f"max_frames deve ser pelo menos 1, não {max_frames}")
+
+    frames = [i for i, op in enumerate(ops) if op[0] == "frame"]
+    first, last = frames[0], frames[-1]
+
+    if max_frames == 1:
+        return [last]
+
+    steps = [i for i in frames[1:-1] if sample == "all" or ops[i][1] == "accept"]
+    if every and every > 1:
+        steps = steps[every - 1::every]
+
+    if max_frames is not None and len(steps) + 2 > max_frames:
+        budget = max(max_frames - 2, 0)
+        steps = [steps[(k * len(steps)) // budget] for k in range(budget)] if budget else []
+
+    return sorted({first, last, *steps})
+
+class FrameRenderer:
+    """
+    Renderiza quadros de uma lista de operações sobre uma AnimationScene
+
+    Mantém a posição já aplicada em `ops`, então pedidos em ordem crescente
+    só aplicam as operações novas; um pedido anterior à posição atual
+    recria a cena.
+    """
+
+    def __init__(self, G, pos, ops, palette=None):
+        self.G = G
+        self.pos = pos
+        self.ops = ops
+        self.palette = palette
+        self.scene = None
+        self.cursor = 0
+
+    def render(self, positions):
+        """Quadros nas posições indicadas (crescentes) de ops"""
+        from PIL import Image
+
+        if self.scene is None or positions[0] < self.cursor:
+            self.scene = AnimationScene(self.G, self.pos)
+            self.cursor = 0
+
+        scene = self.scene
+        wanted = set(positions)
+        frames = []
+
+        for i in range(self.cursor, positions[-1] + 1):
+            op = self.ops[i]
+            if op[0] == "visit":
+                scene.visit([op[1]])
+            elif op[0] == "commit":
+                scene.commit_edge(op[1])
+            elif i in wanted:
+                _, _, title, info, current_edge = op
+                frame = scene.frame(title, info, current_edge)
+                if self.palette is not None:
+                    frame = frame.quantize(palette=self.palette, dither=Image.Dither.NONE)
+                frames.append(frame)
+
+        self.cursor = positions[-1] + 1
+        return frames
+
+# renderizador de cada processo do pool, criado pelo initializer
+_renderer = None
+
+def _init_renderer(G, pos, ops, palette):
+    global _renderer
+    _renderer = FrameRenderer(G, pos, ops, palette)
+
+def _render_chunk(positions):
+    return _renderer.render(positions)
+
+def render_frames(G, pos, ops, positions, workers=None, min_parallel_frames=PARALLEL_MIN_FRAMES):
+    """
+    Renderiza os quadros pedidos, em paralelo quando compensa
+
+    Os quadros são divididos em blocos contíguos distribuídos a um pool de
+    processos; cada processo monta a cena uma vez e avança por ela. Os
+    blocos voltam na ordem original. Todos os quadros são mapeados na mesma
+    paleta (calculada antes, sobre a cena inicial e a final) e voltam em
+    modo "P", com 1 byte por pixel.
+
+    Args:
+        workers: número de processos (padrão: os.cpu_count())
+        min_parallel_frames: abaixo disso renderiza no processo atual
+
+    Returns:
+        list: imagens PIL, uma por posição
+    """
+    palette = _scene_palette(G, pos, ops)
+    workers = workers or os.cpu_count() or 1
+
+    if workers <= 1 or len(positions) < min_parallel_frames:
+        return FrameRenderer(G, pos, ops, palette).render(positions)
+
+    from multiprocessing import Pool
+
+    size = -(-len(positions) // (workers * 4))
+    chunks = [positions[start:start + size] for start in range(0, len(positions), size)]
+
+    frames = []
+    with Pool(workers, initializer=_init_renderer, initargs=(G, pos, ops, palette)) as pool:
+        for chunk in pool.imap(_render_chunk, chunks):
+            frames.extend(chunk)
+    return frames
+
+def _scene_palette(G, pos, ops):
+    """Paleta única: cena inicial e cena final com uma aresta em destaque"""
+    from PIL import Image
+
+    scene = AnimationScene(G, pos)
+    start = scene.frame("Algoritmo", "Passo")
+    for op in ops:
+        if op[0] == "visit":
+            scene.visit([op[1]])
+        elif op[0] == "commit":
+            scene.commit_edge(op[1])
+    highlighted = next((op[4] for op in ops if op[0] == "frame" and op[4] is not None), None)
+    end = scene.frame("Algoritmo", "Passo", highlighted)
+
+    width, height = start.size
+    strip = Image.new("RGB", (width, 2 * height))
+    strip.paste(start, (0, 0))
+    strip.paste(end, (0, height))
+    return strip.quantize(255, method=Image.Quantize.FASTOCTREE)
+
+def save_gif(frames, filename, fps=1, max_bytes=None):
+    """
+    Grava os quadros, em ordem, como GIF em loop
+
+    O último quadro é repetido uma vez como pausa no final. Com max_bytes,
+    se o arquivo passar do limite, metade dos quadros intermediários é
+    descartada (primeiro e último ficam) até caber.
+
+    Returns:
+        int: número de quadros gravados
+    """
+    from io import BytesIO
+    from PIL import Image
+
+    if frames[0].mode != "P":
+        palette = frames[0].quantize(255, method=Image.Quantize.FASTOCTREE)
+        frames = [frame.quantize(palette=palette, dither=Image.Dither.NONE) for frame in frames]
+
+    while True:
+        buffer = BytesIO()
+        sequence = frames + [frames[-1]]  # Pausa no final
+        sequence[0].save(buffer, format="GIF", save_all=True, append_images=sequence[1:],
+                         duration=int(1000 / fps), loop=0, optimize=False)
+
+        if max_bytes is None or buffer.tell() <= max_bytes or len(frames) <= 2:
+            break
+        frames = frames[:-1:2] + [frames[-1]]
+
+    with open(filename, "wb") as f:
+        f.write(buffer.getvalue())
+    return len(frames)
+
+def animate(graph, ops, filename, pos=None, sample="all", every=None, max_frames=None,
+            max_bytes=None, workers=None, fps=1):
+    """
+    Pipeline de animação: amostragem, renderização (paralela) e GIF
+
+    Args:
+        graph: grafo de origem
+        ops: operações de prim_steps / kruskal_steps
+        filename: GIF de saída
+        pos: layout já calculado (padrão: get_layout)
+        sample, every, max_frames: política de amostragem (ver sample_frames)
+        max_bytes: tamanho máximo do GIF
+        workers: processos para renderizar (ver render_frames)
+
+    Returns:
+        int: número de quadros gravados
+    """
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+
+    G = create_networkx_graph(graph)
+    if pos is None:
+        pos = get_layout(G, graph)
+
+    positions = sample_frames(ops, sample, every, max_frames)
+    frames = render_frames(G, pos, ops, positions, workers)
+    return save_gif(frames, filename, fps, max_bytes)
+
+def visualize_prim_gif(graph, start_vertex, filename="results/prim_animation.gif", pos=None, **options):
+    """
+    Gera GIF animado do algoritmo de Prim
+
+    `options` são repassadas a animate (sample, every, max_frames,
+    max_bytes, workers, fps).
+    """
+    ops, mst_edges, total_cost = prim_steps(graph, start_vertex)
+    animate(graph, ops, filename, pos, **options)
+    print(f"✓ Animação do Prim salva em: {filename}")
+    return mst_edges, total_cost
+
+def visualize_kruskal_gif(graph, filename="results/kruskal_animation.gif", pos=None, **options):
+    """
+    Gera GIF animado do algoritmo de Kruskal
+
+    `options` são repassadas a animate (sample, every, max_frames,
+    max_bytes, workers, fps).
+    """
+    ops, mst_edges, total_cost = kruskal_steps(graph)
+    animate(graph, ops, filename, pos, **options)
     print(f"✓ Animação do Kruskal salva em: {filename}")
     return mst_edges, total_cost
 
-def generate_all_visualizations(graph, start_vertex=None):
-    """Gera todas as visualizações de uma vez"""
+def generate_all_visualizations(graph, start_vertex=None, output_dir="results", **options):
+    """
+    Gera todas as visualizações de uma vez, em `output_dir`
+
+    O layout é calculado (ou lido do cache) uma única vez e compartilhado
+    pelas três saídas; `options` vão para as duas animações (ver animate).
+    """
     print("\n" + "="*50)
     print("GERANDO VISUALIZAÇÕES")
     print("="*50 + "\n")
     
+    pos = get_layout(create_networkx_graph(graph), graph)
+    
     # Grafo original
-    visualize_original_graph(graph)
+    visualize_original_graph(graph, os.path.join(output_dir, "grafo_original.png"), pos=pos)
     
     # Determinar vértice inicial se não fornecido
     if start_vertex is None:
@@ -230,16 +793,18 @@ def generate_all_visualizations(graph, start_vertex=None):
     
     # Animação Prim
     print("\nGerando animação do Prim...")
-    mst_prim, cost_prim = visualize_prim_gif(graph, start_vertex)
+    mst_prim, cost_prim = visualize_prim_gif(graph, start_vertex, os.path.join(output_dir, "prim_animation.gif"),
+                                             pos=pos, **options)
     
     # Animação Kruskal
     print("\nGerando animação do Kruskal...")
-    mst_kruskal, cost_kruskal = visualize_kruskal_gif(graph)
+    mst_kruskal, cost_kruskal = visualize_kruskal_gif(graph, os.path.join(output_dir, "kruskal_animation.gif"),
+                                                      pos=pos, **options)
     
     print("\n" + "="*50)
     print("VISUALIZAÇÕES CONCLUÍDAS")
     print("="*50)
-    print(f"\nArquivos salvos em: ./results/")
+    print(f"\nArquivos salvos em: {output_dir}/")
     print(f"  - grafo_original.png")
     print(f"  - prim_animation.gif")
     print(f"  - kruskal_animation.gif")